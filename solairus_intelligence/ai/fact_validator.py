@@ -5,12 +5,32 @@ Detects hallucinations and unsupported claims in AI-generated content
 
 import logging
 import re
-from typing import Any, Dict, List, Set, Tuple
+from typing import Any, Dict, List, Pattern, Set, Tuple
 
 from solairus_intelligence.core.processor import IntelligenceItem
 
 logger = logging.getLogger(__name__)
 
+# Prohibited patterns indicating fabrication, compiled once at import
+_PROHIBITED_PATTERNS: Tuple[Tuple[Pattern[str], str], ...] = tuple(
+    (re.compile(pattern, re.IGNORECASE), violation_type)
+    for pattern, violation_type in (
+        (
+            r"I believe|I think|In my opinion|From my perspective",
+            "First-person language detected",
+        ),
+        (r"Based on my analysis of|My assessment shows", "Personal assessment language"),
+        (
+            r"According to sources not provided|External research indicates",
+            "Reference to unavailable sources",
+        ),
+        (
+            r"It is unclear|Information not available|Data missing",
+            "Acknowledgment of missing data (acceptable)",
+        ),
+    )
+)
+
 
 class FactValidator:
     """
@@ -18,33 +38,23 @@ class FactValidator:
     Detects potential hallucinations and fabricated data
     """
 
-    def __init__(self):
-        self.factual_patterns = self._build_factual_patterns()
-
-    def _build_factual_patterns(self) -> dict:
-        """
-        Build regex patterns for extracting factual claims
-
-        Returns:
-            Dictionary of pattern types and their regexes
-        """
-        return {
-            "percentages": re.compile(r"\d+(\.\d+)?%"),
-            "dollar_amounts": re.compile(
-                r"\$\d+(\.\d+)?\s*(billion|million|trillion)?", re.IGNORECASE
-            ),
-            "dates": re.compile(
-                r"\b(January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{1,2},?\s+\d{4}\b|\b\d{1,2}/\d{1,2}/\d{2,4}\b|\bQ[1-4]\s+\d{4}\b"
-            ),
-            "numbers": re.compile(r"\b\d{1,3}(,\d{3})*(\.\d+)?\b"),
-            "specific_countries": re.compile(
-                r"\b(United States|China|Russia|EU|European Union|Japan|India|Saudi Arabia|Iran|Israel)\b",
-                re.IGNORECASE,
-            ),
-            "specific_companies": re.compile(
-                r"\b[A-Z][a-z]+\s+(Technologies|Corporation|Inc\.|Ltd\.|Capital|Group|Partners)\b"
-            ),
-        }
+    # Regex patterns for extracting factual claims, keyed by claim type.
+    # Compiled once for the class rather than per validator instance.
+    factual_patterns: Dict[str, Pattern[str]] = {
+        "percentages": re.compile(r"\d+(\.\d+)?%"),
+        "dollar_amounts": re.compile(r"\$\d+(\.\d+)?\s*(billion|million|trillion)?", re.IGNORECASE),
+        "dates": re.compile(
+            r"\b(January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{1,2},?\s+\d{4}\b|\b\d{1,2}/\d{1,2}/\d{2,4}\b|\bQ[1-4]\s+\d{4}\b"
+        ),
+        "numbers": re.compile(r"\b\d{1,3}(,\d{3})*(\.\d+)?\b"),
+        "specific_countries": re.compile(
+            r"\b(United States|China|Russia|EU|European Union|Japan|India|Saudi Arabia|Iran|Israel)\b",
+            re.IGNORECASE,
+        ),
+        "specific_companies": re.compile(
+            r"\b[A-Z][a-z]+\s+(Technologies|Corporation|Inc\.|Ltd\.|Capital|Group|Partners)\b"
+        ),
+    }
 
     def extract_factual_claims(self, text: str) -> Set[str]:
         """
@@ -205,29 +215,8 @@ class FactValidator:
         """
         violations = []
 
-        # Prohibited patterns indicating fabrication
-        prohibited_patterns = [
-            (
-                r"I believe|I think|In my opinion|From my perspective",
-                "First-person language detected",
-            ),
-            (r"Based on my analysis of|My assessment shows", "Personal assessment language"),
-            (
-                r"According to sources not provided|External research indicates",
-                "Reference to unavailable sources",
-            ),
-            (
-                r"It is unclear|Information not available|Data missing",
-                "Acknowledgment of missing data (acceptable)",
-            ),
-        ]
-
-        for pattern, violation_type in prohibited_patterns:
-            if re.search(pattern, text, re.IGNORECASE):
-                # Exception: "Information not available" is actually good (honest)
-                if "Information not available" in violation_type:
-                    continue
-
+        for pattern, violation_type in _PROHIBITED_PATTERNS:
+            if pattern.search(text):
                 violations.append(violation_type)
                 logger.warning(f"Prohibited content detected: {violation_type}")
 
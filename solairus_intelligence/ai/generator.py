@@ -5,20 +5,253 @@ with security, validation, and graceful degradation
 """
 
 import asyncio
+import hashlib
+import heapq
+import io
 import logging
 import os
+import random
+import re
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from pydantic import BaseModel, ValidationError
 
 from solairus_intelligence.ai.fact_validator import FactValidator
 from solairus_intelligence.ai.pii_sanitizer import PIISanitizer
 from solairus_intelligence.config.report_style import REPORT_STYLE_SYSTEM_MESSAGE
 from solairus_intelligence.core.processor import IntelligenceItem
+from solairus_intelligence.utils.cache import PromptCache, get_prompt_cache
+from solairus_intelligence.utils.retry import CircuitBreaker
 
 logger = logging.getLogger(__name__)
 
+_MISSING = object()
+
+# Static executive summary prompt; only the intelligence block varies per call.
+# The style message is brace-escaped so it is emitted verbatim by str.format.
+_EXECUTIVE_SUMMARY_PROMPT_TEMPLATE = (
+    REPORT_STYLE_SYSTEM_MESSAGE.replace("{", "{{").replace("}", "}}") + """
+
+You are writing the Executive Summary for a monthly intelligence report for Solairus Aviation, a business aviation operator serving high-net-worth clients in technology, finance, real estate, and entertainment sectors.
+
+INTELLIGENCE ITEMS (Top 20 by relevance):
+{intelligence_block}
+
+TASK: Generate an Executive Summary with these three sections:
+
+1. BOTTOM LINE: A SINGLE UNIFIED PARAGRAPH (not bullet points)
+   - Lead with bold assessment ending at natural break: **Ergo assesses that X,** followed by synthesis
+   - Synthesize ALL major regional themes (Asia, Middle East, Europe) into ONE cohesive paragraph
+   - CRITICAL: Only include topics that will have corresponding Key Findings sections
+   - Do NOT include tangential topics like export controls unless directly aviation-relevant
+
+2. KEY FINDINGS (3-5 sections): Each finding needs proper structure
+   - SUBHEADER: Title Case theme title (e.g., **Taiwan Strait Escalation Risk**)
+   - LEAD SENTENCE: Bold the core assessment WITHOUT "Ergo assesses that" prefix
+   - TRANSITION: Include "Ergo assesses X implications for Solairus:" before bullets
+   - BULLETS: Use dash format with bold lead phrase + period:
+     -   **Route disruption.** Description of impact...
+
+3. WATCH FACTORS (at least 3 items): Forward-looking indicators
+   - INDICATOR: Short name with units where applicable
+   - WHAT TO WATCH: Specific metric or event
+   - WHY IT MATTERS: Aviation operational impact
+
+RISK CALIBRATION (CRITICAL):
+- Lead with MOST PROBABLE trajectory, not worst case
+- Explicitly flag unlikely scenarios: "While unlikely...", "In the unlikely event..."
+- Use conditional framing for tail risks: "would result in" not "requires preparation for"
+- Reserve "prepare for" and "require" language for LIKELY scenarios only
+- Do NOT present worst-case scenarios as baseline planning assumptions
+
+STRICT RULES:
+- Only use facts from the intelligence items provided above
+- Do not invent data, predictions, dates, or percentages not in source items
+- Remove internal scenario names ("Strait Jacket", "Tinderboxed", etc.)
+- Remove probability percentages like "(55% probability as of...)"
+- Use periods within bullets, not semicolons
+- Vary sentence structure - don't start every sentence with "Ergo assesses"
+
+FORMAT YOUR RESPONSE as a single JSON object (no code fences, no text before or after) matching:
+
+{{
+  "bottom_line": "**Bold lead assessment ending at comma or period,** followed by synthesized paragraph covering all themes that will appear in Key Findings below.",
+  "key_findings": [
+    {{
+      "subheader": "Theme Title In Title Case",
+      "content": "**Bold lead assessment without 'Ergo assesses that' prefix.** Supporting analysis with evidence. Ergo assesses X implications for Solairus:",
+      "bullets": [
+        "**Lead phrase.** Supporting detail with periods not semicolons.",
+        "**Lead phrase.** Supporting detail."
+      ]
+    }}
+  ],
+  "watch_factors": [
+    {{
+      "indicator": "Short indicator name with units",
+      "what_to_watch": "What to watch - specific metric or event",
+      "why_it_matters": "Why it matters for aviation operations"
+    }}
+  ]
+}}
+"""
+)
+
+_SO_WHAT_PROMPT_TEMPLATE = """Generate a concise "So What" statement explaining the business aviation impact of this intelligence item.
+
+INTELLIGENCE ITEM:
+Category: {category}
+Content: {content}
+Affected Sectors: {sectors_text}
+Source: {source_type}
+
+TASK: Write a 1-2 sentence "So What" statement that explains:
+- Why this matters for business aviation operations
+- Specific impact on affected client sectors
+- Operational or financial implications
+
+STYLE:
+- Actionable and specific (not vague)
+- Focus on aviation operator perspective
+- Professional, analytical tone
+- Example: "Rising fuel costs will increase operational expenses by 10-15%, requiring pricing adjustments for charter services."
+
+STRICT RULES:
+- Only use information from the content above
+- Do not invent statistics or specific numbers not mentioned
+- If no specific impact can be determined, describe general implications
+
+Generate ONLY the "So What" statement (no labels, no extra text):
+"""
+
+# Number of top-scoring items included in the executive summary prompt
+SUMMARY_PROMPT_ITEMS = 20
+
+# Character budget (~4 chars/token) for item content in the executive summary prompt;
+# long items are truncated proportionally, but never below SUMMARY_MIN_ITEM_CHARS
+SUMMARY_CONTENT_CHAR_BUDGET = 12000
+SUMMARY_MIN_ITEM_CHARS = 200
+
+# Upper bound (seconds) on a single backoff between Claude API attempts
+MAX_RETRY_DELAY = 30.0
+
+# One pass over the executive summary response: each match is a section header,
+# a structured [TAG: value] line, or a legacy "-"/"•" bullet. Other lines are skipped.
+_SUMMARY_LINE_RE = re.compile(
+    r"^\s*(?:"
+    r"(?P<header>(?i:.*(?:BOTTOM LINE|KEY FINDING|WATCH FACTOR).*))"
+    r"|\[(?P<tag>SUBHEADER|CONTENT|BULLET|INDICATOR|WHAT|WHY):(?P<value>.*)"
+    r"|(?P<bullet>[-•].*)"
+    r")$",
+    re.MULTILINE,
+)
+
 
-@dataclass
+# Leading/trailing markdown code fence around a JSON response
+_JSON_FENCE_RE = re.compile(r"^```(?:json)?\s*|\s*```$")
+
+
+class _KeyFinding(BaseModel):
+    subheader: str
+    content: str
+    bullets: List[str] = []
+
+
+class _WatchFactor(BaseModel):
+    indicator: str
+    what_to_watch: str = ""
+    why_it_matters: str = ""
+
+
+class _ExecutiveSummarySchema(BaseModel):
+    """JSON shape requested from Claude for the executive summary"""
+
+    bottom_line: str
+    key_findings: List[_KeyFinding] = []
+    watch_factors: List[_WatchFactor] = []
+
+
+def _parse_summary_json(ai_response: str) -> Optional[Dict[str, List[Any]]]:
+    """Parse a JSON executive summary response, or return None if it is not valid JSON"""
+    text = _JSON_FENCE_RE.sub("", ai_response.strip())
+    if not text.startswith("{"):
+        return None
+
+    try:
+        summary = _ExecutiveSummarySchema.model_validate_json(text)
+    except ValidationError as e:
+        logger.warning(f"AI summary JSON did not match schema: {e.error_count()} errors")
+        return None
+
+    return {
+        "bottom_line": [summary.bottom_line] if summary.bottom_line.strip() else [],
+        "key_findings": [f.model_dump() for f in summary.key_findings if f.content],
+        "watch_factors": [w.model_dump() for w in summary.watch_factors if w.indicator],
+    }
+
+
+# Shared AsyncAnthropic clients keyed by API key, so generator instances reuse
+# warm TCP/TLS connections instead of each opening their own pool
+_SHARED_CLIENTS: Dict[str, Any] = {}
+HTTP_MAX_CONNECTIONS = 32
+HTTP_MAX_KEEPALIVE_CONNECTIONS = 16
+HTTP_KEEPALIVE_EXPIRY = 60.0
+
+
+def _get_shared_client(api_key: str) -> Any:
+    """Get or create the process-wide AsyncAnthropic client for an API key"""
+    client = _SHARED_CLIENTS.get(api_key)
+    if client is None:
+        import httpx
+        from anthropic import AsyncAnthropic, DefaultAsyncHttpxClient
+
+        client = AsyncAnthropic(
+            api_key=api_key,
+            http_client=DefaultAsyncHttpxClient(
+                limits=httpx.Limits(
+                    max_connections=HTTP_MAX_CONNECTIONS,
+                    max_keepalive_connections=HTTP_MAX_KEEPALIVE_CONNECTIONS,
+                    keepalive_expiry=HTTP_KEEPALIVE_EXPIRY,
+                )
+            ),
+        )
+        _SHARED_CLIENTS[api_key] = client
+    return client
+
+
+def _sector_names(sectors: Iterable[Any]) -> Tuple[str, ...]:
+    """Resolve sectors that may be ClientSector enums, dicts or strings to display names"""
+    names: List[str] = []
+    for sector in sectors:
+        value = getattr(sector, "value", _MISSING)
+        if value is not _MISSING:
+            names.append(str(value))
+        elif isinstance(sector, dict):
+            names.append(sector.get("name", str(sector)))
+        else:
+            names.append(str(sector))
+    return tuple(names)
+
+
+def _select_summary_items(items: List[IntelligenceItem]) -> List[IntelligenceItem]:
+    """Select the top items by composite score for the executive summary prompt"""
+    return heapq.nlargest(
+        SUMMARY_PROMPT_ITEMS, items, key=lambda x: x.relevance_score * x.confidence
+    )
+
+
+def _section_for_header(header: str) -> str:
+    """Map a section header line to its summary key"""
+    header = header.upper()
+    if "BOTTOM LINE" in header:
+        return "bottom_line"
+    if "KEY FINDING" in header:
+        return "key_findings"
+    return "watch_factors"
+
+
+@dataclass(slots=True)
 class AIConfig:
     """Configuration for AI generation"""
 
@@ -29,33 +262,91 @@ class AIConfig:
     temperature: float = 0.3  # Lower temperature for more consistent, factual output
     timeout: int = 60  # seconds
     max_retries: int = 2
+    max_concurrency: int = 8  # Cap on in-flight requests for batch generation
+    cache: bool = True  # Reuse completions for identical prompts
+    breaker_threshold: int = 5  # Consecutive failed attempts before skipping the API
+    breaker_cooldown: float = 30.0  # seconds to skip the API once the breaker opens
 
 
 class AIUsageTracker:
     """Track AI API usage and costs"""
 
+    __slots__ = (
+        "total_input_tokens",
+        "total_output_tokens",
+        "total_requests",
+        "total_cost",
+        "failed_requests",
+        "retry_delay_seconds",
+        "cache_hits",
+    )
+
     def __init__(self):
         self.total_input_tokens = 0
         self.total_output_tokens = 0
         self.total_requests = 0
         self.total_cost = 0.0
         self.failed_requests = 0
+        self.retry_delay_seconds = 0.0
+        self.cache_hits = 0
+
+    # Claude Opus 4 pricing: $15/MTok input, $75/MTok output
+    INPUT_COST_PER_TOKEN = 15.0 / 1_000_000
+    OUTPUT_COST_PER_TOKEN = 75.0 / 1_000_000
 
-    def log_request(self, input_tokens: int, output_tokens: int, success: bool = True):
-        """Log an API request"""
+    def log_request(
+        self, input_tokens: int, output_tokens: int, success: bool = True, cache_hit: bool = False
+    ):
+        """Log an API request, or a request served from the prompt cache at no cost"""
         self.total_requests += 1
 
-        if success:
+        if cache_hit:
+            self.cache_hits += 1
+        elif success:
             self.total_input_tokens += input_tokens
             self.total_output_tokens += output_tokens
-
-            # Claude Opus 4 pricing: $15/MTok input, $75/MTok output
-            self.total_cost += input_tokens / 1_000_000 * 15.0 + output_tokens / 1_000_000 * 75.0
+            self.total_cost += (
+                input_tokens * self.INPUT_COST_PER_TOKEN
+                + output_tokens * self.OUTPUT_COST_PER_TOKEN
+            )
         else:
             self.failed_requests += 1
 
+    def log_batch(self, records: Iterable[Tuple[int, int, bool]]):
+        """
+        Log many API requests with a single counter update
+
+        Args:
+            records: (input_tokens, output_tokens, success) per request
+        """
+        requests = 0
+        failed = 0
+        input_tokens = 0
+        output_tokens = 0
+
+        for record_input, record_output, success in records:
+            requests += 1
+            if success:
+                input_tokens += record_input
+                output_tokens += record_output
+            else:
+                failed += 1
+
+        self.total_requests += requests
+        self.failed_requests += failed
+        self.total_input_tokens += input_tokens
+        self.total_output_tokens += output_tokens
+        self.total_cost += (
+            input_tokens * self.INPUT_COST_PER_TOKEN + output_tokens * self.OUTPUT_COST_PER_TOKEN
+        )
+
+    def log_retry_delay(self, delay: float):
+        """Log time spent backing off before a retry"""
+        self.retry_delay_seconds += delay
+
     def get_summary(self) -> Dict:
         """Get usage summary"""
+        billed_requests = max(1, self.total_requests - self.failed_requests - self.cache_hits)
         return {
             "total_requests": self.total_requests,
             "successful_requests": self.total_requests - self.failed_requests,
@@ -63,10 +354,10 @@ class AIUsageTracker:
             "total_input_tokens": self.total_input_tokens,
             "total_output_tokens": self.total_output_tokens,
             "total_cost_usd": round(self.total_cost, 4),
-            "avg_input_tokens": self.total_input_tokens
-            // max(1, self.total_requests - self.failed_requests),
-            "avg_output_tokens": self.total_output_tokens
-            // max(1, self.total_requests - self.failed_requests),
+            "cache_hits": self.cache_hits,
+            "avg_input_tokens": self.total_input_tokens // billed_requests,
+            "avg_output_tokens": self.total_output_tokens // billed_requests,
+            "retry_delay_seconds": round(self.retry_delay_seconds, 2),
         }
 
 
@@ -82,25 +373,32 @@ class SecureAIGenerator:
     - Rate limiting
     """
 
-    def __init__(self, config: Optional[AIConfig] = None):
+    def __init__(self, config: Optional[AIConfig] = None, client: Optional[Any] = None):
         """
         Initialize AI generator
 
         Args:
             config: AI configuration (uses environment variables if not provided)
+            client: Optional AsyncAnthropic client (defaults to a process-wide shared client)
         """
         self.config = config or self._load_config_from_env()
         self.sanitizer = PIISanitizer()
         self.validator = FactValidator()
         self.usage_tracker = AIUsageTracker()
+        self.breaker = CircuitBreaker(
+            failure_threshold=self.config.breaker_threshold,
+            recovery_timeout=self.config.breaker_cooldown,
+            name="claude",
+        )
 
         # Initialize Anthropic client if enabled
-        self.client = None
+        self.client: Any = None
+        self.prompt_cache: Optional[PromptCache] = None
         if self.config.enabled:
             try:
-                from anthropic import AsyncAnthropic
-
-                self.client = AsyncAnthropic(api_key=self.config.api_key)
+                self.client = client or _get_shared_client(self.config.api_key)
+                if self.config.cache:
+                    self.prompt_cache = get_prompt_cache()
                 logger.info(f"✓ AI generation enabled with model: {self.config.model}")
             except ImportError:
                 logger.error("anthropic package not installed - AI generation disabled")
@@ -140,15 +438,30 @@ class SecureAIGenerator:
 
         logger.info("Generating Executive Summary with AI...")
 
-        # Step 1: Sanitize intelligence items
-        sanitized_items = self.sanitizer.sanitize_intelligence_items(items)
+        # Reuse a prior response for the same set of items, regardless of their order
+        cache_key = None
+        ai_response = None
+        if self.prompt_cache:
+            cache_key = self._executive_summary_cache_key(items)
+            ai_response = self.prompt_cache.get(cache_key)
+
+        if ai_response is None:
+            # Step 1: Sanitize only the items that reach the prompt (off the event loop)
+            sanitized_items = await asyncio.to_thread(
+                self.sanitizer.sanitize_intelligence_items, _select_summary_items(items)
+            )
 
-        # Step 2: Prepare prompt
-        prompt = self._build_executive_summary_prompt(sanitized_items)
+            # Step 2: Prepare prompt
+            prompt = self._build_executive_summary_prompt(sanitized_items)
+        else:
+            logger.info("Reusing cached AI response for identical intelligence items")
+            self.usage_tracker.log_request(0, 0, cache_hit=True)
 
         # Step 3: Call AI
+        usage: Dict[str, int] = {}
         try:
-            ai_response = await self._call_claude_api(prompt)
+            if ai_response is None:
+                ai_response, usage = await self._call_claude_api(prompt)
 
             if not ai_response:
                 logger.warning("AI returned empty response - using template fallback")
@@ -157,9 +470,16 @@ class SecureAIGenerator:
             # Step 4: Parse response
             summary_dict = self._parse_executive_summary_response(ai_response)
 
-            # Step 5: Validate for hallucinations
-            is_valid, validation_report = self.validator.validate_executive_summary(
-                summary_dict, items  # Validate against ORIGINAL items (not sanitized)
+            # Nothing to validate if core sections are missing
+            if not summary_dict["key_findings"] or not summary_dict["bottom_line"]:
+                logger.warning("Malformed AI response - skipping validation, using fallback")
+                return fallback_generator(items) if fallback_generator else {}
+
+            # Step 5: Validate for hallucinations (off the event loop)
+            is_valid, validation_report = await asyncio.to_thread(
+                self.validator.validate_executive_summary,
+                summary_dict,
+                items,  # Validate against ORIGINAL items (not sanitized)
             )
 
             if not is_valid:
@@ -168,6 +488,7 @@ class SecureAIGenerator:
                 return fallback_generator(items) if fallback_generator else {}
 
             logger.info("✓ AI-generated Executive Summary validated successfully")
+            self._cache_completion(cache_key, ai_response, usage)
             return summary_dict
 
         except Exception as e:
@@ -195,10 +516,25 @@ class SecureAIGenerator:
 
         # Build prompt
         prompt = self._build_so_what_prompt(sanitized_item)
+        max_tokens = 500
+
+        # Reuse a prior validated response for the same request
+        cache_key = None
+        ai_response = None
+        usage: Dict[str, int] = {}
+        if self.prompt_cache:
+            cache_key = PromptCache.make_key(
+                self.config.model, self.config.temperature, max_tokens, prompt
+            )
+            ai_response = self.prompt_cache.get(cache_key)
+            if ai_response is not None:
+                logger.debug("'So What' statement served from prompt cache")
+                self.usage_tracker.log_request(0, 0, cache_hit=True)
 
         # Call AI
         try:
-            ai_response = await self._call_claude_api(prompt, max_tokens=500)
+            if ai_response is None:
+                ai_response, usage = await self._call_claude_api(prompt, max_tokens=max_tokens)
 
             if not ai_response:
                 return fallback_generator(item) if fallback_generator else ""
@@ -212,15 +548,65 @@ class SecureAIGenerator:
                 logger.warning("'So What' statement validation failed - using fallback")
                 return fallback_generator(item) if fallback_generator else ""
 
+            self._cache_completion(cache_key, ai_response, usage)
             return ai_response.strip()
 
         except Exception as e:
             logger.error(f"AI 'So What' generation failed: {e}")
             return fallback_generator(item) if fallback_generator else ""
 
+    async def generate_so_what_batch(
+        self,
+        items: List[IntelligenceItem],
+        fallback_generator=None,
+        concurrency: Optional[int] = None,
+    ) -> List[str]:
+        """
+        Generate "So What" statements for many items concurrently
+
+        Args:
+            items: Intelligence items
+            fallback_generator: Function to call if AI generation fails for an item
+            concurrency: Maximum in-flight API requests (defaults to config.max_concurrency)
+
+        Returns:
+            Generated "So What" statements in the same order as items
+        """
+        semaphore = asyncio.Semaphore(concurrency or self.config.max_concurrency)
+
+        async def _generate_one(item: IntelligenceItem) -> str:
+            async with semaphore:
+                return await self.generate_so_what_statement(item, fallback_generator)
+
+        results = await asyncio.gather(
+            *(_generate_one(item) for item in items), return_exceptions=True
+        )
+
+        statements = []
+        for item, result in zip(items, results):
+            if isinstance(result, BaseException):
+                logger.error(f"AI 'So What' batch generation failed: {result}")
+                statements.append(fallback_generator(item) if fallback_generator else "")
+            else:
+                statements.append(result)
+
+        return statements
+
+    def _cache_completion(self, cache_key: Optional[str], text: str, usage: Dict[str, int]) -> None:
+        """
+        Store a completion in the prompt cache
+
+        Called only once the response has been parsed and validated, so a
+        rejected response is retried on the next run instead of replayed.
+        Responses that were themselves served from the cache carry no usage
+        and are not written again.
+        """
+        if self.prompt_cache and cache_key and usage:
+            self.prompt_cache.put(cache_key, text, usage=usage)
+
     async def _call_claude_api(
         self, prompt: str, max_tokens: Optional[int] = None
-    ) -> Optional[str]:
+    ) -> Tuple[Optional[str], Dict[str, int]]:
         """
         Call Claude API with error handling and retries
 
@@ -229,12 +615,27 @@ class SecureAIGenerator:
             max_tokens: Maximum tokens to generate
 
         Returns:
-            Generated text or None on failure
+            Tuple of (generated text or None on failure, token usage of the call)
         """
         if not self.client:
-            return None
+            return None, {}
 
         max_tokens = max_tokens or self.config.max_tokens
+
+        if self.breaker.is_open:
+            logger.warning("Claude API circuit breaker open - skipping AI call")
+            return None, {}
+
+        import anthropic
+
+        # Transient failures worth another attempt; other API errors are permanent
+        retryable_errors = (
+            anthropic.APIConnectionError,
+            anthropic.APITimeoutError,
+            anthropic.RateLimitError,
+            anthropic.InternalServerError,
+        )
+
         retries = 0
 
         while retries <= self.config.max_retries:
@@ -243,15 +644,8 @@ class SecureAIGenerator:
                     f"Calling Claude API (attempt {retries + 1}/{self.config.max_retries + 1})"
                 )
 
-                response = await asyncio.wait_for(
-                    self.client.messages.create(
-                        model=self.config.model,
-                        max_tokens=max_tokens,
-                        temperature=self.config.temperature,
-                        messages=[{"role": "user", "content": prompt}],
-                    ),
-                    timeout=self.config.timeout,
-                )
+                async with asyncio.timeout(self.config.timeout):
+                    response = await self._stream_message(prompt, max_tokens)
 
                 # Extract text from response - only TextBlocks have .text
                 first_block = response.content[0]
@@ -268,282 +662,242 @@ class SecureAIGenerator:
                     f"AI API call successful: {response.usage.input_tokens} in, {response.usage.output_tokens} out"
                 )
 
-                return text
+                self.breaker.record_success()
+                return text, {
+                    "input_tokens": response.usage.input_tokens,
+                    "output_tokens": response.usage.output_tokens,
+                }
 
-            except asyncio.TimeoutError:
+            except TimeoutError:
                 logger.warning(f"AI API timeout (attempt {retries + 1})")
                 retries += 1
+                delay = self._retry_delay(retries)
 
-            except Exception as e:
+            except retryable_errors as e:
                 logger.error(f"AI API error: {type(e).__name__}: {str(e)}")
                 self.usage_tracker.log_request(0, 0, success=False)
                 retries += 1
+                delay = self._retry_delay(retries, e)
 
-            if retries <= self.config.max_retries:
-                await asyncio.sleep(2**retries)  # Exponential backoff
-
-        return None
-
-    def _build_executive_summary_prompt(self, items: List[IntelligenceItem]) -> str:
-        """Build prompt for Executive Summary generation"""
-
-        # Select top 20 items by composite score
-        top_items = sorted(items, key=lambda x: x.relevance_score * x.confidence, reverse=True)[:20]
-
-        # Format intelligence items
-        items_text = []
-        for i, item in enumerate(top_items, 1):
-            # Handle sectors that may be ClientSector enums or strings/dicts
-            sectors = []
-            for s in item.affected_sectors:
-                if hasattr(s, "value"):
-                    sectors.append(s.value)
-                elif isinstance(s, dict):
-                    sectors.append(s.get("name", str(s)))
-                else:
-                    sectors.append(str(s))
-
-            items_text.append(
-                f"[ITEM {i}]\n"
-                f"Content: {item.processed_content}\n"
-                f"Source Type: {item.source_type}\n"
-                f"Relevance: {item.relevance_score:.2f}\n"
-                f"Sectors: {', '.join(sectors)}\n"
-            )
-
-        intelligence_block = "\n".join(items_text)
-
-        prompt = f"""{REPORT_STYLE_SYSTEM_MESSAGE}
-
-You are writing the Executive Summary for a monthly intelligence report for Solairus Aviation, a business aviation operator serving high-net-worth clients in technology, finance, real estate, and entertainment sectors.
-
-INTELLIGENCE ITEMS (Top 20 by relevance):
-{intelligence_block}
+            except anthropic.APIStatusError as e:
+                logger.error(f"AI API request rejected ({e.status_code}) - not retrying: {e}")
+                self.usage_tracker.log_request(0, 0, success=False)
+                return None, {}
 
-TASK: Generate an Executive Summary with these three sections:
+            except Exception as e:
+                logger.error(f"Unexpected AI API error: {type(e).__name__}: {str(e)}")
+                self.usage_tracker.log_request(0, 0, success=False)
+                return None, {}
 
-1. BOTTOM LINE: A SINGLE UNIFIED PARAGRAPH (not bullet points)
-   - Lead with bold assessment ending at natural break: **Ergo assesses that X,** followed by synthesis
-   - Synthesize ALL major regional themes (Asia, Middle East, Europe) into ONE cohesive paragraph
-   - CRITICAL: Only include topics that will have corresponding Key Findings sections
-   - Do NOT include tangential topics like export controls unless directly aviation-relevant
+            self.breaker.record_failure()
+            if self.breaker.is_open:
+                break
 
-2. KEY FINDINGS (3-5 sections): Each finding needs proper structure
-   - SUBHEADER: Title Case theme title (e.g., **Taiwan Strait Escalation Risk**)
-   - LEAD SENTENCE: Bold the core assessment WITHOUT "Ergo assesses that" prefix
-   - TRANSITION: Include "Ergo assesses X implications for Solairus:" before bullets
-   - BULLETS: Use dash format with bold lead phrase + period:
-     -   **Route disruption.** Description of impact...
+            if retries <= self.config.max_retries:
+                self.usage_tracker.log_retry_delay(delay)
+                await asyncio.sleep(delay)
 
-3. WATCH FACTORS (at least 3 items): Forward-looking indicators
-   - INDICATOR: Short name with units where applicable
-   - WHAT TO WATCH: Specific metric or event
-   - WHY IT MATTERS: Aviation operational impact
+        return None, {}
 
-RISK CALIBRATION (CRITICAL):
-- Lead with MOST PROBABLE trajectory, not worst case
-- Explicitly flag unlikely scenarios: "While unlikely...", "In the unlikely event..."
-- Use conditional framing for tail risks: "would result in" not "requires preparation for"
-- Reserve "prepare for" and "require" language for LIKELY scenarios only
-- Do NOT present worst-case scenarios as baseline planning assumptions
+    async def _stream_message(self, prompt: str, max_tokens: int) -> Any:
+        """
+        Stream a completion and return the final message
 
-STRICT RULES:
-- Only use facts from the intelligence items provided above
-- Do not invent data, predictions, dates, or percentages not in source items
-- Remove internal scenario names ("Strait Jacket", "Tinderboxed", etc.)
-- Remove probability percentages like "(55% probability as of...)"
-- Use periods within bullets, not semicolons
-- Vary sentence structure - don't start every sentence with "Ergo assesses"
+        Streaming keeps the connection active while long summaries are generated,
+        and the final message carries the same content and usage as create().
+        """
+        async with self.client.messages.stream(
+            model=self.config.model,
+            max_tokens=max_tokens,
+            temperature=self.config.temperature,
+            messages=[{"role": "user", "content": prompt}],
+        ) as stream:
+            return await stream.get_final_message()
+
+    @staticmethod
+    def _retry_delay(attempt: int, error: Optional[BaseException] = None) -> float:
+        """
+        Compute backoff before the next API attempt
 
-FORMAT YOUR RESPONSE EXACTLY AS:
+        Honors the server's Retry-After header on rate limits; otherwise uses
+        full jitter so concurrent callers don't retry in lockstep.
 
-BOTTOM LINE:
-**[Bold lead assessment ending at comma or period,]** followed by synthesized paragraph covering all themes that will appear in Key Findings below.
+        Args:
+            attempt: Number of attempts made so far
+            error: Exception raised by the failed attempt, if any
 
-KEY FINDINGS:
+        Returns:
+            Seconds to wait before retrying
+        """
+        if getattr(error, "status_code", None) == 429:
+            headers = getattr(getattr(error, "response", None), "headers", None) or {}
+            try:
+                retry_after = float(headers.get("retry-after", 0))
+            except (TypeError, ValueError):
+                retry_after = 0.0
+            if retry_after > 0:
+                return min(retry_after, MAX_RETRY_DELAY)
+            return min(MAX_RETRY_DELAY, 2.0**attempt + random.uniform(0, 1))
 
-[SUBHEADER: Theme Title In Title Case]
-**[Bold lead assessment without "Ergo assesses that" prefix.]** Supporting analysis with evidence. Ergo assesses X implications for Solairus:
-[BULLET: **Lead phrase.** Supporting detail with periods not semicolons.]
-[BULLET: **Lead phrase.** Supporting detail.]
+        return random.uniform(0, 2.0**attempt)
 
-[SUBHEADER: Second Theme Title]
-**[Bold lead assessment.]** Supporting analysis. Two trends Ergo is monitoring for Solairus:
-[BULLET: **Lead phrase.** Supporting detail.]
-[BULLET: **Lead phrase.** Supporting detail.]
+    def _executive_summary_cache_key(self, items: List[IntelligenceItem]) -> str:
+        """
+        Build an order-independent cache key for an executive summary request
 
-[SUBHEADER: Third Theme Title]
-**[Bold lead assessment.]** Supporting analysis. Ergo assesses X implications:
-[BULLET: **Lead phrase.** Supporting detail.]
-[BULLET: **Lead phrase.** Supporting detail.]
+        Covers only the items selected for the prompt and the fields the prompt
+        renders for them, plus the model settings and prompt template. Changes to
+        items that never reach the prompt therefore still hit the cache.
+        """
+        item_digests = sorted(
+            hashlib.blake2b(
+                "|".join(
+                    (
+                        item.source_type,
+                        item.processed_content,
+                        f"{item.relevance_score:.2f}",
+                        ",".join(_sector_names(item.affected_sectors)),
+                    )
+                ).encode(),
+                digest_size=16,
+            ).digest()
+            for item in _select_summary_items(items)
+        )
+
+        fingerprint = hashlib.blake2b(digest_size=20)
+        fingerprint.update(_EXECUTIVE_SUMMARY_PROMPT_TEMPLATE.encode())
+        fingerprint.update(
+            f"{self.config.model}|{self.config.temperature}|{self.config.max_tokens}".encode()
+        )
+        for digest in item_digests:
+            fingerprint.update(digest)
+
+        return f"summary_{fingerprint.hexdigest()}"
 
-WATCH FACTORS:
+    def _build_executive_summary_prompt(self, items: List[IntelligenceItem]) -> str:
+        """Build prompt for Executive Summary generation"""
 
-[INDICATOR: Short indicator name with units]
-[WHAT: What to watch - specific metric or event]
-[WHY: Why it matters for aviation operations]
+        top_items = _select_summary_items(items)
+
+        # Scale item content down proportionally when it exceeds the prompt budget
+        lengths = [len(item.processed_content) for item in top_items]
+        total_chars = sum(lengths)
+        if total_chars > SUMMARY_CONTENT_CHAR_BUDGET:
+            scale = SUMMARY_CONTENT_CHAR_BUDGET / total_chars
+            limits = [max(SUMMARY_MIN_ITEM_CHARS, int(length * scale)) for length in lengths]
+            logger.debug(
+                f"Truncating summary prompt content from {total_chars} to "
+                f"{sum(min(length, limit) for length, limit in zip(lengths, limits))} chars"
+            )
+        else:
+            limits = lengths
 
-[INDICATOR: Second indicator]
-[WHAT: What to watch]
-[WHY: Why it matters]
+        # Format intelligence items into a single buffer (blank line between items)
+        buffer = io.StringIO()
+        for i, (item, limit) in enumerate(zip(top_items, limits), 1):
+            if i > 1:
+                buffer.write("\n")
+            buffer.write(f"[ITEM {i}]\nContent: ")
+            buffer.write(item.processed_content[:limit])
+            buffer.write(f"\nSource Type: {item.source_type}\n")
+            buffer.write(f"Relevance: {item.relevance_score:.2f}\nSectors: ")
+            buffer.write(", ".join(_sector_names(item.affected_sectors)))
+            buffer.write("\n")
 
-[INDICATOR: Third indicator]
-[WHAT: What to watch]
-[WHY: Why it matters]
-"""
+        intelligence_block = buffer.getvalue()
 
-        return prompt
+        return _EXECUTIVE_SUMMARY_PROMPT_TEMPLATE.format(intelligence_block=intelligence_block)
 
     def _build_so_what_prompt(self, item: IntelligenceItem) -> str:
         """Build prompt for 'So What' statement generation"""
 
-        # Handle sectors that may be ClientSector enums or strings/dicts
         if item.affected_sectors:
-            sectors = []
-            for s in item.affected_sectors:
-                if hasattr(s, "value"):
-                    sectors.append(s.value)
-                elif isinstance(s, dict):
-                    sectors.append(s.get("name", str(s)))
-                else:
-                    sectors.append(str(s))
-            sectors_text = ", ".join(sectors)
+            sectors_text = ", ".join(_sector_names(item.affected_sectors))
         else:
             sectors_text = "general"
 
-        prompt = f"""Generate a concise "So What" statement explaining the business aviation impact of this intelligence item.
-
-INTELLIGENCE ITEM:
-Category: {item.category}
-Content: {item.processed_content}
-Affected Sectors: {sectors_text}
-Source: {item.source_type}
-
-TASK: Write a 1-2 sentence "So What" statement that explains:
-- Why this matters for business aviation operations
-- Specific impact on affected client sectors
-- Operational or financial implications
-
-STYLE:
-- Actionable and specific (not vague)
-- Focus on aviation operator perspective
-- Professional, analytical tone
-- Example: "Rising fuel costs will increase operational expenses by 10-15%, requiring pricing adjustments for charter services."
-
-STRICT RULES:
-- Only use information from the content above
-- Do not invent statistics or specific numbers not mentioned
-- If no specific impact can be determined, describe general implications
-
-Generate ONLY the "So What" statement (no labels, no extra text):
-"""
-
-        return prompt
+        return _SO_WHAT_PROMPT_TEMPLATE.format(
+            category=item.category,
+            content=item.processed_content,
+            sectors_text=sectors_text,
+            source_type=item.source_type,
+        )
 
     def _parse_executive_summary_response(self, ai_response: str) -> Dict[str, List[Any]]:
-        """Parse AI response into structured executive summary with new format support"""
+        """Parse AI response into structured executive summary (JSON or tagged text)"""
+
+        summary = _parse_summary_json(ai_response)
+        if summary is not None:
+            return summary
 
+        # Tagged-text format, e.g. responses that ignored the JSON instruction
         result: Dict[str, List[Any]] = {"bottom_line": [], "key_findings": [], "watch_factors": []}
 
         current_section = None
-        lines = ai_response.strip().split("\n")
 
         # For structured key findings
-        current_finding = None
+        current_finding: Optional[Dict[str, Any]] = None
 
         # For structured watch factors
-        current_watch_factor = None
+        current_watch_factor: Optional[Dict[str, str]] = None
 
-        for line in lines:
-            line = line.strip()
-
-            if not line:
-                continue
+        for match in _SUMMARY_LINE_RE.finditer(ai_response):
+            header = match.group("header")
+            tag = match.group("tag")
 
             # Detect section headers
-            if "BOTTOM LINE" in line.upper():
-                current_section = "bottom_line"
-                current_finding = None
-                current_watch_factor = None
-                continue
-            elif "KEY FINDING" in line.upper():
-                current_section = "key_findings"
-                current_finding = None
-                current_watch_factor = None
-                continue
-            elif "WATCH FACTOR" in line.upper():
-                current_section = "watch_factors"
+            if header is not None:
+                current_section = _section_for_header(header)
                 current_finding = None
                 current_watch_factor = None
                 continue
 
+            if tag is not None:
+                value = match.group("value").strip().rstrip("]").strip()
+            else:
+                # Legacy bullet format
+                value = match.group("bullet").lstrip("- •").strip()
+
             # Parse structured Key Findings
             if current_section == "key_findings":
-                if line.startswith("[SUBHEADER:"):
+                if tag == "SUBHEADER":
                     # Save previous finding if exists
                     if current_finding and current_finding.get("content"):
                         result["key_findings"].append(current_finding)
-                    # Start new finding
-                    subheader = line.replace("[SUBHEADER:", "").rstrip("]").strip()
-                    bullets_list: List[str] = []
-                    current_finding = {
-                        "subheader": subheader,
-                        "content": "",
-                        "bullets": bullets_list,
-                    }
-                elif line.startswith("[CONTENT:") and current_finding:
-                    content = line.replace("[CONTENT:", "").rstrip("]").strip()
-                    current_finding["content"] = content
-                elif line.startswith("[BULLET:") and current_finding:
-                    bullet = line.replace("[BULLET:", "").rstrip("]").strip()
-                    bullets = current_finding.get("bullets")
-                    if isinstance(bullets, list):
-                        bullets.append(bullet)
-                elif line.startswith("-") or line.startswith("•"):
-                    # Legacy format bullet
-                    statement = line.lstrip("- •").strip()
-                    if statement:
-                        if current_finding:
-                            bullets = current_finding.get("bullets")
-                            if isinstance(bullets, list):
-                                bullets.append(statement)
-                        else:
-                            # Legacy format - just a string
-                            result["key_findings"].append(statement)
-                continue
+                    current_finding = {"subheader": value, "content": "", "bullets": []}
+                elif tag == "CONTENT" and current_finding:
+                    current_finding["content"] = value
+                elif tag == "BULLET" and current_finding:
+                    current_finding["bullets"].append(value)
+                elif tag is None and value:
+                    if current_finding:
+                        current_finding["bullets"].append(value)
+                    else:
+                        # Legacy format - just a string
+                        result["key_findings"].append(value)
 
             # Parse structured Watch Factors
-            if current_section == "watch_factors":
-                if line.startswith("[INDICATOR:"):
+            elif current_section == "watch_factors":
+                if tag == "INDICATOR":
                     # Save previous factor if exists
                     if current_watch_factor and current_watch_factor.get("indicator"):
                         result["watch_factors"].append(current_watch_factor)
-                    # Start new factor
-                    indicator = line.replace("[INDICATOR:", "").rstrip("]").strip()
                     current_watch_factor = {
-                        "indicator": indicator,
+                        "indicator": value,
                         "what_to_watch": "",
                         "why_it_matters": "",
                     }
-                elif line.startswith("[WHAT:") and current_watch_factor:
-                    what = line.replace("[WHAT:", "").rstrip("]").strip()
-                    current_watch_factor["what_to_watch"] = what
-                elif line.startswith("[WHY:") and current_watch_factor:
-                    why = line.replace("[WHY:", "").rstrip("]").strip()
-                    current_watch_factor["why_it_matters"] = why
-                elif line.startswith("-") or line.startswith("•"):
-                    # Legacy format
-                    statement = line.lstrip("- •").strip()
-                    if statement:
-                        result["watch_factors"].append(statement)
-                continue
+                elif tag == "WHAT" and current_watch_factor:
+                    current_watch_factor["what_to_watch"] = value
+                elif tag == "WHY" and current_watch_factor:
+                    current_watch_factor["why_it_matters"] = value
+                elif tag is None and value:
+                    result["watch_factors"].append(value)
 
             # Parse Bottom Line (simple bullet format)
-            if current_section == "bottom_line":
-                if line.startswith("-") or line.startswith("•"):
-                    statement = line.lstrip("- •").strip()
-                    if statement:
-                        result["bottom_line"].append(statement)
+            elif current_section == "bottom_line":
+                if tag is None and value:
+                    result["bottom_line"].append(value)
 
         # Save final finding and watch factor if they exist
         if current_finding and current_finding.get("content"):
@@ -5,7 +5,7 @@ Removes personally identifiable information and client-specific data before send
 
 import logging
 import re
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Mapping, Match, Optional, Pattern, Sequence
 
 from solairus_intelligence.config.clients import CLIENT_SECTOR_MAPPING, ClientSector
 from solairus_intelligence.core.processor import IntelligenceItem
@@ -19,7 +19,9 @@ class PIISanitizer:
     before sending data to external AI services
     """
 
-    def __init__(self, client_mapping: Optional[Dict[ClientSector, Dict]] = None):
+    def __init__(
+        self, client_mapping: Optional[Mapping[ClientSector, Mapping[str, Sequence[str]]]] = None
+    ):
         """
         Initialize sanitizer with client mapping data
 
@@ -29,6 +31,8 @@ class PIISanitizer:
         # Use centralized config as single source of truth
         self.client_mapping = client_mapping or CLIENT_SECTOR_MAPPING
         self.company_patterns = self._build_company_patterns()
+        self.company_regex = self._build_company_regex()
+        self._companies_by_lower = {company.lower(): company for company in self.company_patterns}
 
     def _build_company_patterns(self) -> Dict[str, str]:
         """
@@ -40,7 +44,7 @@ class PIISanitizer:
         patterns = {}
 
         for sector, data in self.client_mapping.items():
-            companies = data.get("companies", [])
+            companies = data.get("companies", ())
             sector_token = f"[{sector.value.upper()}_CLIENT]"
 
             for company in companies:
@@ -49,6 +53,23 @@ class PIISanitizer:
 
         return patterns
 
+    def _build_company_regex(self) -> Optional[Pattern[str]]:
+        """
+        Compile all company names into a single case-insensitive alternation
+
+        Longer names are tried first so a name that extends another
+        (e.g. "ArcLight Capital Partners") is replaced as a whole.
+
+        Returns:
+            Compiled pattern, or None if there are no company names
+        """
+        if not self.company_patterns:
+            return None
+
+        names = sorted(self.company_patterns, key=len, reverse=True)
+        alternation = "|".join(re.escape(name) for name in names)
+        return re.compile(rf"\b(?:{alternation})\b", re.IGNORECASE)
+
     def sanitize_text(self, text: str, audit_log: bool = True) -> str:
         """
         Remove client company names from text
@@ -60,21 +81,22 @@ class PIISanitizer:
         Returns:
             Sanitized text with client names replaced
         """
-        if not text:
+        if not text or self.company_regex is None:
             return text
 
-        sanitized = text
-        replacements_made = []
+        replaced_companies: Dict[str, str] = {}
 
-        # Replace company names (case-insensitive)
-        for company, token in self.company_patterns.items():
-            # Use word boundaries to avoid partial matches
-            pattern = re.compile(r"\b" + re.escape(company) + r"\b", re.IGNORECASE)
-            matches = pattern.findall(sanitized)
+        def _replace(match: Match[str]) -> str:
+            company = self._companies_by_lower[match.group(0).lower()]
+            token = self.company_patterns[company]
+            replaced_companies[company] = token
+            return token
 
-            if matches:
-                sanitized = pattern.sub(token, sanitized)
-                replacements_made.append(f"{company} → {token}")
+        # Replace company names (case-insensitive, word boundaries) in a single pass
+        sanitized = self.company_regex.sub(_replace, text)
+        replacements_made = [
+            f"{company} → {token}" for company, token in replaced_companies.items()
+        ]
 
         # Log sanitization if requested
         if audit_log and replacements_made:
@@ -4,17 +4,25 @@ Main application that orchestrates the entire intelligence gathering and report
 """
 
 import asyncio
+import functools
 import json
 import logging
+import os
+import sys
+import tempfile
+import threading
+from collections import Counter
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Set, Tuple
 
-from solairus_intelligence.clients.ergomind_client import ErgoMindClient, ErgoMindConfig
-from solairus_intelligence.core.document.generator import DocumentGenerator
-from solairus_intelligence.core.orchestrator import QueryOrchestrator
-from solairus_intelligence.core.processors.merger import IntelligenceMerger
 from solairus_intelligence.utils.config import ENV_CONFIG, get_status_file_path
 
+if TYPE_CHECKING:
+    from solairus_intelligence.clients.ergomind_client import ErgoMindConfig, QueryResult
+    from solairus_intelligence.core.orchestrator import QueryTemplate
+    from solairus_intelligence.core.processors.base import IntelligenceItem
+
 # Set up logging
 logging.basicConfig(
     level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
@@ -22,21 +30,90 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+# Summary label for a data source, indexed by whether it succeeded
+_SOURCE_OUTCOME = ("✗ Failed", "✓ Success")
+
+
+def _dumps_status_json(status: Dict) -> bytes:
+    """Serialize run status with the stdlib json module, in the form orjson writes"""
+    return json.dumps(status, separators=(",", ":"), ensure_ascii=False, default=str).encode()
+
+
+# orjson is optional (the "fast" extra); when present the status is serialized in C.
+# Datetimes pass through to default=str, so both serializers write the same bytes.
+try:
+    import orjson
+except ImportError:
+    _dumps_status: Callable[[Dict], bytes] = _dumps_status_json
+else:
+    _dumps_status = functools.partial(
+        orjson.dumps,
+        default=str,
+        option=orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME,
+    )
+
+
+def _count_results(results: Dict[str, List]) -> int:
+    """Count responses across all categories of a source's results"""
+    return sum(map(len, results.values()))
+
+
+@dataclass
+class ItemTallies:
+    """Source and quality counts over intelligence items, collected in a single pass"""
+
+    total: int = 0
+    source_counts: Counter = field(default_factory=Counter)
+    high_relevance: int = 0
+    with_so_what: int = 0
+    with_actions: int = 0
+
+    @classmethod
+    def from_items(cls, items: List["IntelligenceItem"]) -> "ItemTallies":
+        """Tally source types, high-relevance items, So What statements and action items"""
+        tallies = cls(total=len(items))
+        for item in items:
+            tallies.source_counts[item.source_type] += 1
+            if item.relevance_score > 0.7:
+                tallies.high_relevance += 1
+            if item.so_what_statement:
+                tallies.with_so_what += 1
+            if item.action_items:
+                tallies.with_actions += 1
+        return tallies
+
+
 class SolairusIntelligenceGenerator:
     """
     Main application class for generating Solairus intelligence reports
     """
 
-    def __init__(self, config: Optional[ErgoMindConfig] = None):
+    def __init__(self, config: Optional["ErgoMindConfig"] = None):
+        # Heavy dependencies (aiohttp, websockets, python-docx) load here rather than at
+        # import time, so `--help` and argument errors return without them
+        from solairus_intelligence.clients.ergomind_client import ErgoMindClient, ErgoMindConfig
+        from solairus_intelligence.core.document.generator import DocumentGenerator
+        from solairus_intelligence.core.orchestrator import QueryOrchestrator
+        from solairus_intelligence.core.processors.merger import IntelligenceMerger
+
         self.config = config or ErgoMindConfig()
         self.client = ErgoMindClient(self.config)
         self.orchestrator = QueryOrchestrator(self.client)
+        # Test mode uses 6 queries with priority >= 7 for content variety; filter once
+        self._test_templates = [t for t in self.orchestrator.query_templates if t.priority >= 7][:6]
         self.merger = IntelligenceMerger()
         self.generator = DocumentGenerator()
         self.last_run_status: Optional[Dict[str, Any]] = None
+        # Strong references keep in-flight status writes from being garbage collected
+        self._pending_status_writes: Set[asyncio.Task] = set()
+        # Status writes run in worker threads; the lock serializes them and the
+        # sequence numbers stop an older run's write from replacing a newer one
+        self._status_lock = threading.Lock()
+        self._status_seq = 0
+        self._status_written_seq = 0
 
         # Log environment configuration
-        logger.info(f"Initialized with: {ENV_CONFIG}")
+        logger.info("Initialized with: %s", ENV_CONFIG)
 
     async def generate_monthly_report(self, test_mode: bool = False) -> Tuple[str, Dict[str, Any]]:
         """
@@ -63,36 +140,46 @@ class SolairusIntelligenceGenerator:
         try:
             logger.info("=" * 50)
             logger.info("Starting Solairus Intelligence Report Generation")
-            logger.info(f"Mode: {'TEST' if test_mode else 'PRODUCTION'}")
+            logger.info("Mode: %s", "TEST" if test_mode else "PRODUCTION")
             logger.info("=" * 50)
 
             # Step 1: Gather intelligence from ErgoMind AND GTA (Combined!)
             logger.info("\n📡 Phase 1: Combined Intelligence Gathering (ErgoMind + GTA)")
 
             if test_mode:
-                # Use limited queries in test mode - still use ErgoMind only for speed
-                raw_results = await self._test_intelligence_gathering()
-                ergomind_items = await self.orchestrator.process_and_filter_results(raw_results)
-
-                # Add GTA in test mode too, but fewer items
-                logger.info("  Gathering GTA data (test mode)...")
-                gta_results = await self.orchestrator.execute_gta_intelligence_gathering(
-                    days_back=30
+                # Limited ErgoMind queries plus a shorter GTA window and FRED, all in parallel
+                logger.info("  Gathering ErgoMind, GTA and FRED data (test mode)...")
+                gathered = await asyncio.gather(
+                    self._test_intelligence_gathering(),
+                    self.orchestrator.execute_gta_intelligence_gathering(days_back=30),
+                    self.orchestrator.execute_fred_data_gathering(days_back=90),
+                    return_exceptions=True,
                 )
-                gta_items = await self.orchestrator.process_gta_results(gta_results)
 
-                # Add FRED in test mode
-                logger.info("  Gathering FRED economic data (test mode)...")
-                fred_results = await self.orchestrator.execute_fred_data_gathering(days_back=90)
-                fred_items = await self.orchestrator.process_fred_results(fred_results)
+                # A failed source contributes no results rather than aborting the run
+                source_status = {}
+                source_results: List[Dict] = []
+                for source, result in zip(("ergomind", "gta", "fred"), gathered):
+                    if isinstance(result, Exception):
+                        logger.error("❌ %s gathering failed: %s", source, result)
+                        source_status[source] = "failed"
+                        source_results.append({})
+                    else:
+                        source_status[source] = "success"
+                        source_results.append(result)
+                status["source_status"] = source_status
+                raw_results, gta_results, fred_results = source_results
 
-                # Merge all intelligence sources
-                processed_items = self.merger.merge_sources(ergomind_items, gta_items, fred_items)
+                ergomind_items, gta_items, fred_items = await asyncio.gather(
+                    self.orchestrator.process_and_filter_results(raw_results),
+                    self.orchestrator.process_gta_results(gta_results),
+                    self.orchestrator.process_fred_results(fred_results),
+                )
 
                 status["queries_executed"] = (
-                    sum(len(v) for v in raw_results.values())
-                    + sum(len(v) for v in gta_results.values())
-                    + sum(len(v) for v in fred_results.values())
+                    _count_results(raw_results)
+                    + _count_results(gta_results)
+                    + _count_results(fred_results)
                 )
             else:
                 # Full production mode with all three sources in parallel
@@ -106,79 +193,97 @@ class SolairusIntelligenceGenerator:
                 )
                 status["source_status"] = source_status
 
-                # Process ErgoMind results
-                ergomind_items = await self.orchestrator.process_and_filter_results(
-                    multi_source_results["ergomind"]
+                # Process each source's results independently
+                ergomind_items, gta_items, fred_items = await asyncio.gather(
+                    self.orchestrator.process_and_filter_results(multi_source_results["ergomind"]),
+                    self.orchestrator.process_gta_results(multi_source_results["gta"]),
+                    self.orchestrator.process_fred_results(multi_source_results["fred"]),
                 )
 
-                # Process GTA results
-                gta_items = await self.orchestrator.process_gta_results(multi_source_results["gta"])
-
-                # Process FRED results
-                fred_items = await self.orchestrator.process_fred_results(
-                    multi_source_results["fred"]
-                )
-
-                # Merge all intelligence sources
-                processed_items = self.merger.merge_sources(ergomind_items, gta_items, fred_items)
-
                 status["queries_executed"] = (
-                    sum(len(v) for v in multi_source_results["ergomind"].values())
-                    + sum(len(v) for v in multi_source_results["gta"].values())
-                    + sum(len(v) for v in multi_source_results["fred"].values())
+                    _count_results(multi_source_results["ergomind"])
+                    + _count_results(multi_source_results["gta"])
+                    + _count_results(multi_source_results["fred"])
                 )
 
+            # Merge all intelligence sources (dedup is CPU-bound, so run it off the event loop)
+            processed_items = await asyncio.to_thread(
+                self.merger.merge_sources, ergomind_items, gta_items, fred_items
+            )
+
             logger.info(
-                f"✓ Collected {status['queries_executed']} total responses (ErgoMind + GTA + FRED)"
+                "✓ Collected %d total responses (ErgoMind + GTA + FRED)", status["queries_executed"]
             )
-            logger.info(f"  ├─ ErgoMind: {len(ergomind_items)} items")
-            logger.info(f"  ├─ GTA: {len(gta_items)} items")
-            logger.info(f"  ├─ FRED: {len(fred_items)} items")
-            logger.info(f"  └─ Merged: {len(processed_items)} unique items")
+            ergomind_total, gta_total, fred_total, merged_total = (
+                len(ergomind_items),
+                len(gta_items),
+                len(fred_items),
+                len(processed_items),
+            )
+            logger.info("  ├─ ErgoMind: %d items", ergomind_total)
+            logger.info("  ├─ GTA: %d items", gta_total)
+            logger.info("  ├─ FRED: %d items", fred_total)
+            logger.info("  └─ Merged: %d unique items", merged_total)
 
             # Check for empty results and warn user
-            if len(processed_items) == 0:
+            if merged_total == 0:
                 warning_msg = "WARNING: No intelligence items collected from any source!"
                 logger.warning(warning_msg)
                 status["errors"].append(warning_msg)
 
                 # Provide specific source failure info
-                if len(ergomind_items) == 0:
+                if ergomind_total == 0:
                     status["errors"].append(
                         "ErgoMind returned no usable data - check API connection"
                     )
-                if len(gta_items) == 0:
+                if gta_total == 0:
                     status["errors"].append("GTA returned no usable data - check API key")
-                if len(fred_items) == 0:
+                if fred_total == 0:
                     status["errors"].append("FRED returned no usable data - check API key")
-            elif len(processed_items) < 5:
-                warning_msg = f"WARNING: Only {len(processed_items)} intelligence items collected - report may be sparse"
+
+                # Nothing to organize, render or score - skip straight to the summary
+                self._print_summary(status, start_time, datetime.now())
+                return "", status
+            elif merged_total < 5:
+                warning_msg = f"WARNING: Only {merged_total} intelligence items collected - report may be sparse"
                 logger.warning(warning_msg)
                 status["errors"].append(warning_msg)
 
             # Step 2: Intelligence quality validation
             logger.info("\n🔍 Phase 2: Intelligence Quality Validation")
-            status["items_processed"] = len(processed_items)
-            status["ergomind_count"] = len(
-                [i for i in processed_items if i.source_type == "ergomind"]
+            tallies = ItemTallies.from_items(processed_items)
+            source_counts = tallies.source_counts
+            status.update(
+                {
+                    "items_processed": merged_total,
+                    "ergomind_count": source_counts["ergomind"],
+                    "gta_count": source_counts["gta"],
+                    "fred_count": source_counts["fred"],
+                }
             )
-            status["gta_count"] = len([i for i in processed_items if i.source_type == "gta"])
-            status["fred_count"] = len([i for i in processed_items if i.source_type == "fred"])
-            logger.info(f"✓ Validated {len(processed_items)} high-quality intelligence items")
+            logger.info("✓ Validated %d high-quality intelligence items", merged_total)
             logger.info(
-                f"  Source breakdown: {status['ergomind_count']} ErgoMind + {status['gta_count']} GTA + {status['fred_count']} FRED"
+                "  Source breakdown: %d ErgoMind + %d GTA + %d FRED",
+                status["ergomind_count"],
+                status["gta_count"],
+                status["fred_count"],
             )
 
-            # Step 3: Organize by sector
+            # Step 3: Organize by sector (off the event loop)
             logger.info("\n📊 Phase 3: Sector Organization")
-            sector_intelligence = self.merger.organize_by_sector(processed_items)
+            sector_intelligence = await asyncio.to_thread(
+                self.merger.organize_by_sector, processed_items
+            )
             status["sectors_covered"] = [s.value for s in sector_intelligence.keys()]
-            logger.info(f"✓ Organized intelligence for {len(sector_intelligence)} sectors")
+            logger.info("✓ Organized intelligence for %d sectors", len(sector_intelligence))
 
             # Step 4: Generate document
             logger.info("\n📝 Phase 4: Document Generation")
-            doc = self.generator.create_report(
-                processed_items, sector_intelligence, datetime.now().strftime("%B %Y")
+            doc = await asyncio.to_thread(
+                self.generator.create_report,
+                processed_items,
+                sector_intelligence,
+                start_time.strftime("%B %Y"),
             )
 
             # Capture AI usage stats if available
@@ -187,33 +292,43 @@ class SolairusIntelligenceGenerator:
                 status["ai_usage"] = ai_usage
                 if ai_usage.get("total_requests", 0) > 0:
                     logger.info(
-                        f"✓ AI-enhanced generation used {ai_usage['total_requests']} API calls (${ai_usage['total_cost_usd']:.4f})"
+                        "✓ AI-enhanced generation used %d API calls ($%.4f)",
+                        ai_usage["total_requests"],
+                        ai_usage["total_cost_usd"],
                     )
 
             # Step 5: Save document
-            filepath = self.generator.save_report(doc)
+            filepath = await asyncio.to_thread(self.generator.save_report, doc)
             status["report_path"] = filepath
-            logger.info(f"✓ Report saved to: {filepath}")
+            logger.info("✓ Report saved to: %s", filepath)
 
             # Step 6: Quality assessment
-            quality_score = self._assess_quality(processed_items, sector_intelligence)
+            quality_score = self._assess_quality(
+                processed_items, sector_intelligence, tallies=tallies
+            )
             status["quality_score"] = quality_score
-            logger.info(f"\n✨ Quality Score: {quality_score:.1%}")
+            logger.info("\n✨ Quality Score: %.1f%%", quality_score * 100)
 
             status["success"] = True
 
             # Generate summary
-            self._print_summary(status, start_time)
+            self._print_summary(status, start_time, datetime.now())
 
         except Exception as e:
-            logger.error(f"Error generating report: {str(e)}")
+            logger.error("Error generating report: %s", e)
             status["errors"].append(str(e))
             status["success"] = False
 
         finally:
-            # Save status for monitoring
+            # Save status for monitoring in the background so the result returns immediately.
+            # The thread gets a snapshot, not the dict returned to the caller.
             self.last_run_status = status
-            self._save_status(status)
+            self._status_seq += 1
+            task = asyncio.create_task(
+                asyncio.to_thread(self._save_status, dict(status), self._status_seq)
+            )
+            self._pending_status_writes.add(task)
+            task.add_done_callback(self._status_write_done)
 
         return status.get("report_path", ""), status
 
@@ -221,136 +336,201 @@ class SolairusIntelligenceGenerator:
         """Limited intelligence gathering for testing"""
         logger.info("Running in TEST mode - executing more queries for content variety")
 
-        # Use MORE queries in test mode to get variety - lower threshold
-        test_templates = [
-            t
-            for t in self.orchestrator.query_templates
-            if t.priority >= 7  # Lower threshold from 8 to 7
-        ][
-            :6
-        ]  # Use 6 queries instead of 3 for more content
-
         results = {}
 
         async with self.client:
             if not await self.client.test_connection():
                 raise Exception("Failed to connect to ErgoMind")
 
-            for template in test_templates:
-                logger.info(f"Testing query: {template.category}")
-                result = await self.client.query_websocket(template.query)
+            # Limit concurrent queries (max 3 at once for rate limiting)
+            semaphore = asyncio.Semaphore(3)
+
+            async def run_template(template: "QueryTemplate") -> Tuple[str, "QueryResult"]:
+                """Execute a single test query with semaphore control"""
+                async with semaphore:
+                    logger.info("Testing query: %s", template.category)
+                    result = await self.client.query_websocket(template.query)
+                    await asyncio.sleep(2)  # Rate limiting
+                    return template.category, result
+
+            completed_results = await asyncio.gather(
+                *(run_template(template) for template in self._test_templates),
+                return_exceptions=True,
+            )
+
+            for completed in completed_results:
+                if isinstance(completed, BaseException):
+                    logger.error("Test query failed with exception: %s", completed)
+                    continue
+                category, result = completed
                 if result.success:
-                    results[template.category] = [result]
-                await asyncio.sleep(2)  # Rate limiting
+                    results[category] = [result]
 
         return results
 
-    def _assess_quality(self, items: List, sector_intel: Dict) -> float:
+    def _assess_quality(
+        self,
+        items: List,
+        sector_intel: Dict,
+        tallies: Optional[ItemTallies] = None,
+    ) -> float:
         """
         Assess the quality of the generated report
         Returns a score between 0 and 1
+
+        Args:
+            items: Intelligence items in the report
+            sector_intel: Intelligence organized by sector
+            tallies: Precomputed ItemTallies for items, if available
         """
         # Handle empty items list gracefully
         if not items:
             return 0.0
 
+        score, max_score = self._assess_item_quality(tallies or ItemTallies.from_items(items))
+
+        # Check for sector coverage (stop counting once the threshold is met)
+        sectors_with_content = 0
+        for sector in sector_intel.values():
+            if sector.items:
+                sectors_with_content += 1
+                if sectors_with_content >= 3:
+                    score += 0.2
+                    break
+        max_score += 0.2
+
+        return score / max_score if max_score > 0 else 0
+
+    def _assess_item_quality(self, tallies: ItemTallies) -> Tuple[float, float]:
+        """
+        Score the quality checks that depend only on the items, not their sector grouping
+
+        Returns:
+            Tuple of (score, max_score)
+        """
+        if not tallies.total:
+            return 0.0, 0.0
+
         score = 0.0
         max_score = 0.0
 
         # Check for minimum content
-        if len(items) >= 5:
-            score += 0.2
-        max_score += 0.2
-
-        # Check for sector coverage
-        sectors_with_content = sum(1 for s in sector_intel.values() if s.items)
-        if sectors_with_content >= 3:
+        if tallies.total >= 5:
             score += 0.2
         max_score += 0.2
 
         # Check relevance scores
-        high_relevance_items = [i for i in items if i.relevance_score > 0.7]
-        if len(high_relevance_items) >= 3:
+        if tallies.high_relevance >= 3:
             score += 0.2
         max_score += 0.2
 
         # Check for "So What" statements
-        items_with_sowhat = [i for i in items if i.so_what_statement]
-        if len(items_with_sowhat) / len(items) > 0.8:
+        if tallies.with_so_what / tallies.total > 0.8:
             score += 0.2
         max_score += 0.2
 
         # Check for action items
-        items_with_actions = [i for i in items if i.action_items]
-        if len(items_with_actions) / len(items) > 0.6:
+        if tallies.with_actions / tallies.total > 0.6:
             score += 0.2
         max_score += 0.2
 
-        return score / max_score if max_score > 0 else 0
+        return score, max_score
 
-    def _print_summary(self, status: Dict, start_time: datetime):
+    def _print_summary(self, status: Dict, start_time: datetime, end_time: datetime):
         """Print a summary of the generation process"""
-        duration = (datetime.now() - start_time).total_seconds()
-
-        print("\n" + "=" * 60)
-        print("REPORT GENERATION SUMMARY")
-        print("=" * 60)
-        print(f"✓ Status: {'SUCCESS' if status['success'] else 'FAILED'}")
-        print(f"✓ Duration: {duration:.1f} seconds")
-        print(f"✓ Queries Executed: {status['queries_executed']}")
-        print(f"✓ Intelligence Items: {status['items_processed']}")
-        print(f"✓ Sectors Covered: {', '.join(status['sectors_covered'])}")
-        print(f"✓ Quality Score: {status['quality_score']:.1%}")
+        duration = (end_time - start_time).total_seconds()
+
+        # Collect lines and write once instead of one print() per line
+        lines: List[str] = []
+        lines.append("\n" + "=" * 60)
+        lines.append("REPORT GENERATION SUMMARY")
+        lines.append("=" * 60)
+        lines.append(f"✓ Status: {'SUCCESS' if status['success'] else 'FAILED'}")
+        lines.append(f"✓ Duration: {duration:.1f} seconds")
+        lines.append(f"✓ Queries Executed: {status['queries_executed']}")
+        lines.append(f"✓ Intelligence Items: {status['items_processed']}")
+        lines.append(f"✓ Sectors Covered: {', '.join(status['sectors_covered'])}")
+        lines.append(f"✓ Quality Score: {status['quality_score']:.1%}")
 
         # Display source status if available
-        if "source_status" in status:
-            source_status = status["source_status"]
-            print("\n📡 Data Sources:")
-            print(
-                f"   ErgoMind: {'✓ Success' if source_status.get('ergomind') == 'success' else '✗ Failed'}"
-            )
-            print(
-                f"   GTA:      {'✓ Success' if source_status.get('gta') == 'success' else '✗ Failed'}"
-            )
-            print(
-                f"   FRED:     {'✓ Success' if source_status.get('fred') == 'success' else '✗ Failed'}"
-            )
+        source_status = status.get("source_status")
+        if source_status is not None:
+            lines.append("\n📡 Data Sources:")
+            for label, source in (("ErgoMind:", "ergomind"), ("GTA:", "gta"), ("FRED:", "fred")):
+                outcome = _SOURCE_OUTCOME[source_status.get(source) == "success"]
+                lines.append(f"   {label:<9} {outcome}")
 
         # Display AI usage if available
-        if "ai_usage" in status and status["ai_usage"].get("total_requests", 0) > 0:
-            ai_usage = status["ai_usage"]
-            print("\n🤖 AI Enhancement:")
-            print(
+        ai_usage = status.get("ai_usage")
+        if ai_usage and ai_usage.get("total_requests", 0) > 0:
+            lines.append("\n🤖 AI Enhancement:")
+            lines.append(
                 f"   API Calls: {ai_usage['total_requests']} ({ai_usage['successful_requests']} successful)"
             )
-            print(
+            lines.append(
                 f"   Tokens: {ai_usage['total_input_tokens']:,} in / {ai_usage['total_output_tokens']:,} out"
             )
-            print(f"   Cost: ${ai_usage['total_cost_usd']:.4f}")
+            lines.append(f"   Cost: ${ai_usage['total_cost_usd']:.4f}")
 
         if status["report_path"]:
-            print("\n📄 Report Location:")
-            print(f"   {status['report_path']}")
+            lines.append("\n📄 Report Location:")
+            lines.append(f"   {status['report_path']}")
 
         if status["errors"]:
-            print("\n⚠️ Errors:")
+            lines.append("\n⚠️ Errors:")
             for error in status["errors"]:
-                print(f"   - {error}")
+                lines.append(f"   - {error}")
 
-        print("=" * 60 + "\n")
+        lines.append("=" * 60 + "\n")
 
-    def _save_status(self, status: Dict):
-        """Save status to a JSON file for monitoring"""
-        status_file = get_status_file_path()
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
 
-        with open(status_file, "w") as f:
-            json.dump(status, f, indent=2, default=str)
+    def _status_write_done(self, task: asyncio.Task) -> None:
+        """Release a finished status write and log it if it failed"""
+        self._pending_status_writes.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.error("Failed to save run status: %s", task.exception())
+
+    def _save_status(self, status: Dict, seq: Optional[int] = None):
+        """
+        Save status to a JSON file for monitoring
+
+        Writes go to a temporary file that replaces the status file, so readers
+        never see a partial write. When seq is given, a write older than the last
+        one saved is skipped.
+        """
+        status_file = str(get_status_file_path())
+        payload = _dumps_status(status)
+
+        with self._status_lock:
+            if seq is not None:
+                if seq < self._status_written_seq:
+                    return
+                self._status_written_seq = seq
+
+            fd, temp_path = tempfile.mkstemp(
+                dir=os.path.dirname(status_file) or None, suffix=".tmp"
+            )
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(payload)
+                os.replace(temp_path, status_file)
+            except BaseException:
+                os.unlink(temp_path)
+                raise
 
 
 async def main():
     """Main entry point for the application"""
     import argparse
 
+    # The CLI log format uses none of these record attributes, so skip collecting them.
+    # Set here rather than at import so library users keep them in their own logs.
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+
     parser = argparse.ArgumentParser(description="Generate Solairus Intelligence Report")
     parser.add_argument("--test", action="store_true", help="Run in test mode with limited queries")
 
@@ -368,6 +548,17 @@ async def main():
         return 1
 
 
+def _run(coro: Any) -> Any:
+    """Run a coroutine on uvloop when it is installed, else the default event loop"""
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.run(coro)
+
+    with asyncio.Runner(loop_factory=uvloop.new_event_loop) as runner:
+        return runner.run(coro)
+
+
 if __name__ == "__main__":
-    exit_code = asyncio.run(main())
+    exit_code = _run(main())
     exit(exit_code)
@@ -293,8 +293,10 @@ class ErgoMindClient:
             score += 0.1
 
         # Check for specific keywords indicating good content
+        # Lowercase once; the generator would otherwise re-lowercase per marker
+        response_lower = response.lower()
         quality_markers = ["according to", "analysis", "trend", "forecast", "impact"]
-        if any(marker in response.lower() for marker in quality_markers):
+        if any(marker in response_lower for marker in quality_markers):
             score += 0.1
 
         return min(score, 1.0)
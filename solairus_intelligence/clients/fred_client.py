@@ -4,19 +4,26 @@ Provides economic indicators to support ErgoMind intelligence with concrete data
 """
 
 import asyncio
+import functools
+import json
 import logging
 import os
+import time
+from collections import OrderedDict
 from dataclasses import dataclass, field
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional
+from datetime import date, timedelta
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple
 
 import aiohttp
 import backoff
 
+from solairus_intelligence.utils.cache import SeriesCache, get_series_cache
+
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class FREDConfig:
     """Configuration for FRED API client"""
 
@@ -24,9 +31,10 @@ class FREDConfig:
     base_url: str = "https://api.stlouisfed.org/fred"
     timeout: int = 30
     max_retries: int = 3
+    requests_per_minute: int = 120  # FRED's published per-key limit
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class FREDObservation:
     """Represents a single FRED data observation"""
 
@@ -38,32 +46,187 @@ class FREDObservation:
     category: str  # 'inflation', 'interest_rate', 'fuel_cost', 'gdp_growth'
 
 
+@dataclass(frozen=True, slots=True)
+class SeriesMeta:
+    """Static description of one configured FRED series"""
+
+    series_id: str
+    series_name: str
+    category: str
+    units: str
+
+
+def _build_series_table(
+    series: Mapping[str, Mapping[str, str]], units: Mapping[str, str]
+) -> Dict[str, Tuple[SeriesMeta, ...]]:
+    """Flatten the per-category series dicts into SeriesMeta records, once at import"""
+    return {
+        category: tuple(
+            SeriesMeta(series_id, series_name, category, units.get(series_id, "Unknown"))
+            for series_id, series_name in members.items()
+        )
+        for category, members in series.items()
+    }
+
+
+# Key economic series for business aviation - focused indicators. Read-only, so
+# no caller can change the shared tables at runtime.
+SERIES: Mapping[str, Mapping[str, str]] = MappingProxyType(
+    {
+        "fuel_costs": MappingProxyType(
+            {
+                "WJFUELUSGULF": "US Gulf Coast Kerosene-Type Jet Fuel Price",
+                "DCOILWTICO": "Crude Oil Prices: West Texas Intermediate (WTI)",
+            }
+        ),
+        "interest_rates": MappingProxyType(
+            {
+                "DFF": "Federal Funds Effective Rate",
+                "DGS10": "10-Year Treasury Constant Maturity Rate",
+                "MORTGAGE30US": "30-Year Fixed Rate Mortgage Average",
+            }
+        ),
+        # OECD Manufacturing Confidence Index, centered around 0: positive values
+        # indicate optimism, negative values pessimism. A leading indicator for
+        # corporate travel and charter demand.
+        "business_confidence": MappingProxyType(
+            {
+                "BSCICP02USM460S": "Business Confidence Index: Manufacturing for United States",
+            }
+        ),
+    }
+)
+
+# Units per series; FRED observation payloads do not carry units
+SERIES_UNITS: Mapping[str, str] = MappingProxyType(
+    {
+        "WJFUELUSGULF": "Dollars per Gallon",
+        "DCOILWTICO": "Dollars per Barrel",
+        "DFF": "Percent",
+        "DGS10": "Percent",
+        "MORTGAGE30US": "Percent",
+        "BSCICP02USM460S": "Percentage Balance",
+    }
+)
+
+# Series records per category, built once at import
+SERIES_BY_CATEGORY = _build_series_table(SERIES, SERIES_UNITS)
+
+
+class InvalidAPIKeyError(Exception):
+    """FRED rejected the configured API key; retrying will not help"""
+
+
+def _is_permanent_error(error: Exception) -> bool:
+    """True for HTTP errors that retrying cannot fix (4xx other than 429)"""
+    return (
+        isinstance(error, aiohttp.ClientResponseError)
+        and 400 <= error.status < 500
+        and error.status != 429
+    )
+
+
+@functools.lru_cache(maxsize=8)
+def _observation_start(days_back: int, day_bucket: str) -> str:
+    """
+    Start of a days_back observation window, as YYYY-MM-DD
+
+    day_bucket is today's ISO date; keying on it lets the cache roll over at midnight.
+    """
+    return (date.fromisoformat(day_bucket) - timedelta(days=days_back)).isoformat()
+
+
+# JSON body parser, bound once: orjson when installed (the "fast" extra), else the stdlib
+try:
+    import orjson
+
+    _loads: Callable[[bytes], Any] = orjson.loads
+except ImportError:
+    _loads = json.loads
+
+
+class _RateLimiter:
+    """Token bucket that spaces request starts to stay under a per-minute cap"""
+
+    def __init__(self, per_minute: int):
+        self._rate = per_minute / 60.0
+        self._capacity = float(per_minute)
+        self._tokens = self._capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """Wait until a request slot is available, then take it"""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(
+                    self._capacity, self._tokens + (now - self._updated) * self._rate
+                )
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self._rate)
+
+
 class FREDClient:
     """
     Client for Federal Reserve Economic Data (FRED) API
     Provides economic indicators to quantify ErgoMind's narrative intelligence
     """
 
-    # Key economic series for business aviation - focused indicators
-    SERIES = {
-        "fuel_costs": {
-            "WJFUELUSGULF": "US Gulf Coast Kerosene-Type Jet Fuel Price",
-            "DCOILWTICO": "Crude Oil Prices: West Texas Intermediate (WTI)",
-        },
-        "interest_rates": {
-            "DFF": "Federal Funds Effective Rate",
-            "DGS10": "10-Year Treasury Constant Maturity Rate",
-            "MORTGAGE30US": "30-Year Fixed Rate Mortgage Average",
-        },
-        "business_confidence": {
-            "BSCICP02USM460S": "Business Confidence Index: Manufacturing for United States",
-        },
+    # Read-only views of the module-level series tables
+    SERIES = SERIES
+    SERIES_UNITS = SERIES_UNITS
+
+    # Lookback windows for categories whose data is published less than monthly
+    DEFAULT_DAYS_BACK = {
+        "gdp_growth": 180,  # Quarterly
+        "business_confidence": 365,  # Monthly OECD data, published with a lag
+    }
+    DEFAULT_LOOKBACK_DAYS = 90
+
+    # Local cache lifetime (seconds) for series that update less than daily
+    CACHE_TTL = {
+        "MORTGAGE30US": 24 * 3600,  # Weekly
+        "BSCICP02USM460S": 3 * 24 * 3600,  # Monthly
+    }
+    DEFAULT_CACHE_TTL = 6 * 3600
+
+    # In-process memo of recent results, so overlapping category requests
+    # within one run share a single fetch per series
+    MEMO_TTL = 60.0
+    MEMO_MAXSIZE = 256
+
+    # Rows requested when only the latest value is needed. FRED reports
+    # holidays and missing data as ".", so ask for a few to find a valid one.
+    LATEST_LOOKUP_LIMIT = 5
+
+    # Sent on every request; FRED only gzips responses when asked
+    SESSION_HEADERS = {
+        "Accept-Encoding": "gzip, deflate",
+        "User-Agent": "solairus-intelligence/1.0",
     }
 
-    def __init__(self, config: Optional[FREDConfig] = None):
-        """Initialize FRED API client"""
+    def __init__(self, config: Optional[FREDConfig] = None, cache: Optional[SeriesCache] = None):
+        """
+        Initialize FRED API client
+
+        Args:
+            config: Client configuration (default: from environment)
+            cache: Series observation cache (default: shared on-disk cache, opened on first use)
+        """
         self.config = config or FREDConfig()
+        self.cache = cache
+        self._base_params = {"api_key": self.config.api_key, "file_type": "json"}
+        self._inflight: Dict[Tuple[str, int], asyncio.Task[Optional[Dict]]] = {}
+        self._memo: OrderedDict[Tuple[str, int], Tuple[float, Dict]] = OrderedDict()
         self.session: Optional[aiohttp.ClientSession] = None
+        self._connector: Optional[aiohttp.TCPConnector] = None
+        # Shared by every request, retries included, so a burst of retries
+        # cannot push the client past FRED's rate limit
+        self._rate_limiter = _RateLimiter(self.config.requests_per_minute)
 
         if not self.config.api_key:
             logger.warning(
@@ -72,210 +235,359 @@ class FREDClient:
 
     async def __aenter__(self):
         """Async context manager entry"""
-        self.session = aiohttp.ClientSession(
-            timeout=aiohttp.ClientTimeout(total=self.config.timeout)
-        )
+        await self.initialize()
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit"""
+        await self.close()
+
+    async def initialize(self):
+        """
+        Open the HTTP session on a keep-alive connection pool.
+
+        Long-running processes can call this once and reuse the session across
+        many requests, calling close() on shutdown.
+        """
+        if self._connector is None or self._connector.closed:
+            self._connector = aiohttp.TCPConnector(
+                limit=64,
+                limit_per_host=32,
+                ttl_dns_cache=300,
+                enable_cleanup_closed=True,
+                keepalive_timeout=75,
+            )
+        if self.session is None or self.session.closed:
+            self.session = aiohttp.ClientSession(
+                connector=self._connector,
+                connector_owner=False,
+                headers=self.SESSION_HEADERS,
+                timeout=aiohttp.ClientTimeout(total=self.config.timeout),
+            )
+
+    async def close(self):
+        """Close the HTTP session and its connection pool"""
         if self.session:
             await self.session.close()
+            self.session = None
+        if self._connector:
+            await self._connector.close()
+            self._connector = None
 
-    @backoff.on_exception(
-        backoff.expo, (aiohttp.ClientError, asyncio.TimeoutError), max_tries=3, max_time=30
-    )
     async def test_connection(self) -> bool:
-        """Test FRED API connectivity with retry logic"""
-        try:
-            logger.info("Testing FRED API connection...")
+        """
+        Test FRED API connectivity with retry logic.
 
-            # Check if API key is configured
-            if not self.config.api_key:
-                logger.error("FRED API key not configured - set FRED_API_KEY environment variable")
-                return False
+        Probes the tiny root-category endpoint rather than a series, so called right
+        after initialize() it also warms a pooled connection for the requests that follow.
+        """
+        logger.info("Testing FRED API connection...")
 
-            # Test with a simple series request
-            url = f"{self.config.base_url}/series"
-            params = {"series_id": "CPIAUCSL", "api_key": self.config.api_key, "file_type": "json"}
+        # Check if API key is configured
+        if not self.config.api_key:
+            logger.error("FRED API key not configured - set FRED_API_KEY environment variable")
+            return False
 
-            if self.session is None:
-                raise RuntimeError(
-                    "Session not initialized. Use async context manager or call initialize()"
-                )
-            async with self.session.get(url, params=params) as response:
-                if response.status == 200:
-                    logger.info("✓ FRED API connection successful")
-                    return True
-                elif response.status == 400:
-                    error_text = await response.text()
-                    logger.error(f"FRED API bad request (check API key): {error_text[:200]}")
-                    return False
-                else:
-                    logger.error(f"FRED API connection failed: HTTP {response.status}")
-                    return False
+        try:
+            await self._probe_connection()
+        except InvalidAPIKeyError as e:
+            logger.error(f"FRED API rejected the API key: {str(e)[:200]}")
+            return False
         except Exception as e:
             logger.error(f"FRED API connection test failed: {str(e)}")
             return False
 
-    async def get_inflation_indicators(self, days_back: int = 90) -> List[FREDObservation]:
-        """
-        Get latest inflation data
+        logger.info("✓ FRED API connection successful")
+        return True
 
-        Args:
-            days_back: Number of days to look back for observations
+    @backoff.on_exception(
+        backoff.expo,
+        (aiohttp.ClientError, asyncio.TimeoutError),
+        max_tries=3,
+        max_time=30,
+        jitter=backoff.full_jitter,
+        max_value=30,
+        giveup=_is_permanent_error,
+    )
+    async def _probe_connection(self) -> None:
+        """Request the root category; raise if FRED does not answer with 200"""
+        url = f"{self.config.base_url}/category"
+        params = {**self._base_params, "category_id": "0"}
 
-        Returns:
-            List of inflation observations
-        """
-        return await self._get_series_category("inflation", days_back)
+        if self.session is None:
+            raise RuntimeError(
+                "Session not initialized. Use async context manager or call initialize()"
+            )
+        await self._rate_limiter.acquire()
+        async with self.session.get(url, params=params) as response:
+            if response.status == 200:
+                return
+            if response.status == 400:
+                error_text = await response.text()
+                if "api_key" in error_text:
+                    raise InvalidAPIKeyError(error_text)
+            response.raise_for_status()
 
-    async def get_interest_rate_data(self, days_back: int = 90) -> List[FREDObservation]:
+    async def get(self, category: str, days_back: Optional[int] = None) -> List[FREDObservation]:
         """
-        Get latest interest rate data
+        Get the latest observations for one category
 
         Args:
-            days_back: Number of days to look back for observations
+            category: Category name from SERIES
+            days_back: Number of days to look back (default: DEFAULT_DAYS_BACK for the
+                category, else DEFAULT_LOOKBACK_DAYS)
 
         Returns:
-            List of interest rate observations
+            List of observations for the category
         """
-        return await self._get_series_category("interest_rates", days_back)
-
-    async def get_aviation_fuel_costs(self, days_back: int = 90) -> List[FREDObservation]:
+        if days_back is None:
+            days_back = self.DEFAULT_DAYS_BACK.get(category, self.DEFAULT_LOOKBACK_DAYS)
+        return await self._get_series_category(category, days_back)
+
+    get_inflation_indicators = functools.partialmethod(get, "inflation")
+    get_interest_rate_data = functools.partialmethod(get, "interest_rates")
+    get_aviation_fuel_costs = functools.partialmethod(get, "fuel_costs")
+    get_gdp_growth_data = functools.partialmethod(get, "gdp_growth")
+    get_employment_data = functools.partialmethod(get, "employment")
+    get_business_confidence_data = functools.partialmethod(get, "business_confidence")
+
+    async def get_indicators(
+        self, days_back_by_category: Mapping[str, int]
+    ) -> Dict[str, List[FREDObservation]]:
         """
-        Get jet fuel and crude oil price data
+        Get the latest observations for several categories in one concurrent fan-out
+
+        Every series of every requested category is fetched in a single gather,
+        then the results are grouped back by category.
 
         Args:
-            days_back: Number of days to look back for observations
+            days_back_by_category: Lookback window in days, keyed by SERIES category
 
         Returns:
-            List of fuel cost observations
+            Observations keyed by category (empty list for unknown categories)
         """
-        return await self._get_series_category("fuel_costs", days_back)
+        jobs: List[Tuple[SeriesMeta, int]] = []
+        for category, days_back in days_back_by_category.items():
+            series = SERIES_BY_CATEGORY.get(category)
+            if series is None:
+                logger.error(f"Unknown category: {category}")
+                continue
+            jobs.extend((meta, days_back) for meta in series)
+
+        results = await asyncio.gather(
+            *(self._get_latest_observation(meta.series_id, days) for meta, days in jobs),
+            return_exceptions=True,
+        )
 
-    async def get_gdp_growth_data(self, days_back: int = 180) -> List[FREDObservation]:
+        grouped: Dict[str, List[FREDObservation]] = {
+            category: [] for category in days_back_by_category
+        }
+        # Failures are collected and logged once, so an outage costs one log call
+        failures: Dict[str, str] = {}
+        for (meta, _), latest in zip(jobs, results):
+            if isinstance(latest, BaseException):
+                failures[meta.series_id] = repr(latest)
+                continue
+            if latest is None:
+                continue
+            try:
+                grouped[meta.category].append(
+                    FREDObservation(
+                        series_id=meta.series_id,
+                        series_name=meta.series_name,
+                        value=float(latest["value"]),
+                        date=latest["date"],
+                        units=meta.units,
+                        category=meta.category,
+                    )
+                )
+            except (KeyError, TypeError, ValueError) as e:
+                failures[meta.series_id] = repr(e)
+                continue
+            logger.info(
+                "✓ Retrieved %s: %s (%s)", meta.series_name, latest["value"], latest["date"]
+            )
+
+        if failures:
+            logger.warning("FRED partial failure: %s", failures)
+
+        return grouped
+
+    async def _get_series_category(self, category: str, days_back: int) -> List[FREDObservation]:
         """
-        Get GDP and growth data (typically quarterly)
+        Get all series for a category, fetching the series concurrently
 
         Args:
-            days_back: Number of days to look back (default 180 for quarterly data)
+            category: Category name from SERIES dict
+            days_back: Number of days to look back
 
         Returns:
-            List of GDP observations
+            List of observations for all series in category
         """
-        return await self._get_series_category("gdp_growth", days_back)
+        return (await self.get_indicators({category: days_back}))[category]
 
-    async def get_employment_data(self, days_back: int = 90) -> List[FREDObservation]:
+    async def _get_latest_observation(self, series_id: str, days_back: int) -> Optional[Dict]:
         """
-        Get employment indicators
+        Get the most recent valid observation, coalescing concurrent and recent
+        identical requests
 
         Args:
-            days_back: Number of days to look back for observations
+            series_id: FRED series identifier
+            days_back: Number of days to look back
 
         Returns:
-            List of employment observations
+            Latest observation dict, or None if the window has no valid value
+        """
+        key = (series_id, days_back)
+
+        memo = self._memo.get(key)
+        if memo is not None and time.monotonic() - memo[0] < self.MEMO_TTL:
+            self._memo.move_to_end(key)
+            return memo[1]
+
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._load_latest_observation(series_id, days_back))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+
+        # Shielded so one cancelled caller does not cancel the fetch for the others
+        latest = await asyncio.shield(task)
+
+        if latest is not None:
+            self._memo[key] = (time.monotonic(), latest)
+            self._memo.move_to_end(key)
+            while len(self._memo) > self.MEMO_MAXSIZE:
+                self._memo.popitem(last=False)
+        return latest
+
+    async def _load_latest_observation(self, series_id: str, days_back: int) -> Optional[Dict]:
         """
-        return await self._get_series_category("employment", days_back)
+        Get the latest observation from the local cache while fresh, else from the API
 
-    async def get_business_confidence_data(self, days_back: int = 365) -> List[FREDObservation]:
+        Cache rows are keyed on days_back rather than the window start date, so an
+        entry stays usable for its full TTL when a run falls on a later day.
         """
-        Get business confidence indicators (OECD Manufacturing Confidence Index).
-        This series is centered around 0:
-        - Positive values indicate optimism (confidence above neutral)
-        - Negative values indicate pessimism (confidence below neutral)
-        - The magnitude shows strength of sentiment
+        observation_start = _observation_start(days_back, date.today().isoformat())
+        if self.cache is None:
+            self.cache = get_series_cache()
+        if not self.cache.enabled:
+            observations = await self._fetch_series_observations(
+                series_id, observation_start, limit=self.LATEST_LOOKUP_LIMIT
+            )
+            return observations[0] if observations else None
+
+        entry = await asyncio.to_thread(self.cache.get_entry, series_id, days_back)
+        ttl = self.CACHE_TTL.get(series_id, self.DEFAULT_CACHE_TTL)
+        if entry is not None and time.time() - entry.fetched_at <= ttl:
+            return entry.observations[0]
+
+        # Stale entries are revalidated; a 304 reuses the cached row without a body
+        recent, last_modified = await self._request_observations(
+            series_id,
+            observation_start,
+            limit=self.LATEST_LOOKUP_LIMIT,
+            if_modified_since=entry.last_modified if entry is not None else None,
+        )
+        if recent is None and entry is not None:
+            await asyncio.to_thread(self.cache.touch, series_id, days_back)
+            return entry.observations[0]
+        if not recent:
+            return None
+        await asyncio.to_thread(self.cache.put, series_id, days_back, recent[:1], last_modified)
+        return recent[0]
 
-        This is a leading indicator for corporate travel and charter demand.
-        When business confidence is high, corporate travel typically increases.
+    async def _get_series_observations(self, series_id: str, days_back: int) -> List[Dict]:
+        """
+        Get the full observation history for a series, oldest first
 
         Args:
-            days_back: Number of days to look back (default 365 for monthly OECD data)
+            series_id: FRED series identifier
+            days_back: Number of days to look back
 
         Returns:
-            List of business confidence observations
+            List of observation dicts from FRED API
         """
-        return await self._get_series_category("business_confidence", days_back)
+        observation_start = _observation_start(days_back, date.today().isoformat())
+        return await self._fetch_series_observations(series_id, observation_start)
 
-    async def _get_series_category(self, category: str, days_back: int) -> List[FREDObservation]:
+    async def _fetch_series_observations(
+        self, series_id: str, observation_start: str, limit: Optional[int] = None
+    ) -> List[Dict]:
         """
-        Get all series for a category
+        Low-level API call to get series observations
 
         Args:
-            category: Category name from SERIES dict
-            days_back: Number of days to look back
+            series_id: FRED series identifier
+            observation_start: Earliest observation date (YYYY-MM-DD)
+            limit: If set, fetch only this many of the newest rows, newest first
 
         Returns:
-            List of observations for all series in category
+            List of observation dicts from FRED API
         """
-        if category not in self.SERIES:
-            logger.error(f"Unknown category: {category}")
-            return []
-
-        observations = []
-        for series_id, series_name in self.SERIES[category].items():
-            try:
-                obs = await self._get_series_observations(series_id, days_back)
-                if obs:
-                    # Get the most recent observation
-                    latest = obs[-1]  # FRED returns chronologically sorted
-                    observations.append(
-                        FREDObservation(
-                            series_id=series_id,
-                            series_name=series_name,
-                            value=float(latest["value"]),
-                            date=latest["date"],
-                            units=obs[0].get("units", "Unknown"),
-                            category=category,
-                        )
-                    )
-                    logger.info(f"✓ Retrieved {series_name}: {latest['value']} ({latest['date']})")
-            except Exception as e:
-                logger.error(f"Failed to retrieve {series_name}: {str(e)}")
-                continue
-
-        return observations
+        observations, _ = await self._request_observations(series_id, observation_start, limit)
+        return observations or []
 
     @backoff.on_exception(
-        backoff.expo, (aiohttp.ClientError, asyncio.TimeoutError), max_tries=3, max_time=60
+        backoff.expo,
+        (aiohttp.ClientError, asyncio.TimeoutError),
+        max_tries=3,
+        max_time=60,
+        jitter=backoff.full_jitter,
+        max_value=30,
     )
-    async def _get_series_observations(self, series_id: str, days_back: int) -> List[Dict]:
+    async def _request_observations(
+        self,
+        series_id: str,
+        observation_start: str,
+        limit: Optional[int] = None,
+        if_modified_since: Optional[str] = None,
+    ) -> Tuple[Optional[List[Dict]], Optional[str]]:
         """
-        Low-level API call to get series observations
+        Request series observations, optionally as a conditional GET
 
         Args:
             series_id: FRED series identifier
-            days_back: Number of days to look back
+            observation_start: Earliest observation date (YYYY-MM-DD)
+            limit: If set, fetch only this many of the newest rows, newest first
+            if_modified_since: Last-Modified value from a previous response
 
         Returns:
-            List of observation dicts from FRED API
+            (observations, Last-Modified header); observations is None on 304 Not Modified
         """
-        observation_start = (datetime.now() - timedelta(days=days_back)).strftime("%Y-%m-%d")
-
         url = f"{self.config.base_url}/series/observations"
         params = {
+            **self._base_params,
             "series_id": series_id,
-            "api_key": self.config.api_key,
-            "file_type": "json",
             "observation_start": observation_start,
             "sort_order": "asc",
         }
+        if limit is not None:
+            params["sort_order"] = "desc"
+            params["limit"] = str(limit)
+        headers = {"If-Modified-Since": if_modified_since} if if_modified_since else None
 
         if self.session is None:
             raise RuntimeError(
                 "Session not initialized. Use async context manager or call initialize()"
             )
-        async with self.session.get(url, params=params) as response:
+        await self._rate_limiter.acquire()
+        async with self.session.get(url, params=params, headers=headers) as response:
+            if response.status == 429 or response.status >= 500:
+                # Transient: raise so the backoff decorator retries with jitter
+                response.raise_for_status()
+            if response.status == 304:
+                return None, if_modified_since
             if response.status == 200:
-                data = await response.json()
+                data = _loads(await response.read())
                 observations = data.get("observations", [])
                 # Filter out non-numeric values (FRED uses '.' for missing data)
                 valid_obs = [obs for obs in observations if obs["value"] != "."]
-                return valid_obs
+                return valid_obs, response.headers.get("Last-Modified")
             elif response.status == 400:
                 error_text = await response.text()
                 logger.error(f"FRED API error for {series_id}: {error_text}")
-                return []
+                return [], None
             else:
                 logger.error(f"FRED API returned status {response.status} for {series_id}")
-                return []
+                return [], None
@@ -6,7 +6,8 @@ Consolidates data previously duplicated in processor.py and pii_sanitizer.py.
 """
 
 from enum import Enum
-from typing import Dict, List, Set
+from types import MappingProxyType
+from typing import Dict, FrozenSet, Mapping, Tuple
 
 
 class ClientSector(Enum):
@@ -21,193 +22,216 @@ class ClientSector(Enum):
     GENERAL = "general"
 
 
-# Master client-to-sector mapping with all relevant metadata
-CLIENT_SECTOR_MAPPING: Dict[ClientSector, Dict] = {
-    ClientSector.TECHNOLOGY: {
-        "companies": ["Cisco", "Palantir", "NantWorks", "Pluralsight"],
-        "keywords": [
-            "technology",
-            "silicon valley",
-            "semiconductor",
-            "AI",
-            "cyber",
-            "data",
-            "software",
-            "cloud",
-            "digital",
-            "innovation",
-            "startup",
-        ],
-        "geopolitical_triggers": [
-            "US-China",
-            "export controls",
-            "data sovereignty",
-            "CHIPS Act",
-            "technology transfer",
-            "intellectual property",
-            "sanctions",
-        ],
-    },
-    ClientSector.FINANCE: {
-        "companies": [
-            "ICONIQ Capital",
-            "Vista Equity",
-            "Affinius Capital",
-            "Ribbit Management",
-            "ArcLight Capital",
-        ],
-        "keywords": [
-            "financial",
-            "investment",
-            "private equity",
-            "capital markets",
-            "interest rates",
-            "inflation",
-            "banking",
-            "credit",
-            "currency",
-            "M&A",
-            "IPO",
-            "valuation",
-        ],
-        "geopolitical_triggers": [
-            "central bank",
-            "Federal Reserve",
-            "ECB",
-            "monetary policy",
-            "Basel",
-            "financial regulation",
-            "capital controls",
-            "sovereign debt",
-        ],
-    },
-    ClientSector.REAL_ESTATE: {
-        "companies": [
-            "Presidium Development",
-            "Restoration Hardware",
-            "Grassy Creek",
-            "Bay Grove Capital",
-        ],
-        "keywords": [
-            "real estate",
-            "construction",
-            "property",
-            "development",
-            "infrastructure",
-            "urban",
-            "commercial",
-            "residential",
-            "REIT",
-        ],
-        "geopolitical_triggers": [
-            "zoning",
-            "housing policy",
-            "infrastructure spending",
-            "construction costs",
-            "supply chain",
-            "materials",
-            "labor",
-        ],
-    },
-    ClientSector.ENTERTAINMENT: {
-        "companies": ["WME IMG", "Anheuser-Busch InBev"],
-        "keywords": [
-            "entertainment",
-            "media",
-            "sports",
-            "content",
-            "streaming",
-            "production",
-            "talent",
-            "broadcasting",
-            "gaming",
-        ],
-        "geopolitical_triggers": [
-            "content regulation",
-            "censorship",
-            "cultural policy",
-            "international co-production",
-            "talent mobility",
-            "visa",
-        ],
-    },
-    ClientSector.ENERGY: {
-        "companies": ["ArcLight Capital Partners"],
-        "keywords": [
-            "energy",
-            "oil",
-            "gas",
-            "renewable",
-            "solar",
-            "wind",
-            "petroleum",
-            "electricity",
-            "power",
-            "utilities",
-            "carbon",
-        ],
-        "geopolitical_triggers": [
-            "OPEC",
-            "energy security",
-            "pipeline",
-            "sanctions",
-            "climate",
-            "Paris Agreement",
-            "energy transition",
-            "grid",
-            "LNG",
-        ],
-    },
-    ClientSector.HEALTHCARE: {
-        "companies": [],
-        "keywords": [
-            "healthcare",
-            "pharmaceutical",
-            "medical",
-            "biotech",
-            "clinical",
-            "hospital",
-            "health policy",
-        ],
-        "geopolitical_triggers": [
-            "FDA",
-            "drug pricing",
-            "healthcare regulation",
-            "pandemic",
-            "medical supply chain",
-        ],
-    },
-    ClientSector.GENERAL: {"companies": [], "keywords": [], "geopolitical_triggers": []},
-}
+# Master client-to-sector mapping with all relevant metadata (read-only, tuple values)
+CLIENT_SECTOR_MAPPING: Mapping[ClientSector, Mapping[str, Tuple[str, ...]]] = MappingProxyType(
+    {
+        ClientSector.TECHNOLOGY: MappingProxyType(
+            {
+                "companies": ("Cisco", "Palantir", "NantWorks", "Pluralsight"),
+                "keywords": (
+                    "technology",
+                    "silicon valley",
+                    "semiconductor",
+                    "AI",
+                    "cyber",
+                    "data",
+                    "software",
+                    "cloud",
+                    "digital",
+                    "innovation",
+                    "startup",
+                ),
+                "geopolitical_triggers": (
+                    "US-China",
+                    "export controls",
+                    "data sovereignty",
+                    "CHIPS Act",
+                    "technology transfer",
+                    "intellectual property",
+                    "sanctions",
+                ),
+            }
+        ),
+        ClientSector.FINANCE: MappingProxyType(
+            {
+                "companies": (
+                    "ICONIQ Capital",
+                    "Vista Equity",
+                    "Affinius Capital",
+                    "Ribbit Management",
+                    "ArcLight Capital",
+                ),
+                "keywords": (
+                    "financial",
+                    "investment",
+                    "private equity",
+                    "capital markets",
+                    "interest rates",
+                    "inflation",
+                    "banking",
+                    "credit",
+                    "currency",
+                    "M&A",
+                    "IPO",
+                    "valuation",
+                ),
+                "geopolitical_triggers": (
+                    "central bank",
+                    "Federal Reserve",
+                    "ECB",
+                    "monetary policy",
+                    "Basel",
+                    "financial regulation",
+                    "capital controls",
+                    "sovereign debt",
+                ),
+            }
+        ),
+        ClientSector.REAL_ESTATE: MappingProxyType(
+            {
+                "companies": (
+                    "Presidium Development",
+                    "Restoration Hardware",
+                    "Grassy Creek",
+                    "Bay Grove Capital",
+                ),
+                "keywords": (
+                    "real estate",
+                    "construction",
+                    "property",
+                    "development",
+                    "infrastructure",
+                    "urban",
+                    "commercial",
+                    "residential",
+                    "REIT",
+                ),
+                "geopolitical_triggers": (
+                    "zoning",
+                    "housing policy",
+                    "infrastructure spending",
+                    "construction costs",
+                    "supply chain",
+                    "materials",
+                    "labor",
+                ),
+            }
+        ),
+        ClientSector.ENTERTAINMENT: MappingProxyType(
+            {
+                "companies": ("WME IMG", "Anheuser-Busch InBev"),
+                "keywords": (
+                    "entertainment",
+                    "media",
+                    "sports",
+                    "content",
+                    "streaming",
+                    "production",
+                    "talent",
+                    "broadcasting",
+                    "gaming",
+                ),
+                "geopolitical_triggers": (
+                    "content regulation",
+                    "censorship",
+                    "cultural policy",
+                    "international co-production",
+                    "talent mobility",
+                    "visa",
+                ),
+            }
+        ),
+        ClientSector.ENERGY: MappingProxyType(
+            {
+                "companies": ("ArcLight Capital Partners",),
+                "keywords": (
+                    "energy",
+                    "oil",
+                    "gas",
+                    "renewable",
+                    "solar",
+                    "wind",
+                    "petroleum",
+                    "electricity",
+                    "power",
+                    "utilities",
+                    "carbon",
+                ),
+                "geopolitical_triggers": (
+                    "OPEC",
+                    "energy security",
+                    "pipeline",
+                    "sanctions",
+                    "climate",
+                    "Paris Agreement",
+                    "energy transition",
+                    "grid",
+                    "LNG",
+                ),
+            }
+        ),
+        ClientSector.HEALTHCARE: MappingProxyType(
+            {
+                "companies": (),
+                "keywords": (
+                    "healthcare",
+                    "pharmaceutical",
+                    "medical",
+                    "biotech",
+                    "clinical",
+                    "hospital",
+                    "health policy",
+                ),
+                "geopolitical_triggers": (
+                    "FDA",
+                    "drug pricing",
+                    "healthcare regulation",
+                    "pandemic",
+                    "medical supply chain",
+                ),
+            }
+        ),
+        ClientSector.GENERAL: MappingProxyType(
+            {"companies": (), "keywords": (), "geopolitical_triggers": ()}
+        ),
+    }
+)
 
 # Flat mapping of company names to sectors for quick lookup
-COMPANY_NAMES_BY_SECTOR: Dict[ClientSector, List[str]] = {
-    sector: mapping["companies"] for sector, mapping in CLIENT_SECTOR_MAPPING.items()
+COMPANY_NAMES_BY_SECTOR: Mapping[ClientSector, Tuple[str, ...]] = MappingProxyType(
+    {sector: mapping["companies"] for sector, mapping in CLIENT_SECTOR_MAPPING.items()}
+)
+
+# Per-sector keyword and trigger lists, flattened once so lookups are a single dict access
+_KEYWORDS_BY_SECTOR: Dict[ClientSector, Tuple[str, ...]] = {
+    sector: mapping.get("keywords", ()) for sector, mapping in CLIENT_SECTOR_MAPPING.items()
 }
+_TRIGGERS_BY_SECTOR: Dict[ClientSector, Tuple[str, ...]] = {
+    sector: mapping.get("geopolitical_triggers", ())
+    for sector, mapping in CLIENT_SECTOR_MAPPING.items()
+}
+
+# Every client company name, built once for O(1) membership tests
+_ALL_COMPANY_NAMES: FrozenSet[str] = frozenset(
+    company for companies in COMPANY_NAMES_BY_SECTOR.values() for company in companies
+)
 
 
-def get_all_company_names() -> Set[str]:
-    """Get all company names across all sectors"""
-    all_names = set()
-    for companies in COMPANY_NAMES_BY_SECTOR.values():
-        all_names.update(companies)
-    return all_names
+def get_all_company_names() -> FrozenSet[str]:
+    """Get all company names across all sectors (shared and immutable)"""
+    return _ALL_COMPANY_NAMES
 
 
-def get_companies_for_sector(sector: ClientSector) -> List[str]:
+def get_companies_for_sector(sector: ClientSector) -> Tuple[str, ...]:
     """Get company names for a specific sector"""
-    return COMPANY_NAMES_BY_SECTOR.get(sector, [])
+    return COMPANY_NAMES_BY_SECTOR.get(sector, ())
 
 
-def get_sector_keywords(sector: ClientSector) -> List[str]:
+def get_sector_keywords(sector: ClientSector) -> Tuple[str, ...]:
     """Get keywords for a specific sector"""
-    mapping = CLIENT_SECTOR_MAPPING.get(sector, {})
-    keywords: List[str] = mapping.get("keywords", [])
-    return keywords
+    return _KEYWORDS_BY_SECTOR.get(sector, ())
 
 
-def get_sector_triggers(sector: ClientSector) -> List[str]:
+def get_sector_triggers(sector: ClientSector) -> Tuple[str, ...]:
     """Get geopolitical triggers for a specific sector"""
-    mapping = CLIENT_SECTOR_MAPPING.get(sector, {})
-    triggers: List[str] = mapping.get("geopolitical_triggers", [])
-    return triggers
+    return _TRIGGERS_BY_SECTOR.get(sector, ())
@@ -4,11 +4,24 @@ Content extraction and parsing for Solairus Intelligence Reports.
 Extracts insights, themes, and structured content from intelligence items.
 """
 
+import heapq
 import re
 from typing import Dict, List, Tuple
 
 from solairus_intelligence.core.processor import IntelligenceItem
 
+# Markdown cleanup patterns for strip_markdown, applied in this order
+_MD_BOLD_RE = re.compile(r"\*\*([^*]+)\*\*")
+_MD_ITALIC_RE = re.compile(r"\*([^*]+)\*")
+_MD_HEADER_RE = re.compile(r"^#+\s*", re.MULTILINE)
+_MD_BULLET_RE = re.compile(r"^\s*[-*•]\s*", re.MULTILINE)
+_WHITESPACE_RE = re.compile(r"\s+")
+
+# Value patterns for extract_value, tried in priority order
+_PERCENT_RE = re.compile(r"(\d+\.?\d*)\s*%")
+_DOLLAR_RE = re.compile(r"\$(\d+\.?\d*)")
+_NUMBER_RE = re.compile(r"(\d+\.?\d*)")
+
 
 class ContentExtractor:
     """
@@ -18,6 +31,43 @@ class ContentExtractor:
     other analytical content from raw intelligence data.
     """
 
+    # Keywords marking an item as a watch factor
+    WATCH_KEYWORDS = (
+        "monitor",
+        "watch",
+        "emerging",
+        "developing",
+        "potential",
+        "risk",
+        "uncertainty",
+        "volatile",
+    )
+
+    # Theme detection keywords, checked in order; the first theme with a hit wins
+    THEME_KEYWORDS = {
+        "Geopolitical Risk": ("conflict", "tension", "sanction", "war", "military"),
+        "Economic Pressure": ("inflation", "recession", "gdp", "economic"),
+        "Trade Policy": ("tariff", "trade", "export", "import", "policy"),
+        "Supply Chain": ("supply", "chain", "shortage", "logistics"),
+        "Regulatory": ("regulation", "compliance", "policy", "law"),
+        "Market Volatility": ("volatility", "market", "price", "fluctuation"),
+        "Technology": ("technology", "cyber", "digital", "innovation"),
+    }
+
+    # Indicator labels keyed by a category substring, checked in order
+    INDICATOR_NAMES = (
+        ("inflation", "CPI Inflation"),
+        ("interest", "Interest Rate"),
+        ("fuel", "Jet Fuel Price"),
+        ("gdp", "GDP Growth"),
+        ("employment", "Employment"),
+        ("confidence", "Consumer Confidence"),
+    )
+
+    # Trend words, matched as substrings so inflected forms ("increased") count
+    UP_WORDS = ("increase", "rise", "grew", "higher", "up", "gain")
+    DOWN_WORDS = ("decrease", "fall", "decline", "lower", "down", "drop")
+
     def extract_analytical_insights(self, items: List[IntelligenceItem]) -> Dict[str, List[str]]:
         """
         Extract analytical insights from intelligence items.
@@ -29,11 +79,9 @@ class ContentExtractor:
         key_findings: List[str] = []
         watch_factors: List[str] = []
 
-        # Sort items by relevance
-        sorted_items = sorted(items, key=lambda x: x.relevance_score, reverse=True)
-
-        # Extract insights from top items
-        for item in sorted_items[:10]:
+        # Extract insights from the 10 most relevant items (same order and
+        # tie-breaking as a full descending sort, without sorting everything)
+        for item in heapq.nlargest(10, items, key=lambda x: x.relevance_score):
             if item.so_what_statement:
                 # Categorize based on content
                 statement = item.so_what_statement.strip()
@@ -56,18 +104,8 @@ class ContentExtractor:
 
     def _is_watch_factor(self, item: IntelligenceItem) -> bool:
         """Check if item should be categorized as watch factor"""
-        watch_keywords = [
-            "monitor",
-            "watch",
-            "emerging",
-            "developing",
-            "potential",
-            "risk",
-            "uncertainty",
-            "volatile",
-        ]
-        content = (item.processed_content + " " + item.so_what_statement).lower()
-        return any(kw in content for kw in watch_keywords)
+        content = item.combined_lower
+        return any(kw in content for kw in self.WATCH_KEYWORDS)
 
     def extract_theme(self, text: str, so_what: str) -> str:
         """
@@ -80,21 +118,12 @@ class ContentExtractor:
         Returns:
             Extracted theme string
         """
-        combined = f"{text} {so_what}".lower()
-
-        # Theme detection keywords
-        themes = {
-            "Geopolitical Risk": ["conflict", "tension", "sanction", "war", "military"],
-            "Economic Pressure": ["inflation", "recession", "gdp", "economic"],
-            "Trade Policy": ["tariff", "trade", "export", "import", "policy"],
-            "Supply Chain": ["supply", "chain", "shortage", "logistics"],
-            "Regulatory": ["regulation", "compliance", "policy", "law"],
-            "Market Volatility": ["volatility", "market", "price", "fluctuation"],
-            "Technology": ["technology", "cyber", "digital", "innovation"],
-        }
+        return self._match_theme(f"{text} {so_what}".lower())
 
-        for theme, keywords in themes.items():
-            if any(kw in combined for kw in keywords):
+    def _match_theme(self, combined_lower: str) -> str:
+        """Return the first theme with a keyword in the lowercased text"""
+        for theme, keywords in self.THEME_KEYWORDS.items():
+            if any(kw in combined_lower for kw in keywords):
                 return theme
 
         return "Strategic Development"
@@ -132,7 +161,7 @@ class ContentExtractor:
         Returns:
             Formatted key finding statement
         """
-        theme = self.extract_theme(item.processed_content, item.so_what_statement)
+        theme = self._match_theme(item.combined_lower)
 
         # Build structured finding
         finding = f"{theme}: {item.so_what_statement}"
@@ -243,15 +272,15 @@ class ContentExtractor:
             return ""
 
         # Remove bold markers
-        text = re.sub(r"\*\*([^*]+)\*\*", r"\1", text)
+        text = _MD_BOLD_RE.sub(r"\1", text)
         # Remove italic markers
-        text = re.sub(r"\*([^*]+)\*", r"\1", text)
+        text = _MD_ITALIC_RE.sub(r"\1", text)
         # Remove headers
-        text = re.sub(r"^#+\s*", "", text, flags=re.MULTILINE)
+        text = _MD_HEADER_RE.sub("", text)
         # Remove bullet markers
-        text = re.sub(r"^\s*[-*•]\s*", "", text, flags=re.MULTILINE)
+        text = _MD_BULLET_RE.sub("", text)
         # Clean extra whitespace
-        text = re.sub(r"\s+", " ", text).strip()
+        text = _WHITESPACE_RE.sub(" ", text).strip()
 
         return text
 
@@ -259,16 +288,7 @@ class ContentExtractor:
         """Extract economic indicator name from item"""
         category = item.category.lower()
 
-        indicator_map = {
-            "inflation": "CPI Inflation",
-            "interest": "Interest Rate",
-            "fuel": "Jet Fuel Price",
-            "gdp": "GDP Growth",
-            "employment": "Employment",
-            "confidence": "Consumer Confidence",
-        }
-
-        for key, name in indicator_map.items():
+        for key, name in self.INDICATOR_NAMES:
             if key in category:
                 return name
 
@@ -279,17 +299,17 @@ class ContentExtractor:
         content = item.processed_content
 
         # Look for percentage patterns
-        percent_match = re.search(r"(\d+\.?\d*)\s*%", content)
+        percent_match = _PERCENT_RE.search(content)
         if percent_match:
             return f"{percent_match.group(1)}%"
 
         # Look for dollar patterns
-        dollar_match = re.search(r"\$(\d+\.?\d*)", content)
+        dollar_match = _DOLLAR_RE.search(content)
         if dollar_match:
             return f"${dollar_match.group(1)}"
 
         # Look for any number
-        num_match = re.search(r"(\d+\.?\d*)", content)
+        num_match = _NUMBER_RE.search(content)
         if num_match:
             return num_match.group(1)
 
@@ -297,14 +317,11 @@ class ContentExtractor:
 
     def determine_trend(self, item: IntelligenceItem) -> str:
         """Determine trend direction from item"""
-        content = (item.processed_content + " " + item.so_what_statement).lower()
-
-        up_words = ["increase", "rise", "grew", "higher", "up", "gain"]
-        down_words = ["decrease", "fall", "decline", "lower", "down", "drop"]
+        content = item.combined_lower
 
-        if any(word in content for word in up_words):
+        if any(word in content for word in self.UP_WORDS):
             return "↑"
-        elif any(word in content for word in down_words):
+        elif any(word in content for word in self.DOWN_WORDS):
             return "↓"
         else:
             return "→"
@@ -218,6 +218,18 @@ class EconomicIndicatorsBuilder:
 class RegionalAssessmentBuilder:
     """Builds the Regional Assessment section"""
 
+    # Lowercase region keywords, checked in order; the first region with a hit wins.
+    # Phrases containing another keyword of the same region are left out, since
+    # they can never change the result: "eu" already covers "europe", "us"
+    # covers "usa" and "africa" covers "south africa".
+    REGION_KEYWORDS = {
+        "Europe": ("eu", "uk", "germany", "france", "italy"),
+        "Asia-Pacific": ("asia", "china", "japan", "korea", "india", "pacific"),
+        "Middle East": ("middle east", "saudi", "uae", "israel", "iran"),
+        "Americas": ("america", "us", "canada", "mexico", "brazil"),
+        "Africa": ("africa", "nigeria", "egypt"),
+    }
+
     def __init__(self, styles: ErgoStyles, content_extractor: ContentExtractor):
         self.styles = styles
         self.content_extractor = content_extractor
@@ -251,15 +263,7 @@ class RegionalAssessmentBuilder:
         """Detect region from item content"""
         content = (item.processed_content + " " + item.raw_content).lower()
 
-        region_keywords = {
-            "Europe": ["europe", "eu", "uk", "germany", "france", "italy"],
-            "Asia-Pacific": ["asia", "china", "japan", "korea", "india", "pacific"],
-            "Middle East": ["middle east", "saudi", "uae", "israel", "iran"],
-            "Americas": ["america", "us", "usa", "canada", "mexico", "brazil"],
-            "Africa": ["africa", "nigeria", "south africa", "egypt"],
-        }
-
-        for region, keywords in region_keywords.items():
+        for region, keywords in self.REGION_KEYWORDS.items():
             if any(kw in content for kw in keywords):
                 return region
 
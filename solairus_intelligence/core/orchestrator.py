@@ -512,55 +512,22 @@ class QueryOrchestrator:
                 logger.error("Failed to connect to FRED API")
                 return results
 
-            # Execute FRED queries for different categories
+            # Fetch every series of every category in one concurrent fan-out
             try:
-                # Gather all categories in parallel
-                inflation_task = fred_client.get_inflation_indicators(days_back=days_back)
-                rates_task = fred_client.get_interest_rate_data(days_back=days_back)
-                fuel_task = fred_client.get_aviation_fuel_costs(days_back=days_back)
-                gdp_task = fred_client.get_gdp_growth_data(days_back=180)  # Quarterly data
-                confidence_task = fred_client.get_business_confidence_data(
-                    days_back=365
-                )  # Monthly OECD data
-
-                gathered_results = await asyncio.gather(
-                    inflation_task,
-                    rates_task,
-                    fuel_task,
-                    gdp_task,
-                    confidence_task,
-                    return_exceptions=True,
+                results = await fred_client.get_indicators(
+                    {
+                        category: fred_client.DEFAULT_DAYS_BACK.get(category, days_back)
+                        for category in (
+                            "inflation",
+                            "interest_rates",
+                            "fuel_costs",
+                            "gdp_growth",
+                            "business_confidence",
+                        )
+                    }
                 )
-
-                # Unpack with explicit typing
-                inflation_result = gathered_results[0]
-                rates_result = gathered_results[1]
-                fuel_result = gathered_results[2]
-                gdp_result = gathered_results[3]
-                confidence_result = gathered_results[4]
-
-                # Store results
-                if not isinstance(inflation_result, Exception) and isinstance(
-                    inflation_result, list
-                ):
-                    results["inflation"] = inflation_result
-                    logger.info(f"FRED inflation: Retrieved {len(inflation_result)} indicators")
-                if not isinstance(rates_result, Exception) and isinstance(rates_result, list):
-                    results["interest_rates"] = rates_result
-                    logger.info(f"FRED interest rates: Retrieved {len(rates_result)} indicators")
-                if not isinstance(fuel_result, Exception) and isinstance(fuel_result, list):
-                    results["fuel_costs"] = fuel_result
-                    logger.info(f"FRED fuel costs: Retrieved {len(fuel_result)} indicators")
-                if not isinstance(gdp_result, Exception) and isinstance(gdp_result, list):
-                    results["gdp_growth"] = gdp_result
-                    logger.info(f"FRED GDP growth: Retrieved {len(gdp_result)} indicators")
-                if not isinstance(confidence_result, Exception) and isinstance(
-                    confidence_result, list
-                ):
-                    results["business_confidence"] = confidence_result
-                    logger.info(
-                        f"FRED business confidence: Retrieved {len(confidence_result)} indicators"
-                    )
+                for category, observations in results.items():
+                    logger.info(f"FRED {category}: Retrieved {len(observations)} indicators")
 
             except Exception as e:
                 logger.error(f"FRED data gathering error: {str(e)}")
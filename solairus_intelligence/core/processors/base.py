@@ -3,6 +3,7 @@ Base classes and data structures for intelligence processing
 """
 
 from dataclasses import dataclass, field
+from functools import cached_property
 from typing import Dict, List, Optional
 
 from solairus_intelligence.config.clients import ClientSector
@@ -35,6 +36,16 @@ class IntelligenceItem:
     fred_units: Optional[str] = None
     fred_value: Optional[float] = None
 
+    @cached_property
+    def combined_lower(self) -> str:
+        """
+        Lowercased processed content and so-what statement, for keyword checks
+
+        Computed once per item. Items are updated with dataclasses.replace,
+        which builds a new instance, so the cached value never goes stale.
+        """
+        return (self.processed_content + " " + self.so_what_statement).lower()
+
 
 @dataclass
 class SectorIntelligence:
@@ -113,36 +124,33 @@ class BaseProcessor:
         ],
     }
 
+    # (keyword, category) pairs so scoring is a single pass over every keyword
+    _RELEVANCE_TERMS = tuple(
+        (keyword, category)
+        for category, keywords in RELEVANCE_KEYWORDS.items()
+        for keyword in keywords
+    )
+
     def calculate_base_relevance(self, text: str) -> float:
         """Calculate base relevance score (0-1) for Solairus"""
         score = 0.0
         text_lower = text.lower()
 
+        matches = dict.fromkeys(self.RELEVANCE_KEYWORDS, 0)
+        for keyword, category in self._RELEVANCE_TERMS:
+            if keyword in text_lower:
+                matches[category] += 1
+
         # Direct aviation relevance (highest weight)
-        aviation_matches = sum(
-            1 for kw in self.RELEVANCE_KEYWORDS["aviation_direct"] if kw in text_lower
-        )
-        score += min(aviation_matches * 0.15, 0.4)
+        score += min(matches["aviation_direct"] * 0.15, 0.4)
 
         # Indirect aviation relevance
-        indirect_matches = sum(
-            1 for kw in self.RELEVANCE_KEYWORDS["aviation_indirect"] if kw in text_lower
-        )
-        score += min(indirect_matches * 0.1, 0.2)
+        score += min(matches["aviation_indirect"] * 0.1, 0.2)
 
         # Business impact relevance
-        business_matches = sum(
-            1 for kw in self.RELEVANCE_KEYWORDS["business_impact"] if kw in text_lower
-        )
-        score += min(business_matches * 0.08, 0.2)
+        score += min(matches["business_impact"] * 0.08, 0.2)
 
         # Risk/opportunity indicators
-        risk_matches = sum(
-            1 for kw in self.RELEVANCE_KEYWORDS["risk_indicators"] if kw in text_lower
-        )
-        opportunity_matches = sum(
-            1 for kw in self.RELEVANCE_KEYWORDS["opportunity_indicators"] if kw in text_lower
-        )
-        score += min((risk_matches + opportunity_matches) * 0.05, 0.2)
+        score += min((matches["risk_indicators"] + matches["opportunity_indicators"]) * 0.05, 0.2)
 
         return min(score, 1.0)
@@ -6,13 +6,18 @@ Handles processing of ErgoMind Flashpoints Forum data
 import logging
 import re
 from dataclasses import replace
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 from solairus_intelligence.config.clients import CLIENT_SECTOR_MAPPING, ClientSector
 from solairus_intelligence.core.processors.base import BaseProcessor, IntelligenceItem
 
 logger = logging.getLogger(__name__)
 
+_WHITESPACE_RE = re.compile(r"\s+")
+_ELLIPSIS_RE = re.compile(r"\.{3,}")
+_REPEATED_PERIOD_RE = re.compile(r"\.{2,}")
+_DIGIT_RE = re.compile(r"\d")
+
 
 class ErgoMindProcessor(BaseProcessor):
     """
@@ -20,8 +25,43 @@ class ErgoMindProcessor(BaseProcessor):
     Transforms raw responses into actionable insights with "So What" analysis
     """
 
+    # Hedging phrases; sentences containing any of these are dropped
+    HEDGING_PATTERNS = (
+        "has not identified",
+        "have not identified",
+        "no evidence of",
+        "does not appear",
+        "not identified",
+        "no significant new",
+        "no major new",
+        "unclear whether",
+        "insufficient data",
+        "cannot determine",
+        "remains unclear",
+    )
+
+    # Lowercase indicators marking a sentence as worth keeping in long summaries
+    PRIORITY_INDICATORS = (
+        "significant",
+        "major",
+        "critical",
+        "important",
+        "key",
+        "forecast",
+        "expect",
+        "likely",
+        "will",
+        "could",
+        "increase",
+        "decrease",
+        "rise",
+        "fall",
+        "growth",
+    )
+
     def __init__(self):
         self.client_mapping = CLIENT_SECTOR_MAPPING
+        self._sector_terms = self._build_sector_terms()
         self.ai_generator = None
         self._initialize_ai_generator()
 
@@ -95,39 +135,22 @@ class ErgoMindProcessor(BaseProcessor):
 
     def _clean_and_structure(self, text: str) -> str:
         """Clean and structure raw text for presentation"""
-        text = re.sub(r"\s+", " ", text).strip()
+        text = _WHITESPACE_RE.sub(" ", text).strip()
         text = text.replace("..", ".")
-        text = re.sub(r"\.{3,}", "...", text)
+        text = _ELLIPSIS_RE.sub("...", text)
 
         sentences = text.split(". ")
         sentences = [s[0].upper() + s[1:] if s else s for s in sentences]
         text = ". ".join(sentences)
 
         # Remove hedging language
-        hedging_patterns = [
-            "has not identified",
-            "have not identified",
-            "no evidence of",
-            "does not appear",
-            "not identified",
-            "no significant new",
-            "no major new",
-            "unclear whether",
-            "insufficient data",
-            "cannot determine",
-            "remains unclear",
+        filtered_sentences = [
+            sentence for sentence in text.split(". ") if not self._is_hedging(sentence.lower())
         ]
 
-        sentences = text.split(". ")
-        filtered_sentences = []
-        for sentence in sentences:
-            sentence_lower = sentence.lower()
-            if not any(pattern in sentence_lower for pattern in hedging_patterns):
-                filtered_sentences.append(sentence)
-
         if filtered_sentences:
             text = ". ".join(filtered_sentences)
-            text = re.sub(r"\.{2,}", ".", text)
+            text = _REPEATED_PERIOD_RE.sub(".", text)
 
         if len(text) > 500 and "•" not in text:
             sentences = text.split(". ")
@@ -138,57 +161,55 @@ class ErgoMindProcessor(BaseProcessor):
 
         return text
 
+    def _is_hedging(self, sentence_lower: str) -> bool:
+        """Check a lowercased sentence for hedging language, stopping at the first hit"""
+        for pattern in self.HEDGING_PATTERNS:
+            if pattern in sentence_lower:
+                return True
+        return False
+
     def _extract_key_sentences(self, sentences: List[str]) -> List[str]:
         """Extract the most important sentences from a list"""
-        priority_indicators = [
-            "significant",
-            "major",
-            "critical",
-            "important",
-            "key",
-            "forecast",
-            "expect",
-            "likely",
-            "will",
-            "could",
-            "increase",
-            "decrease",
-            "rise",
-            "fall",
-            "growth",
-        ]
-
         key_sentences = []
         for sentence in sentences:
             sentence_lower = sentence.lower()
-            if any(indicator in sentence_lower for indicator in priority_indicators):
+            if any(indicator in sentence_lower for indicator in self.PRIORITY_INDICATORS):
                 key_sentences.append(sentence)
 
         return key_sentences[:5] if len(key_sentences) > 5 else key_sentences
 
-    def _identify_affected_sectors(self, text: str) -> List[ClientSector]:
-        """Identify which client sectors are affected by this intelligence"""
-        affected = []
-        text_lower = text.lower()
+    def _build_sector_terms(self) -> List[Tuple[ClientSector, Tuple[Tuple[str, int], ...]]]:
+        """
+        Flatten the client mapping into weighted search terms per sector
 
+        Keywords score 1 and geopolitical triggers score 2. Triggers are
+        lowercased here once rather than on every call.
+        """
+        sector_terms = []
         for sector, mapping in self.client_mapping.items():
             if sector == ClientSector.GENERAL:
                 continue
+            terms = [(keyword, 1) for keyword in mapping.get("keywords", [])]
+            terms.extend(
+                (trigger.lower(), 2) for trigger in mapping.get("geopolitical_triggers", [])
+            )
+            sector_terms.append((sector, tuple(terms)))
+        return sector_terms
 
-            sector_score = 0
-            keywords = mapping.get("keywords", [])
-            triggers = mapping.get("geopolitical_triggers", [])
-
-            for keyword in keywords:
-                if keyword in text_lower:
-                    sector_score += 1
-
-            for trigger in triggers:
-                if trigger.lower() in text_lower:
-                    sector_score += 2
+    def _identify_affected_sectors(self, text: str) -> List[ClientSector]:
+        """Identify which client sectors are affected by this intelligence"""
+        affected = []
+        text_lower = text.lower()
 
-            if sector_score >= 2:
-                affected.append(sector)
+        for sector, terms in self._sector_terms:
+            sector_score = 0
+            for term, weight in terms:
+                if term in text_lower:
+                    sector_score += weight
+                    # Stop scanning this sector once it qualifies
+                    if sector_score >= 2:
+                        affected.append(sector)
+                        break
 
         if not affected and self.calculate_base_relevance(text) > 0.5:
             affected.append(ClientSector.GENERAL)
@@ -265,7 +286,7 @@ class ErgoMindProcessor(BaseProcessor):
         if "•" in processed_content or "\n" in processed_content:
             confidence += 0.1
 
-        if any(char.isdigit() for char in processed_content):
+        if _DIGIT_RE.search(processed_content):
             confidence += 0.1
 
         if 100 < len(processed_content) < 1000:
@@ -5,7 +5,7 @@ Handles processing of trade intervention data
 
 import logging
 from datetime import datetime
-from typing import List
+from typing import Iterable, List, Tuple
 
 from solairus_intelligence.config.clients import ClientSector
 from solairus_intelligence.core.processors.base import BaseProcessor, IntelligenceItem
@@ -13,6 +13,20 @@ from solairus_intelligence.core.processors.base import BaseProcessor, Intelligen
 logger = logging.getLogger(__name__)
 
 
+def _minimal_terms(terms: Iterable[str]) -> Tuple[str, ...]:
+    """
+    Drop terms that contain another term from the same list
+
+    For an any()-style substring check these can never change the result:
+    wherever "crude oil" occurs, "oil" has already matched.
+    """
+    kept: List[str] = []
+    for term in sorted(dict.fromkeys(terms), key=len):
+        if not any(shorter in term for shorter in kept):
+            kept.append(term)
+    return tuple(kept)
+
+
 class GTAProcessor(BaseProcessor):
     """Processor for Global Trade Alert intervention data"""
 
@@ -88,6 +102,11 @@ class GTAProcessor(BaseProcessor):
         ],
     }
 
+    # Keywords actually scanned per sector, with redundant longer phrases removed
+    _SECTOR_MATCH_TERMS = {
+        sector: _minimal_terms(keywords) for sector, keywords in GTA_SECTOR_MAPPING.items()
+    }
+
     def process_intervention(
         self, intervention, category: str = "trade_intervention"
     ) -> IntelligenceItem:
@@ -239,7 +258,7 @@ class GTAProcessor(BaseProcessor):
         sector_strings = [str(s) for s in affected_sectors if s]
         sector_text = " ".join(sector_strings).lower()
 
-        for client_sector, keywords in self.GTA_SECTOR_MAPPING.items():
+        for client_sector, keywords in self._SECTOR_MATCH_TERMS.items():
             if any(kw in sector_text for kw in keywords):
                 sectors.add(client_sector)
 
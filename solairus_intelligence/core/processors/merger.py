@@ -3,15 +3,30 @@ Intelligence Merger
 Combines and deduplicates intelligence from multiple sources
 """
 
+import functools
 import logging
 from datetime import datetime, timedelta
-from typing import Dict, List
+from typing import Dict, FrozenSet, List
 
 from solairus_intelligence.config.clients import ClientSector
 from solairus_intelligence.core.processors.base import IntelligenceItem, SectorIntelligence
 
 logger = logging.getLogger(__name__)
 
+# Every sector, in declaration order; items tagged GENERAL belong to all of them
+_ALL_SECTORS = tuple(ClientSector)
+
+_STOP_WORDS = frozenset(
+    {"the", "and", "for", "this", "that", "with", "from", "have", "will", "are"}
+)
+
+
+@functools.lru_cache(maxsize=4096)
+def _significant_words(content: str) -> FrozenSet[str]:
+    """Lowercased words longer than three characters, excluding stop words"""
+    words = (word.lower() for word in content.split() if len(word) > 3)
+    return frozenset(word for word in words if word not in _STOP_WORDS)
+
 
 class IntelligenceMerger:
     """
@@ -111,14 +126,9 @@ class IntelligenceMerger:
 
     def _calculate_similarity(self, content1: str, content2: str) -> float:
         """Calculate keyword-based similarity between two content strings"""
-        stop_words = {"the", "and", "for", "this", "that", "with", "from", "have", "will", "are"}
-
-        words1 = set(
-            w.lower() for w in content1.split() if len(w) > 3 and w.lower() not in stop_words
-        )
-        words2 = set(
-            w.lower() for w in content2.split() if len(w) > 3 and w.lower() not in stop_words
-        )
+        # Tokenization is cached: dedup compares each kept item against every later one
+        words1 = _significant_words(content1)
+        words2 = _significant_words(content2)
 
         if not words1 or not words2:
             return 0.0
@@ -183,13 +193,19 @@ class IntelligenceMerger:
         """Organize intelligence items by client sector"""
         sector_intel = {}
 
-        for sector in ClientSector:
-            sector_items = [
-                item
-                for item in items
-                if sector in item.affected_sectors or ClientSector.GENERAL in item.affected_sectors
-            ]
+        # Bucket items in one pass, checking each item's GENERAL tag once
+        items_by_sector: Dict[ClientSector, List[IntelligenceItem]] = {
+            sector: [] for sector in _ALL_SECTORS
+        }
+        for item in items:
+            if ClientSector.GENERAL in item.affected_sectors:
+                targets = _ALL_SECTORS
+            else:
+                targets = tuple(s for s in _ALL_SECTORS if s in item.affected_sectors)
+            for sector in targets:
+                items_by_sector[sector].append(item)
 
+        for sector, sector_items in items_by_sector.items():
             if sector_items:
                 sector_items.sort(key=lambda x: x.relevance_score, reverse=True)
 
@@ -3,13 +3,18 @@ Simple File-Based Cache for API Responses
 Caches responses for same-day runs to speed up development and testing
 """
 
+import gzip
 import hashlib
 import json
 import logging
 import os
+import sqlite3
+import time
+from collections import OrderedDict
+from contextlib import closing
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -176,8 +181,330 @@ class ResponseCache:
         }
 
 
-# Global cache instance
+class PromptCache:
+    """
+    Content-addressed cache for AI completions
+
+    - Keyed by a BLAKE2b hash of model, sampling parameters and prompt text
+    - In-memory LRU in front of on-disk JSON files so re-runs skip the API
+    - Can be disabled via environment variable CACHE_ENABLED=false
+    """
+
+    def __init__(
+        self,
+        cache_dir: Optional[Path] = None,
+        ttl_hours: int = 24,
+        max_memory_entries: int = 256,
+    ):
+        """
+        Initialize prompt cache
+
+        Args:
+            cache_dir: Directory to store cache files (default: outputs/.cache/prompts)
+            ttl_hours: Time-to-live in hours for cached completions (default: 24)
+            max_memory_entries: Maximum completions held in the in-memory LRU
+        """
+        self.enabled = os.getenv("CACHE_ENABLED", "true").lower() == "true"
+        self.ttl_hours = ttl_hours
+        self.max_memory_entries = max_memory_entries
+        self._memory: OrderedDict[str, Tuple[datetime, str]] = OrderedDict()
+
+        if cache_dir:
+            self.cache_dir = cache_dir
+        else:
+            from solairus_intelligence.utils.config import get_output_dir
+
+            self.cache_dir = get_output_dir() / ".cache" / "prompts"
+
+        if self.enabled:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def make_key(model: str, temperature: float, max_tokens: int, prompt: str) -> str:
+        """Generate cache key from the request parameters that determine the completion"""
+        payload = f"{model}|{temperature}|{max_tokens}|{prompt}"
+        return hashlib.blake2b(payload.encode(), digest_size=20).hexdigest()
+
+    def _get_cache_path(self, key: str) -> Path:
+        """Get file path for cache key"""
+        return self.cache_dir / f"{key}.json"
+
+    def _is_expired(self, cached_at: datetime) -> bool:
+        """Check whether a completion cached at the given time has outlived the TTL"""
+        return datetime.now() - cached_at > timedelta(hours=self.ttl_hours)
+
+    def _remember(self, key: str, cached_at: datetime, text: str) -> None:
+        """Insert into the in-memory LRU, evicting the oldest entry when full"""
+        self._memory[key] = (cached_at, text)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_memory_entries:
+            self._memory.popitem(last=False)
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        Retrieve a cached completion
+
+        Args:
+            key: Cache key from make_key()
+
+        Returns:
+            Cached completion text or None if not found/expired
+        """
+        if not self.enabled:
+            return None
+
+        cache_path = self._get_cache_path(key)
+
+        memory_entry = self._memory.get(key)
+        if memory_entry is not None:
+            cached_at, text = memory_entry
+            if not self._is_expired(cached_at):
+                self._memory.move_to_end(key)
+                return text
+            # Expired; the disk entry may have been rewritten by another process
+            del self._memory[key]
+
+        if not cache_path.exists():
+            return None
+
+        try:
+            with open(cache_path, "r") as f:
+                cached = json.load(f)
+
+            cached_at = datetime.fromisoformat(cached.get("cached_at", "2000-01-01"))
+            if self._is_expired(cached_at):
+                cache_path.unlink()
+                return None
+
+            text = str(cached["text"])
+            self._remember(key, cached_at, text)
+            logger.debug(f"Prompt cache HIT ({key[:12]})")
+            return text
+
+        # Unreadable, non-JSON (a ValueError) or wrongly shaped files are all misses
+        except (OSError, KeyError, ValueError, TypeError, AttributeError) as e:
+            logger.warning(f"Prompt cache read error: {e}")
+            return None
+
+    def put(self, key: str, text: str, usage: Optional[Dict[str, int]] = None) -> bool:
+        """
+        Store a completion in the cache
+
+        Args:
+            key: Cache key from make_key()
+            text: Completion text
+            usage: Optional token usage of the original request
+
+        Returns:
+            True if cached successfully
+        """
+        if not self.enabled:
+            return False
+
+        cached_at = datetime.now()
+        self._remember(key, cached_at, text)
+
+        try:
+            cache_entry = {
+                "cached_at": cached_at.isoformat(),
+                "usage": usage or {},
+                "text": text,
+            }
+
+            with open(self._get_cache_path(key), "w") as f:
+                json.dump(cache_entry, f)
+
+            return True
+
+        except (TypeError, OSError) as e:
+            logger.warning(f"Prompt cache write error: {e}")
+            return False
+
+
+class SeriesCacheEntry(NamedTuple):
+    """A cached observation payload with its fetch time and HTTP validator"""
+
+    fetched_at: int
+    observations: List[Dict]
+    last_modified: Optional[str]
+
+
+class SeriesCache:
+    """
+    SQLite-backed cache for FRED series observations
+
+    - One row per (series_id, days_back) holding gzip'd JSON observations; keying on
+      the look-back window rather than its start date keeps rows valid across days
+    - Callers pass the maximum age per lookup so slow-moving series live longer
+    - Stores the Last-Modified validator so stale entries can be revalidated
+    - The table is rebuilt when SCHEMA_VERSION changes
+    - Can be disabled via environment variable CACHE_ENABLED=false
+    """
+
+    # 2: rows hold only the latest observation; 3: last_modified; 4: keyed by days_back
+    SCHEMA_VERSION = 4
+
+    def __init__(self, db_path: Optional[Path] = None):
+        """
+        Initialize series cache
+
+        Args:
+            db_path: SQLite database file (default: outputs/.cache/fred_series.sqlite3)
+        """
+        self.enabled = os.getenv("CACHE_ENABLED", "true").lower() == "true"
+
+        if db_path:
+            self.db_path = db_path
+        else:
+            from solairus_intelligence.utils.config import get_output_dir
+
+            self.db_path = get_output_dir() / ".cache" / "fred_series.sqlite3"
+
+        if self.enabled:
+            try:
+                self.db_path.parent.mkdir(parents=True, exist_ok=True)
+                self._ensure_schema()
+            except (sqlite3.Error, OSError) as e:
+                logger.warning(f"Series cache unavailable, disabling: {e}")
+                self.enabled = False
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection; one per call so methods can run in worker threads"""
+        return sqlite3.connect(self.db_path)
+
+    def _ensure_schema(self) -> None:
+        """Create the table, dropping it first if it was written by another schema version"""
+        with closing(self._connect()) as conn, conn:
+            (version,) = conn.execute("PRAGMA user_version").fetchone()
+            if version != self.SCHEMA_VERSION:
+                conn.execute("DROP TABLE IF EXISTS observations")
+                conn.execute(f"PRAGMA user_version = {self.SCHEMA_VERSION}")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS observations ("
+                "series_id TEXT NOT NULL, "
+                "days_back INTEGER NOT NULL, "
+                "fetched_at INTEGER NOT NULL, "
+                "payload BLOB NOT NULL, "
+                "last_modified TEXT, "
+                "PRIMARY KEY (series_id, days_back))"
+            )
+
+    def get_entry(self, series_id: str, days_back: int) -> Optional[SeriesCacheEntry]:
+        """
+        Retrieve a cached entry regardless of age
+
+        Args:
+            series_id: FRED series identifier
+            days_back: Look-back window in days
+
+        Returns:
+            Cached entry or None if not found
+        """
+        if not self.enabled:
+            return None
+
+        try:
+            with closing(self._connect()) as conn:
+                row = conn.execute(
+                    "SELECT fetched_at, payload, last_modified FROM observations "
+                    "WHERE series_id = ? AND days_back = ?",
+                    (series_id, days_back),
+                ).fetchone()
+            if row is None:
+                return None
+
+            return SeriesCacheEntry(row[0], json.loads(gzip.decompress(row[1])), row[2])
+
+        except (sqlite3.Error, OSError, ValueError) as e:
+            logger.warning(f"Series cache read error for {series_id}: {e}")
+            return None
+
+    def get(self, series_id: str, days_back: int, max_age_seconds: int) -> Optional[List[Dict]]:
+        """
+        Retrieve cached observations if present and fresh enough
+
+        Args:
+            series_id: FRED series identifier
+            days_back: Look-back window in days
+            max_age_seconds: Maximum age of the cached entry
+
+        Returns:
+            Cached observations or None if not found/expired
+        """
+        entry = self.get_entry(series_id, days_back)
+        if entry is None or time.time() - entry.fetched_at > max_age_seconds:
+            return None
+
+        logger.debug(f"Series cache HIT for {series_id} ({days_back}d)")
+        return entry.observations
+
+    def put(
+        self,
+        series_id: str,
+        days_back: int,
+        observations: List[Dict],
+        last_modified: Optional[str] = None,
+    ) -> bool:
+        """
+        Store observations in the cache
+
+        Args:
+            series_id: FRED series identifier
+            days_back: Look-back window in days
+            observations: Observation dicts as returned by the FRED API
+            last_modified: Last-Modified header of the response, if any
+
+        Returns:
+            True if cached successfully
+        """
+        if not self.enabled:
+            return False
+
+        try:
+            payload = gzip.compress(json.dumps(observations, separators=(",", ":")).encode())
+            with closing(self._connect()) as conn, conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO observations VALUES (?, ?, ?, ?, ?)",
+                    (series_id, days_back, int(time.time()), payload, last_modified),
+                )
+            return True
+
+        except (sqlite3.Error, TypeError) as e:
+            logger.warning(f"Series cache write error for {series_id}: {e}")
+            return False
+
+    def touch(self, series_id: str, days_back: int) -> bool:
+        """
+        Mark an entry as freshly fetched, e.g. after a 304 Not Modified
+
+        Args:
+            series_id: FRED series identifier
+            days_back: Look-back window in days
+
+        Returns:
+            True if an entry was updated
+        """
+        if not self.enabled:
+            return False
+
+        try:
+            with closing(self._connect()) as conn, conn:
+                cursor = conn.execute(
+                    "UPDATE observations SET fetched_at = ? "
+                    "WHERE series_id = ? AND days_back = ?",
+                    (int(time.time()), series_id, days_back),
+                )
+            return cursor.rowcount > 0
+
+        except sqlite3.Error as e:
+            logger.warning(f"Series cache write error for {series_id}: {e}")
+            return False
+
+
+# Global cache instances
 _cache_instance: Optional[ResponseCache] = None
+_prompt_cache_instance: Optional[PromptCache] = None
+_series_cache_instance: Optional[SeriesCache] = None
 
 
 def get_cache() -> ResponseCache:
@@ -186,3 +513,19 @@ def get_cache() -> ResponseCache:
     if _cache_instance is None:
         _cache_instance = ResponseCache()
     return _cache_instance
+
+
+def get_prompt_cache() -> PromptCache:
+    """Get or create global prompt cache instance"""
+    global _prompt_cache_instance
+    if _prompt_cache_instance is None:
+        _prompt_cache_instance = PromptCache()
+    return _prompt_cache_instance
+
+
+def get_series_cache() -> SeriesCache:
+    """Get or create global FRED series cache instance"""
+    global _series_cache_instance
+    if _series_cache_instance is None:
+        _series_cache_instance = SeriesCache()
+    return _series_cache_instance
@@ -2,6 +2,14 @@
 Unit tests for AI Generator and related components
 """
 
+import asyncio
+import json
+from dataclasses import replace
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import anthropic
+import httpx
 import pytest
 
 from solairus_intelligence.ai.fact_validator import FactValidator
@@ -12,6 +20,44 @@ from solairus_intelligence.ai.generator import (
 )
 from solairus_intelligence.ai.pii_sanitizer import PIISanitizer
 from solairus_intelligence.core.processor import ClientSector, IntelligenceItem
+from solairus_intelligence.utils.cache import PromptCache
+
+
+def _message(text, input_tokens=100, output_tokens=20):
+    """Build a minimal Claude message"""
+    return SimpleNamespace(
+        content=[SimpleNamespace(text=text)],
+        usage=SimpleNamespace(input_tokens=input_tokens, output_tokens=output_tokens),
+    )
+
+
+class _FakeStream:
+    """Async context manager standing in for client.messages.stream(...)"""
+
+    def __init__(self, outcome):
+        self._outcome = outcome
+
+    async def __aenter__(self):
+        if isinstance(self._outcome, BaseException):
+            raise self._outcome
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    async def get_final_message(self):
+        return self._outcome
+
+
+def _streaming_client(*outcomes):
+    """Mock client whose successive stream() calls yield the given messages or errors"""
+    client = MagicMock()
+    client.messages.stream = MagicMock(side_effect=[_FakeStream(o) for o in outcomes])
+    return client
+
+
+def _connection_error():
+    return anthropic.APIConnectionError(request=httpx.Request("POST", "https://api.anthropic.com"))
 
 
 class TestAIConfig:
@@ -33,6 +79,13 @@ class TestAIConfig:
         assert config.max_tokens == 4000
         assert config.temperature == 0.3
 
+    def test_config_rejects_unknown_attributes(self):
+        """Test slotted config catches misspelled settings"""
+        config = AIConfig(api_key="test")
+
+        with pytest.raises(AttributeError):
+            config.max_token = 100
+
 
 class TestAIUsageTracker:
     """Test AI usage tracking"""
@@ -79,6 +132,29 @@ class TestAIUsageTracker:
 
         assert summary["total_cost_usd"] > 0
 
+    def test_cache_hits_excluded_from_averages(self, tracker):
+        """Test cached responses count as hits without diluting token averages"""
+        tracker.log_request(input_tokens=1000, output_tokens=500, success=True)
+        tracker.log_request(0, 0, cache_hit=True)
+
+        summary = tracker.get_summary()
+
+        assert summary["total_requests"] == 2
+        assert summary["cache_hits"] == 1
+        assert summary["avg_input_tokens"] == 1000
+        assert summary["avg_output_tokens"] == 500
+
+    def test_log_batch_matches_individual_logging(self, tracker):
+        """Test batch logging produces the same totals as per-request logging"""
+        records = [(1000, 500, True), (200, 0, False), (3000, 1500, True)]
+        individual = AIUsageTracker()
+        for input_tokens, output_tokens, success in records:
+            individual.log_request(input_tokens, output_tokens, success=success)
+
+        tracker.log_batch(records)
+
+        assert tracker.get_summary() == individual.get_summary()
+
 
 class TestPIISanitizer:
     """Test PII sanitization"""
@@ -196,6 +272,23 @@ class TestSecureAIGenerator:
 
         assert generator.config.enabled is False
 
+    def test_generators_share_client_per_api_key(self):
+        """Test generator instances reuse one pooled client per API key"""
+        first = SecureAIGenerator(AIConfig(api_key="shared_key"))
+        second = SecureAIGenerator(AIConfig(api_key="shared_key"))
+        other = SecureAIGenerator(AIConfig(api_key="other_key"))
+
+        assert first.client is second.client
+        assert first.client is not other.client
+
+    def test_injected_client_is_used(self):
+        """Test an explicitly provided client takes precedence"""
+        client = MagicMock()
+
+        generator = SecureAIGenerator(AIConfig(api_key="test_key"), client=client)
+
+        assert generator.client is client
+
     def test_usage_tracking(self, mock_config):
         """Test usage tracking is initialized"""
         generator = SecureAIGenerator()
@@ -305,6 +398,94 @@ class TestExecutiveSummaryParsing:
         assert len(result["key_findings"]) >= 2
         assert len(result["watch_factors"]) >= 1
 
+    def test_parse_structured_key_finding_fields(self, generator):
+        """Test structured tags and legacy bullets are collected into a finding"""
+        response = """
+        KEY FINDINGS:
+        [SUBHEADER: Trade Policy]
+        [CONTENT: New tariffs announced]
+        [BULLET: **Costs.** Parts prices rise.]
+        - Legacy bullet attached to finding
+        """
+        result = generator._parse_executive_summary_response(response)
+
+        assert result["key_findings"] == [
+            {
+                "subheader": "Trade Policy",
+                "content": "New tariffs announced",
+                "bullets": ["**Costs.** Parts prices rise.", "Legacy bullet attached to finding"],
+            }
+        ]
+
+    def test_parse_structured_watch_factor_fields(self, generator):
+        """Test structured watch factor tags are collected"""
+        response = """
+        WATCH FACTORS:
+        [INDICATOR: Brent crude ($/bbl)]
+        [WHAT: Sustained move above $90]
+        [WHY: Fuel cost exposure]
+        """
+        result = generator._parse_executive_summary_response(response)
+
+        assert result["watch_factors"] == [
+            {
+                "indicator": "Brent crude ($/bbl)",
+                "what_to_watch": "Sustained move above $90",
+                "why_it_matters": "Fuel cost exposure",
+            }
+        ]
+
+    def test_parse_json_response(self, generator):
+        """Test parsing the JSON executive summary format"""
+        response = json.dumps(
+            {
+                "bottom_line": "**Ergo assesses that risk is rising,** across regions.",
+                "key_findings": [
+                    {
+                        "subheader": "Trade Policy",
+                        "content": "Tariffs are expanding.",
+                        "bullets": ["**Costs.** Fuel surcharges rise."],
+                    },
+                    {"subheader": "Empty", "content": ""},
+                ],
+                "watch_factors": [
+                    {
+                        "indicator": "Jet fuel price",
+                        "what_to_watch": "Weekly spot price",
+                        "why_it_matters": "Operating costs",
+                    }
+                ],
+            }
+        )
+
+        result = generator._parse_executive_summary_response(response)
+
+        assert result["bottom_line"] == ["**Ergo assesses that risk is rising,** across regions."]
+        assert result["key_findings"] == [
+            {
+                "subheader": "Trade Policy",
+                "content": "Tariffs are expanding.",
+                "bullets": ["**Costs.** Fuel surcharges rise."],
+            }
+        ]
+        assert result["watch_factors"][0]["indicator"] == "Jet fuel price"
+
+    def test_parse_fenced_json_response(self, generator):
+        """Test JSON wrapped in a markdown code fence is still parsed"""
+        response = '```json\n{"bottom_line": "Summary", "key_findings": []}\n```'
+
+        result = generator._parse_executive_summary_response(response)
+
+        assert result == {"bottom_line": ["Summary"], "key_findings": [], "watch_factors": []}
+
+    def test_parse_invalid_json_falls_back_to_tags(self, generator):
+        """Test malformed JSON is handed to the tagged-text parser"""
+        response = '{"key_findings": [}\nBOTTOM LINE:\n- Summary'
+
+        result = generator._parse_executive_summary_response(response)
+
+        assert result["bottom_line"] == ["Summary"]
+
     def test_parse_bullet_variations(self, generator):
         """Test parsing different bullet formats"""
         response = """
@@ -317,6 +498,392 @@ class TestExecutiveSummaryParsing:
         assert len(result["key_findings"]) >= 2
 
 
+class TestSoWhatBatch:
+    """Test concurrent "So What" batch generation"""
+
+    @pytest.fixture
+    def generator(self):
+        return SecureAIGenerator(AIConfig(api_key="test_key", max_concurrency=2))
+
+    @pytest.fixture
+    def items(self):
+        return [
+            IntelligenceItem(
+                raw_content=f"Item {i}",
+                processed_content=f"Processed item {i}",
+                category="economic",
+                relevance_score=0.8,
+                so_what_statement="",
+            )
+            for i in range(5)
+        ]
+
+    async def test_batch_preserves_order_and_caps_concurrency(self, generator, items):
+        """Test results align with inputs and in-flight calls stay under the cap"""
+        in_flight = 0
+        peak = 0
+
+        async def fake_generate(item, fallback_generator=None):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return f"So what: {item.raw_content}"
+
+        generator.generate_so_what_statement = fake_generate
+
+        results = await generator.generate_so_what_batch(items)
+
+        assert results == [f"So what: Item {i}" for i in range(5)]
+        assert peak <= 2
+
+    async def test_batch_falls_back_on_exception(self, generator, items):
+        """Test a failing item falls back without affecting the others"""
+
+        async def fake_generate(item, fallback_generator=None):
+            if item.raw_content == "Item 1":
+                raise RuntimeError("boom")
+            return "AI statement"
+
+        generator.generate_so_what_statement = fake_generate
+
+        results = await generator.generate_so_what_batch(
+            items[:3], fallback_generator=lambda x: "template"
+        )
+
+        assert results == ["AI statement", "template", "AI statement"]
+
+
+class TestPromptCaching:
+    """Test prompt cache reuse of validated 'So What' responses"""
+
+    @pytest.fixture
+    def generator(self, tmp_path):
+        generator = SecureAIGenerator(AIConfig(api_key="test_key"))
+        generator.prompt_cache = PromptCache(cache_dir=tmp_path)
+        generator.client = _streaming_client(_message("Cached insight"), _message("Cached insight"))
+        return generator
+
+    async def test_identical_prompt_served_from_cache(self, generator, sample_intelligence_items):
+        """Test repeated prompts skip the API call"""
+        item = sample_intelligence_items[0]
+
+        first = await generator.generate_so_what_statement(item)
+        second = await generator.generate_so_what_statement(item)
+
+        assert first == second == "Cached insight"
+        assert generator.client.messages.stream.call_count == 1
+        assert generator.usage_tracker.cache_hits == 1
+
+    async def test_cache_disabled_calls_api(self, generator, sample_intelligence_items):
+        """Test generators without a prompt cache always call the API"""
+        generator.prompt_cache = None
+
+        await generator.generate_so_what_statement(sample_intelligence_items[0])
+        await generator.generate_so_what_statement(sample_intelligence_items[0])
+
+        assert generator.client.messages.stream.call_count == 2
+
+    async def test_rejected_response_not_cached(self, generator, sample_intelligence_items):
+        """Test a response that fails validation is fetched again on the next call"""
+        fabricated = "Revenue grew 47% to $9 billion in Q3 2025 across 1,250 accounts"
+        generator.client = _streaming_client(_message(fabricated), _message(fabricated))
+        results = [
+            await generator.generate_so_what_statement(
+                sample_intelligence_items[0], fallback_generator=lambda item: "template"
+            )
+            for _ in range(2)
+        ]
+
+        assert results == ["template", "template"]
+        assert generator.client.messages.stream.call_count == 2
+        assert generator.usage_tracker.cache_hits == 0
+
+
+class TestExecutiveSummaryGeneration:
+    """Test the executive summary generation pipeline"""
+
+    @pytest.fixture
+    def generator(self):
+        return SecureAIGenerator(AIConfig(api_key="test_key", cache=False))
+
+    def _respond_with(self, generator, text):
+        generator.client = _streaming_client(_message(text))
+
+    async def test_valid_summary_is_returned(self, generator, sample_intelligence_items):
+        """Test a grounded AI summary is returned without fallback"""
+        self._respond_with(
+            generator,
+            "BOTTOM LINE:\n- Export controls on semiconductor equipment\n"
+            "KEY FINDINGS:\n- Tariffs on European goods\n",
+        )
+
+        result = await generator.generate_executive_summary(
+            sample_intelligence_items, fallback_generator=lambda items: {"fallback": True}
+        )
+
+        assert result["bottom_line"] == ["Export controls on semiconductor equipment"]
+        assert result["key_findings"] == ["Tariffs on European goods"]
+
+    async def test_only_prompt_items_are_sanitized(self, generator):
+        """Test sanitization is limited to the items that reach the prompt"""
+        items = [
+            IntelligenceItem(
+                raw_content=f"Item {i}",
+                processed_content=f"Processed item {i}",
+                category="economic",
+                relevance_score=i / 30,
+                confidence=0.9,
+                so_what_statement="",
+            )
+            for i in range(30)
+        ]
+        self._respond_with(generator, "BOTTOM LINE:\n- Summary\n")
+        generator.sanitizer.sanitize_intelligence_items = MagicMock(side_effect=lambda x: x)
+
+        await generator.generate_executive_summary(items)
+
+        (sanitized,) = generator.sanitizer.sanitize_intelligence_items.call_args.args
+        assert len(sanitized) == 20
+        assert {item.raw_content for item in sanitized} == {f"Item {i}" for i in range(10, 30)}
+
+    async def test_unsupported_claims_fall_back(self, generator, sample_intelligence_items):
+        """Test fabricated figures trigger the template fallback"""
+        self._respond_with(
+            generator,
+            "BOTTOM LINE:\n- New sanctions imposed on Russia\n"
+            "KEY FINDINGS:\n- Tariffs on European goods\n",
+        )
+
+        result = await generator.generate_executive_summary(
+            sample_intelligence_items, fallback_generator=lambda items: {"fallback": True}
+        )
+
+        assert result == {"fallback": True}
+
+    async def test_malformed_response_skips_validation(self, generator, sample_intelligence_items):
+        """Test a response missing key findings falls back without validating"""
+        self._respond_with(
+            generator, "BOTTOM LINE:\n- Export controls on semiconductor equipment\n"
+        )
+        generator.validator.validate_executive_summary = MagicMock()
+
+        result = await generator.generate_executive_summary(
+            sample_intelligence_items, fallback_generator=lambda items: {"fallback": True}
+        )
+
+        assert result == {"fallback": True}
+        generator.validator.validate_executive_summary.assert_not_called()
+
+
+class TestExecutiveSummaryCache:
+    """Test fingerprint caching of executive summary responses"""
+
+    @pytest.fixture
+    def generator(self, tmp_path):
+        generator = SecureAIGenerator(AIConfig(api_key="test_key"))
+        generator.prompt_cache = PromptCache(cache_dir=tmp_path)
+        generator.client = _streaming_client(
+            _message(
+                "BOTTOM LINE:\n- Export controls on semiconductor equipment\n"
+                "KEY FINDINGS:\n- Tariffs on European goods\n"
+            )
+        )
+        return generator
+
+    def test_cache_key_ignores_item_order(self, generator, sample_intelligence_items):
+        """Test reordered items produce the same key"""
+        forward = generator._executive_summary_cache_key(sample_intelligence_items)
+        reverse = generator._executive_summary_cache_key(sample_intelligence_items[::-1])
+
+        assert forward == reverse
+
+    def test_cache_key_tracks_content(self, generator, sample_intelligence_items):
+        """Test changed content produces a different key"""
+        before = generator._executive_summary_cache_key(sample_intelligence_items)
+        sample_intelligence_items[0].processed_content += " Update."
+
+        assert generator._executive_summary_cache_key(sample_intelligence_items) != before
+
+    def test_cache_key_ignores_items_outside_prompt(self, generator):
+        """Test items that do not reach the prompt leave the key unchanged"""
+        items = [
+            IntelligenceItem(
+                raw_content=f"Item {i}",
+                processed_content=f"Processed item {i}",
+                category="economic",
+                relevance_score=0.5 + i / 100,
+                confidence=0.9,
+                so_what_statement="",
+            )
+            for i in range(25)
+        ]
+        before = generator._executive_summary_cache_key(items)
+
+        items[0].processed_content += " Update."
+        items.append(replace(items[1], processed_content="New low-relevance item"))
+
+        assert generator._executive_summary_cache_key(items) == before
+
+    async def test_reordered_items_hit_cache(self, generator, sample_intelligence_items):
+        """Test a second summary over reordered items skips the API"""
+        first = await generator.generate_executive_summary(sample_intelligence_items)
+        second = await generator.generate_executive_summary(sample_intelligence_items[::-1])
+
+        assert first == second
+        assert first["bottom_line"] == ["Export controls on semiconductor equipment"]
+        assert generator.client.messages.stream.call_count == 1
+
+    async def test_rejected_summary_not_cached(self, generator, sample_intelligence_items):
+        """Test a summary that fails validation is not replayed from the cache"""
+        unsupported = (
+            "BOTTOM LINE:\n- New sanctions imposed on Russia\n"
+            "KEY FINDINGS:\n- Tariffs on European goods\n"
+        )
+        generator.client = _streaming_client(_message(unsupported), _message(unsupported))
+
+        for _ in range(2):
+            result = await generator.generate_executive_summary(
+                sample_intelligence_items, fallback_generator=lambda items: {"fallback": True}
+            )
+            assert result == {"fallback": True}
+
+        assert generator.client.messages.stream.call_count == 2
+        assert generator.usage_tracker.cache_hits == 0
+
+
+class TestRetryBackoff:
+    """Test backoff between Claude API attempts"""
+
+    @staticmethod
+    def _rate_limit_error(retry_after=None):
+        headers = {"retry-after": retry_after} if retry_after else {}
+        response = httpx.Response(
+            429, headers=headers, request=httpx.Request("POST", "https://api.anthropic.com")
+        )
+        return anthropic.RateLimitError("rate limited", response=response, body=None)
+
+    def test_retry_after_header_is_honored(self):
+        """Test rate-limit delays come from the Retry-After header"""
+        delay = SecureAIGenerator._retry_delay(1, self._rate_limit_error("3"))
+
+        assert delay == 3.0
+
+    def test_retry_after_is_capped(self):
+        """Test oversized Retry-After values are capped"""
+        delay = SecureAIGenerator._retry_delay(1, self._rate_limit_error("600"))
+
+        assert delay == 30.0
+
+    def test_generic_errors_use_full_jitter(self):
+        """Test non rate-limit errors back off within [0, 2**attempt]"""
+        delays = [SecureAIGenerator._retry_delay(2, RuntimeError("boom")) for _ in range(50)]
+
+        assert all(0 <= d <= 4 for d in delays)
+        assert len(set(delays)) > 1
+
+    async def test_call_sleeps_for_retry_after(self):
+        """Test _call_claude_api waits as instructed and records the delay"""
+        generator = SecureAIGenerator(AIConfig(api_key="test_key", max_retries=1, cache=False))
+        generator.client = _streaming_client(self._rate_limit_error("2"), _message("ok"))
+
+        with patch("solairus_intelligence.ai.generator.asyncio.sleep", new=AsyncMock()) as sleep:
+            result, _ = await generator._call_claude_api("prompt")
+
+        assert result == "ok"
+        sleep.assert_awaited_once_with(2.0)
+        assert generator.get_usage_summary()["retry_delay_seconds"] == 2.0
+
+    async def test_call_retries_after_timeout(self):
+        """Test a hung stream is cut off at the configured timeout and retried"""
+        generator = SecureAIGenerator(
+            AIConfig(api_key="test_key", max_retries=1, timeout=0.01, cache=False)
+        )
+        outcomes = iter([None, _message("ok")])
+
+        async def stream_message(prompt, max_tokens):
+            message = next(outcomes)
+            if message is None:
+                await asyncio.Event().wait()
+            return message
+
+        generator._stream_message = AsyncMock(side_effect=stream_message)
+
+        with patch("solairus_intelligence.ai.generator.asyncio.sleep", new=AsyncMock()):
+            result, _ = await generator._call_claude_api("prompt")
+
+        assert result == "ok"
+        assert generator._stream_message.await_count == 2
+
+
+class TestRetryableErrors:
+    """Test which Claude API errors are retried"""
+
+    @pytest.fixture
+    def generator(self):
+        return SecureAIGenerator(AIConfig(api_key="test_key", max_retries=2, cache=False))
+
+    async def test_connection_errors_are_retried(self, generator):
+        """Test transient connection failures get another attempt"""
+        generator.client = _streaming_client(_connection_error(), _message("ok"))
+
+        with patch("solairus_intelligence.ai.generator.asyncio.sleep", new=AsyncMock()):
+            assert (await generator._call_claude_api("prompt"))[0] == "ok"
+
+    async def test_client_errors_fail_without_retry(self, generator):
+        """Test 4xx responses return immediately without backoff"""
+        response = httpx.Response(400, request=httpx.Request("POST", "https://api.anthropic.com"))
+        generator.client = _streaming_client(
+            anthropic.BadRequestError("bad request", response=response, body=None)
+        )
+
+        with patch("solairus_intelligence.ai.generator.asyncio.sleep", new=AsyncMock()) as sleep:
+            assert (await generator._call_claude_api("prompt"))[0] is None
+
+        sleep.assert_not_awaited()
+        assert generator.client.messages.stream.call_count == 1
+        assert generator.get_usage_summary()["failed_requests"] == 1
+
+    async def test_unexpected_errors_fail_without_retry(self, generator):
+        """Test programming errors are not retried"""
+        generator.client = _streaming_client(ValueError("bug"))
+
+        assert (await generator._call_claude_api("prompt"))[0] is None
+        assert generator.client.messages.stream.call_count == 1
+
+
+class TestCircuitBreaker:
+    """Test the circuit breaker around Claude API calls"""
+
+    @pytest.fixture
+    def generator(self):
+        return SecureAIGenerator(
+            AIConfig(api_key="test_key", max_retries=2, breaker_threshold=2, cache=False)
+        )
+
+    async def test_breaker_opens_after_consecutive_failures(self, generator):
+        """Test repeated failures stop retries and skip later calls"""
+        generator.client = _streaming_client(_connection_error(), _connection_error())
+
+        with patch("solairus_intelligence.ai.generator.asyncio.sleep", new=AsyncMock()):
+            assert (await generator._call_claude_api("prompt"))[0] is None
+            assert (await generator._call_claude_api("prompt"))[0] is None
+
+        assert generator.breaker.is_open
+        assert generator.client.messages.stream.call_count == 2
+
+    async def test_success_resets_failures(self, generator):
+        """Test a successful call closes the breaker count"""
+        generator.client = _streaming_client(_connection_error(), _message("ok"))
+
+        with patch("solairus_intelligence.ai.generator.asyncio.sleep", new=AsyncMock()):
+            assert (await generator._call_claude_api("prompt"))[0] == "ok"
+
+        assert not generator.breaker.is_open
+        assert generator.breaker._failures == 0
+
+
 class TestPromptConstruction:
     """Test prompt construction for AI calls"""
 
@@ -359,6 +926,47 @@ class TestPromptConstruction:
         assert len(prompt) > 0
         assert "BOTTOM LINE" in prompt or "intelligence" in prompt.lower()
 
+    def test_executive_summary_prompt_truncates_long_content(self, generator):
+        """Test oversized item content is cut back to the prompt budget"""
+        items = [
+            IntelligenceItem(
+                raw_content="raw",
+                processed_content=f"item{i} " + "x" * 5000,
+                category="economic",
+                relevance_score=0.9,
+                confidence=0.9,
+                so_what_statement="",
+            )
+            for i in range(5)
+        ]
+
+        prompt = generator._build_executive_summary_prompt(items)
+
+        assert prompt.count("x") < 5 * 5000
+        assert all(f"item{i} " in prompt for i in range(5))
+
+    def test_executive_summary_prompt_keeps_short_content(self, generator, sample_items):
+        """Test content within budget is included in full"""
+        prompt = generator._build_executive_summary_prompt(sample_items)
+
+        assert all(item.processed_content in prompt for item in sample_items)
+
+    def test_sector_names_handle_mixed_types(self, generator, sample_items):
+        """Test sector names resolve enums, dicts and strings"""
+        item = sample_items[0]
+        item.affected_sectors = [ClientSector.FINANCE, {"name": "Energy"}, "aviation"]
+
+        prompt = generator._build_so_what_prompt(item)
+
+        assert "Affected Sectors: finance, Energy, aviation" in prompt
+
+    def test_so_what_prompt_defaults_to_general(self, generator, sample_items):
+        """Test items without sectors are labelled general"""
+        item = sample_items[0]
+        item.affected_sectors = []
+
+        assert "Affected Sectors: general" in generator._build_so_what_prompt(item)
+
     def test_build_so_what_prompt(self, generator, sample_items):
         """Test building so-what statement prompt"""
         item = sample_items[0]
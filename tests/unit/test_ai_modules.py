@@ -137,6 +137,22 @@ class TestFactValidator:
 
         assert is_safe is False
 
+    def test_check_for_prohibited_content_reports_missing_data(self, validator):
+        """Test acknowledging missing data is still reported"""
+        text = "Information not available for Q3; it is unclear whether rates will move."
+
+        is_safe, violations = validator.check_for_prohibited_content(text)
+
+        assert is_safe is False
+        assert violations == ["Acknowledgment of missing data (acceptable)"]
+
+    def test_check_for_prohibited_content_case_insensitive(self, validator):
+        """Test patterns match regardless of case"""
+        is_safe, violations = validator.check_for_prohibited_content("IN MY OPINION rates rise")
+
+        assert is_safe is False
+        assert violations == ["First-person language detected"]
+
 
 class TestAIConfig:
     """Test AIConfig dataclass"""
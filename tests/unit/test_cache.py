@@ -4,12 +4,14 @@ Unit tests for cache module
 
 import shutil
 import tempfile
+import time
+from datetime import datetime, timedelta
 from pathlib import Path
 from unittest.mock import patch
 
 import pytest
 
-from solairus_intelligence.utils.cache import ResponseCache
+from solairus_intelligence.utils.cache import PromptCache, ResponseCache, SeriesCache
 
 
 class TestResponseCache:
@@ -278,3 +280,154 @@ class TestCacheMultipleSources:
 
         assert cache.get("ergomind", {"days": 30}) == "30_day_data"
         assert cache.get("ergomind", {"days": 60}) == "60_day_data"
+
+
+class TestPromptCache:
+    """Test suite for PromptCache"""
+
+    @pytest.fixture
+    def temp_cache_dir(self):
+        """Create temporary cache directory"""
+        temp_dir = Path(tempfile.mkdtemp())
+        yield temp_dir
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+    def test_key_depends_on_all_parameters(self):
+        """Test keys change with model, temperature, max_tokens and prompt"""
+        base = PromptCache.make_key("model", 0.3, 500, "prompt")
+
+        assert base == PromptCache.make_key("model", 0.3, 500, "prompt")
+        assert base != PromptCache.make_key("other", 0.3, 500, "prompt")
+        assert base != PromptCache.make_key("model", 0.5, 500, "prompt")
+        assert base != PromptCache.make_key("model", 0.3, 400, "prompt")
+        assert base != PromptCache.make_key("model", 0.3, 500, "prompt2")
+
+    def test_put_and_get_from_disk(self, temp_cache_dir):
+        """Test completions persist across cache instances"""
+        key = PromptCache.make_key("model", 0.3, 500, "prompt")
+        PromptCache(cache_dir=temp_cache_dir).put(key, "completion", {"input_tokens": 10})
+
+        assert PromptCache(cache_dir=temp_cache_dir).get(key) == "completion"
+
+    def test_memory_lru_evicts_oldest(self, temp_cache_dir):
+        """Test in-memory LRU stays within its size cap"""
+        cache = PromptCache(cache_dir=temp_cache_dir, max_memory_entries=2)
+
+        cache.put("a", "1")
+        cache.put("b", "2")
+        cache.get("a")
+        cache.put("c", "3")
+
+        assert list(cache._memory) == ["a", "c"]
+        # Evicted entries are still served from disk
+        assert cache.get("b") == "2"
+
+    def test_memory_entry_expires(self, temp_cache_dir):
+        """Test completions held in memory honour the TTL like those on disk"""
+        cache = PromptCache(cache_dir=temp_cache_dir)
+        cache.put("key", "completion")
+
+        class ThreeDaysLater(datetime):
+            @classmethod
+            def now(cls, tz=None):
+                return datetime.now(tz) + timedelta(days=3)
+
+        with patch("solairus_intelligence.utils.cache.datetime", ThreeDaysLater):
+            assert cache.get("key") is None
+
+        assert "key" not in cache._memory
+        assert not (temp_cache_dir / "key.json").exists()
+
+    @pytest.mark.parametrize("content", ["not json", "[1, 2]", '{"cached_at": 5}'])
+    def test_unreadable_file_is_miss(self, temp_cache_dir, content):
+        """Test corrupt or non-dict cache files are treated as misses"""
+        (temp_cache_dir / "key.json").write_text(content)
+
+        assert PromptCache(cache_dir=temp_cache_dir).get("key") is None
+
+    def test_disabled_via_env(self, temp_cache_dir):
+        """Test prompt cache honours CACHE_ENABLED=false"""
+        with patch.dict("os.environ", {"CACHE_ENABLED": "false"}):
+            cache = PromptCache(cache_dir=temp_cache_dir)
+
+            assert cache.put("key", "text") is False
+            assert cache.get("key") is None
+
+
+class TestSeriesCache:
+    """Test suite for SeriesCache"""
+
+    OBSERVATIONS = [{"date": "2024-10-01", "value": "4.5"}]
+
+    @pytest.fixture
+    def db_path(self, tmp_path):
+        return tmp_path / "series.sqlite3"
+
+    def test_put_and_get(self, db_path):
+        """Stored observations round-trip"""
+        cache = SeriesCache(db_path)
+
+        assert cache.put("DFF", 90, self.OBSERVATIONS) is True
+        assert cache.get("DFF", 90, max_age_seconds=60) == self.OBSERVATIONS
+
+    def test_keyed_by_window(self, db_path):
+        """A different look-back window is a miss"""
+        cache = SeriesCache(db_path)
+        cache.put("DFF", 90, self.OBSERVATIONS)
+
+        assert cache.get("DFF", 30, max_age_seconds=60) is None
+
+    def test_expired_entry_is_miss(self, db_path):
+        """Entries older than the caller's max age are ignored"""
+        cache = SeriesCache(db_path)
+        cache.put("DFF", 90, self.OBSERVATIONS)
+
+        with patch("solairus_intelligence.utils.cache.time.time", return_value=time.time() + 120):
+            assert cache.get("DFF", 90, max_age_seconds=60) is None
+
+    def test_persists_across_instances(self, db_path):
+        """A new instance reads entries written by a previous one"""
+        SeriesCache(db_path).put("DFF", 90, self.OBSERVATIONS)
+
+        assert SeriesCache(db_path).get("DFF", 90, 60) == self.OBSERVATIONS
+
+    def test_schema_change_drops_entries(self, db_path):
+        """Bumping SCHEMA_VERSION discards rows written by the old schema"""
+        SeriesCache(db_path).put("DFF", 90, self.OBSERVATIONS)
+
+        with patch.object(SeriesCache, "SCHEMA_VERSION", SeriesCache.SCHEMA_VERSION + 1):
+            assert SeriesCache(db_path).get("DFF", 90, 60) is None
+
+    def test_entry_keeps_last_modified(self, db_path):
+        """The HTTP validator is stored alongside the payload"""
+        cache = SeriesCache(db_path)
+        cache.put("DFF", 90, self.OBSERVATIONS, "Tue, 01 Oct 2024 12:00:00 GMT")
+
+        entry = cache.get_entry("DFF", 90)
+
+        assert entry.observations == self.OBSERVATIONS
+        assert entry.last_modified == "Tue, 01 Oct 2024 12:00:00 GMT"
+
+    def test_touch_refreshes_expired_entry(self, db_path):
+        """touch() makes an expired entry fresh again"""
+        cache = SeriesCache(db_path)
+        cache.put("DFF", 90, self.OBSERVATIONS)
+        later = time.time() + 120
+
+        with patch("solairus_intelligence.utils.cache.time.time", return_value=later):
+            assert cache.get("DFF", 90, max_age_seconds=60) is None
+            assert cache.touch("DFF", 90) is True
+            assert cache.get("DFF", 90, max_age_seconds=60) == self.OBSERVATIONS
+
+    def test_touch_missing_entry(self, db_path):
+        """touch() reports when there is nothing to refresh"""
+        assert SeriesCache(db_path).touch("DFF", 90) is False
+
+    def test_disabled_via_env(self, db_path):
+        """Series cache honours CACHE_ENABLED=false"""
+        with patch.dict("os.environ", {"CACHE_ENABLED": "false"}):
+            cache = SeriesCache(db_path)
+
+        assert cache.put("DFF", 90, self.OBSERVATIONS) is False
+        assert cache.get("DFF", 90, 60) is None
+        assert not db_path.exists()
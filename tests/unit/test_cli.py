@@ -2,11 +2,16 @@
 Unit tests for CLI module
 """
 
+import asyncio
+import subprocess
+import sys
+import threading
 from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-from solairus_intelligence.cli import SolairusIntelligenceGenerator
+from solairus_intelligence.cli import ItemTallies, SolairusIntelligenceGenerator
 
 
 class TestSolairusIntelligenceGenerator:
@@ -62,6 +67,49 @@ class TestCLIHelpers:
         ]
 
 
+class TestCLIImport:
+    """Test the CLI module's import footprint"""
+
+    def test_import_defers_heavy_dependencies(self):
+        """Test importing the CLI does not load docx or network clients"""
+        code = (
+            "import sys, solairus_intelligence.cli; "
+            "print(sorted(m for m in ('docx', 'aiohttp', 'websockets') if m in sys.modules))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+
+        assert result.stdout.strip() == "[]"
+
+    def test_import_keeps_logging_record_attributes(self):
+        """Test importing the CLI leaves thread and process logging to the host app"""
+        code = (
+            "import logging, solairus_intelligence.cli; "
+            "print(logging.logThreads, logging.logProcesses, logging.logMultiprocessing)"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+
+        assert result.stdout.strip() == "True True True"
+
+
+class TestEventLoopRunner:
+    """Test the CLI's event loop selection"""
+
+    def test_runs_without_uvloop(self, monkeypatch):
+        """Test the default loop is used when uvloop is not installed"""
+        from solairus_intelligence.cli import _run
+
+        monkeypatch.setitem(sys.modules, "uvloop", None)
+
+        async def answer():
+            return 42
+
+        assert _run(answer()) == 42
+
+
 class TestCLIConfiguration:
     """Test CLI configuration"""
 
@@ -71,6 +119,13 @@ class TestCLIConfiguration:
 
         assert gen.config is not None
 
+    def test_test_templates_precomputed(self):
+        """Test test-mode templates are filtered once at construction"""
+        gen = SolairusIntelligenceGenerator()
+
+        assert 0 < len(gen._test_templates) <= 6
+        assert all(t.priority >= 7 for t in gen._test_templates)
+
     def test_custom_config(self):
         """Test generator accepts custom config"""
         from solairus_intelligence.clients.ergomind_client import ErgoMindConfig
@@ -81,6 +136,153 @@ class TestCLIConfiguration:
         assert gen.config is custom_config
 
 
+class TestTestIntelligenceGathering:
+    """Test the limited test-mode ErgoMind gathering"""
+
+    @pytest.fixture
+    def generator(self):
+        gen = SolairusIntelligenceGenerator()
+        gen.client = MagicMock()
+        gen.client.__aenter__ = AsyncMock(return_value=gen.client)
+        gen.client.__aexit__ = AsyncMock(return_value=False)
+        gen.client.test_connection = AsyncMock(return_value=True)
+        return gen
+
+    async def test_queries_run_concurrently(self, generator):
+        """Test test-mode queries overlap, capped at three in flight"""
+        in_flight = 0
+        peak = 0
+
+        async def query(text):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return MagicMock(success=not text.startswith("fail"))
+
+        generator.client.query_websocket = query
+        generator._test_templates = [
+            MagicMock(category=f"cat{i}", query=("fail" if i == 1 else f"q{i}")) for i in range(6)
+        ]
+
+        real_sleep = asyncio.sleep
+        with patch("solairus_intelligence.cli.asyncio.sleep", new=lambda _: real_sleep(0)):
+            results = await generator._test_intelligence_gathering()
+
+        assert list(results) == ["cat0", "cat2", "cat3", "cat4", "cat5"]
+        assert 1 < peak <= 3
+
+
+def _item():
+    from solairus_intelligence.core.processors.base import IntelligenceItem
+
+    return IntelligenceItem(
+        raw_content="raw",
+        processed_content="processed",
+        category="economic",
+        relevance_score=0.8,
+        so_what_statement="",
+        source_type="fred",
+    )
+
+
+class TestProductionReport:
+    """Test the production report pipeline"""
+
+    async def test_sources_processed_from_multi_source_results(self):
+        """Test each source's results are processed and counted"""
+        gen = SolairusIntelligenceGenerator()
+        gen.orchestrator = MagicMock()
+        gen.orchestrator.execute_multi_source_intelligence_gathering = AsyncMock(
+            return_value={
+                "ergomind": {"a": [1, 2]},
+                "gta": {"b": [1]},
+                "fred": {"c": [1, 2, 3]},
+                "source_status": {"ergomind": "success", "gta": "success", "fred": "failed"},
+            }
+        )
+        gen.orchestrator.process_and_filter_results = AsyncMock(return_value=[])
+        gen.orchestrator.process_gta_results = AsyncMock(return_value=[])
+        gen.orchestrator.process_fred_results = AsyncMock(return_value=[_item()])
+        gen.generator = MagicMock(ai_generator=None)
+        gen.generator.save_report.return_value = "/tmp/report.docx"
+        gen._save_status = MagicMock()
+
+        _, status = await gen.generate_monthly_report()
+
+        assert status["success"] is True
+        assert status["queries_executed"] == 6
+        assert status["fred_count"] == 1
+        gen.orchestrator.process_and_filter_results.assert_awaited_once_with({"a": [1, 2]})
+        gen.orchestrator.process_gta_results.assert_awaited_once_with({"b": [1]})
+
+
+class TestTestModeReport:
+    """Test the test-mode report pipeline"""
+
+    @pytest.fixture
+    def generator(self):
+        gen = SolairusIntelligenceGenerator()
+        gen.orchestrator = MagicMock()
+        gen.orchestrator.execute_gta_intelligence_gathering = AsyncMock(return_value={"t": [1]})
+        gen.orchestrator.execute_fred_data_gathering = AsyncMock(return_value={"f": [1, 2]})
+        gen.orchestrator.process_and_filter_results = AsyncMock(return_value=[])
+        gen.orchestrator.process_gta_results = AsyncMock(return_value=[])
+        gen.orchestrator.process_fred_results = AsyncMock(return_value=[])
+        gen.generator = MagicMock(ai_generator=None)
+        gen.generator.save_report.return_value = "/tmp/report.docx"
+        gen._save_status = MagicMock()
+        return gen
+
+    async def test_failed_source_does_not_abort_others(self, generator):
+        """Test an ErgoMind failure is recorded while GTA and FRED still run"""
+        generator._test_intelligence_gathering = AsyncMock(side_effect=Exception("down"))
+
+        _, status = await generator.generate_monthly_report(test_mode=True)
+
+        assert status["source_status"] == {
+            "ergomind": "failed",
+            "gta": "success",
+            "fred": "success",
+        }
+        assert status["queries_executed"] == 3
+        generator.orchestrator.process_and_filter_results.assert_awaited_once_with({})
+
+    async def test_no_items_skips_report_generation(self, generator):
+        """Test an empty collection returns early without rendering a report"""
+        generator._test_intelligence_gathering = AsyncMock(return_value={})
+
+        filepath, status = await generator.generate_monthly_report(test_mode=True)
+        await asyncio.gather(*generator._pending_status_writes)
+
+        assert filepath == ""
+        assert status["success"] is False
+        assert any("No intelligence items" in error for error in status["errors"])
+        generator.generator.create_report.assert_not_called()
+        generator._save_status.assert_called_once()
+        saved, seq = generator._save_status.call_args.args
+        assert saved == status and saved is not status
+        assert seq == 1
+
+    async def test_document_work_runs_off_event_loop(self, generator):
+        """Test report rendering and saving run in worker threads"""
+        generator._test_intelligence_gathering = AsyncMock(return_value={})
+        generator.orchestrator.process_fred_results = AsyncMock(return_value=[_item()])
+        threads = []
+        generator.generator.create_report.side_effect = lambda *args: threads.append(
+            threading.current_thread()
+        )
+        generator.generator.save_report.side_effect = lambda doc: threads.append(
+            threading.current_thread()
+        )
+
+        await generator.generate_monthly_report(test_mode=True)
+
+        assert len(threads) == 2
+        assert threading.main_thread() not in threads
+
+
 class TestQualityAssessment:
     """Test quality assessment logic"""
 
@@ -203,6 +405,37 @@ class TestQualityAssessment:
         # Should get credit for high relevance items
         assert score > 0.3
 
+    def test_quality_score_sector_coverage(self, generator, sample_items, sample_sector_intel):
+        """Test sector coverage only counts sectors that have items"""
+        full = generator._assess_quality(sample_items, sample_sector_intel)
+        for sector in list(sample_sector_intel)[:2]:
+            sample_sector_intel[sector].items = []
+
+        assert generator._assess_quality(sample_items, sample_sector_intel) == pytest.approx(
+            full - 0.2
+        )
+
+    def test_precomputed_tallies_match(self, generator, sample_items, sample_sector_intel):
+        """Test passing precomputed tallies gives the same score"""
+        tallies = ItemTallies.from_items(sample_items)
+
+        assert generator._assess_quality(
+            sample_items, sample_sector_intel, tallies=tallies
+        ) == generator._assess_quality(sample_items, sample_sector_intel)
+
+    def test_item_tallies(self, sample_items):
+        """Test tallies count sources and quality signals"""
+        sample_items[0].source_type = "gta"
+        sample_items[1].so_what_statement = ""
+
+        tallies = ItemTallies.from_items(sample_items)
+
+        assert tallies.total == 5
+        assert tallies.source_counts == {"ergomind": 4, "gta": 1}
+        assert tallies.high_relevance == 4
+        assert tallies.with_so_what == 4
+        assert tallies.with_actions == 5
+
 
 class TestStatusManagement:
     """Test status tracking and persistence"""
@@ -241,6 +474,92 @@ class TestStatusManagement:
         assert saved_status["success"] is True
         assert saved_status["queries_executed"] == 10
 
+    def test_save_status_serializes_datetimes_as_str(self, generator, tmp_path, monkeypatch):
+        """Test datetimes are written in str() form"""
+        import json
+
+        status_file = tmp_path / "status.json"
+        monkeypatch.setattr(
+            "solairus_intelligence.cli.get_status_file_path", lambda: str(status_file)
+        )
+
+        generator._save_status({"start_time": datetime(2025, 1, 1)})
+
+        with open(status_file) as f:
+            assert json.load(f) == {"start_time": "2025-01-01 00:00:00"}
+
+    def test_save_status_without_orjson(self, generator, tmp_path, monkeypatch):
+        """Test the stdlib fallback writes the same UTF-8 JSON that orjson does"""
+        from solairus_intelligence.cli import _dumps_status_json
+
+        status_file = tmp_path / "status.json"
+        monkeypatch.setattr(
+            "solairus_intelligence.cli.get_status_file_path", lambda: str(status_file)
+        )
+        monkeypatch.setattr("solairus_intelligence.cli._dumps_status", _dumps_status_json)
+
+        generator._save_status({"success": False, "start_time": datetime(2025, 1, 1), "ok": "✓"})
+
+        assert status_file.read_text(encoding="utf-8") == (
+            '{"success":false,"start_time":"2025-01-01 00:00:00","ok":"✓"}'
+        )
+
+    def test_status_serializers_agree(self):
+        """Test orjson, when installed, writes the same bytes as the stdlib fallback"""
+        from solairus_intelligence.cli import _dumps_status, _dumps_status_json
+
+        status = {"success": True, "start_time": datetime(2025, 1, 1), "ok": "✓", "errors": []}
+
+        assert _dumps_status(status) == _dumps_status_json(status)
+
+    async def test_status_written_in_background(self, generator, tmp_path, monkeypatch):
+        """Test the status write is scheduled off the event loop and released when done"""
+        status_file = tmp_path / "status.json"
+        monkeypatch.setattr(
+            "solairus_intelligence.cli.get_status_file_path", lambda: str(status_file)
+        )
+        generator._test_intelligence_gathering = AsyncMock(side_effect=RuntimeError("down"))
+        generator.orchestrator = MagicMock()
+        generator.orchestrator.execute_gta_intelligence_gathering = AsyncMock(return_value={})
+        generator.orchestrator.execute_fred_data_gathering = AsyncMock(return_value={})
+        generator.orchestrator.process_and_filter_results = AsyncMock(return_value=[])
+        generator.orchestrator.process_gta_results = AsyncMock(return_value=[])
+        generator.orchestrator.process_fred_results = AsyncMock(return_value=[])
+
+        _, status = await generator.generate_monthly_report(test_mode=True)
+        pending = set(generator._pending_status_writes)
+        await asyncio.gather(*pending)
+
+        assert len(pending) == 1
+        assert not generator._pending_status_writes
+        assert status_file.exists()
+
+    def test_save_status_skips_older_run(self, generator, tmp_path, monkeypatch):
+        """Test a write from an earlier run does not replace a newer one"""
+        import json
+
+        status_file = tmp_path / "status.json"
+        monkeypatch.setattr("solairus_intelligence.cli.get_status_file_path", lambda: status_file)
+
+        generator._save_status({"run": 2}, 2)
+        generator._save_status({"run": 1}, 1)
+
+        with open(status_file) as f:
+            assert json.load(f) == {"run": 2}
+
+    def test_save_status_replaces_file_atomically(self, generator, tmp_path, monkeypatch):
+        """Test the status file is swapped in whole and no temporary file is left"""
+        status_file = tmp_path / "status.json"
+        status_file.write_text('{"run": 0}')
+        monkeypatch.setattr("solairus_intelligence.cli.get_status_file_path", lambda: status_file)
+
+        with patch("solairus_intelligence.cli.os.replace", side_effect=OSError("disk full")):
+            with pytest.raises(OSError):
+                generator._save_status({"run": 1})
+
+        assert status_file.read_text() == '{"run": 0}'
+        assert list(tmp_path.iterdir()) == [status_file]
+
 
 class TestPrintSummary:
     """Test summary printing"""
@@ -262,7 +581,7 @@ class TestPrintSummary:
         }
         start_time = datetime.now()
 
-        generator._print_summary(status, start_time)
+        generator._print_summary(status, start_time, datetime.now())
 
         captured = capsys.readouterr()
         assert "SUCCESS" in captured.out
@@ -270,6 +589,22 @@ class TestPrintSummary:
         assert "10" in captured.out  # items
         assert "85" in captured.out  # quality score percentage
 
+    def test_print_summary_duration(self, generator, capsys):
+        """Test duration is measured between the given start and end times"""
+        status = {
+            "success": True,
+            "queries_executed": 1,
+            "items_processed": 1,
+            "sectors_covered": [],
+            "quality_score": 0.5,
+            "report_path": None,
+            "errors": [],
+        }
+
+        generator._print_summary(status, datetime(2025, 1, 1), datetime(2025, 1, 1, 0, 1, 30))
+
+        assert "Duration: 90.0 seconds" in capsys.readouterr().out
+
     def test_print_summary_with_errors(self, generator, capsys):
         """Test printing summary with errors"""
         status = {
@@ -283,7 +618,7 @@ class TestPrintSummary:
         }
         start_time = datetime.now()
 
-        generator._print_summary(status, start_time)
+        generator._print_summary(status, start_time, datetime.now())
 
         captured = capsys.readouterr()
         assert "FAILED" in captured.out
@@ -308,7 +643,7 @@ class TestPrintSummary:
         }
         start_time = datetime.now()
 
-        generator._print_summary(status, start_time)
+        generator._print_summary(status, start_time, datetime.now())
 
         captured = capsys.readouterr()
         assert "ErgoMind" in captured.out
@@ -335,7 +670,7 @@ class TestPrintSummary:
         }
         start_time = datetime.now()
 
-        generator._print_summary(status, start_time)
+        generator._print_summary(status, start_time, datetime.now())
 
         captured = capsys.readouterr()
         assert "AI Enhancement" in captured.out
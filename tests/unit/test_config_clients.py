@@ -2,6 +2,10 @@
 Unit tests for client configuration module
 """
 
+from collections.abc import Mapping
+
+import pytest
+
 from solairus_intelligence.config.clients import (
     CLIENT_SECTOR_MAPPING,
     COMPANY_NAMES_BY_SECTOR,
@@ -53,9 +57,9 @@ class TestClientSectorMapping:
         """Test mapping has expected structure"""
         for sector, data in CLIENT_SECTOR_MAPPING.items():
             assert isinstance(sector, ClientSector)
-            assert isinstance(data, dict)
+            assert isinstance(data, Mapping)
             assert "companies" in data
-            assert isinstance(data["companies"], list)
+            assert isinstance(data["companies"], tuple)
 
     def test_technology_has_companies(self):
         """Test technology sector has companies defined"""
@@ -67,9 +71,16 @@ class TestClientSectorMapping:
     def test_sectors_have_keywords(self):
         """Test sectors have keywords defined"""
         for sector, data in CLIENT_SECTOR_MAPPING.items():
-            keywords = data.get("keywords", [])
-            # Keywords are optional, but if present should be a list
-            assert isinstance(keywords, list)
+            keywords = data.get("keywords", ())
+            # Keywords are optional, but if present should be a tuple
+            assert isinstance(keywords, tuple)
+
+    def test_mapping_is_read_only(self):
+        """Test the shared mapping cannot be mutated"""
+        with pytest.raises(TypeError):
+            CLIENT_SECTOR_MAPPING[ClientSector.GENERAL] = {}  # type: ignore[index]
+        with pytest.raises(TypeError):
+            CLIENT_SECTOR_MAPPING[ClientSector.TECHNOLOGY]["companies"] = ()  # type: ignore[index]
 
 
 class TestCompanyNamesBySector:
@@ -78,7 +89,7 @@ class TestCompanyNamesBySector:
     def test_mapping_created(self):
         """Test mapping is created"""
         assert COMPANY_NAMES_BY_SECTOR is not None
-        assert isinstance(COMPANY_NAMES_BY_SECTOR, dict)
+        assert isinstance(COMPANY_NAMES_BY_SECTOR, Mapping)
 
     def test_technology_companies_present(self):
         """Test technology companies are present"""
@@ -89,10 +100,14 @@ class TestCompanyNamesBySector:
 class TestGetAllCompanyNames:
     """Test suite for get_all_company_names"""
 
-    def test_returns_set(self):
-        """Test returns a set"""
+    def test_returns_frozenset(self):
+        """Test returns an immutable set"""
         names = get_all_company_names()
-        assert isinstance(names, set)
+        assert isinstance(names, frozenset)
+
+    def test_returns_cached_set(self):
+        """Test the same set is returned on every call"""
+        assert get_all_company_names() is get_all_company_names()
 
     def test_not_empty(self):
         """Test returns non-empty set"""
@@ -111,10 +126,10 @@ class TestGetAllCompanyNames:
 class TestGetCompaniesForSector:
     """Test suite for get_companies_for_sector"""
 
-    def test_returns_list(self):
-        """Test returns a list"""
+    def test_returns_tuple(self):
+        """Test returns a tuple"""
         companies = get_companies_for_sector(ClientSector.TECHNOLOGY)
-        assert isinstance(companies, list)
+        assert isinstance(companies, tuple)
 
     def test_returns_companies_for_technology(self):
         """Test returns companies for technology sector"""
@@ -122,38 +137,48 @@ class TestGetCompaniesForSector:
         assert len(companies) > 0
 
     def test_returns_empty_for_unknown_sector(self):
-        """Test returns empty list for sector not in mapping"""
+        """Test returns empty tuple for sector not in mapping"""
         # Create a mock sector that doesn't exist in mapping
         # This is a boundary test - if sector has no mapping, return empty
         companies = get_companies_for_sector(ClientSector.GENERAL)
-        # Should return list (possibly empty if not configured)
-        assert isinstance(companies, list)
+        # Should return a tuple (possibly empty if not configured)
+        assert isinstance(companies, tuple)
 
 
 class TestGetSectorKeywords:
     """Test suite for get_sector_keywords"""
 
-    def test_returns_list(self):
-        """Test returns a list"""
+    def test_returns_tuple(self):
+        """Test returns a tuple"""
         keywords = get_sector_keywords(ClientSector.TECHNOLOGY)
-        assert isinstance(keywords, list)
+        assert isinstance(keywords, tuple)
 
     def test_returns_empty_for_missing(self):
-        """Test returns empty list when keywords not defined"""
-        # Should return empty list, not raise exception
+        """Test returns empty tuple when keywords not defined"""
+        # Should return an empty tuple, not raise exception
         keywords = get_sector_keywords(ClientSector.GENERAL)
-        assert isinstance(keywords, list)
+        assert isinstance(keywords, tuple)
+
+    def test_matches_mapping(self):
+        """Test keywords come straight from the client mapping"""
+        for sector, data in CLIENT_SECTOR_MAPPING.items():
+            assert get_sector_keywords(sector) == data.get("keywords", ())
 
 
 class TestGetSectorTriggers:
     """Test suite for get_sector_triggers"""
 
-    def test_returns_list(self):
-        """Test returns a list"""
+    def test_returns_tuple(self):
+        """Test returns a tuple"""
         triggers = get_sector_triggers(ClientSector.TECHNOLOGY)
-        assert isinstance(triggers, list)
+        assert isinstance(triggers, tuple)
 
     def test_returns_empty_for_missing(self):
-        """Test returns empty list when triggers not defined"""
+        """Test returns empty tuple when triggers not defined"""
         triggers = get_sector_triggers(ClientSector.GENERAL)
-        assert isinstance(triggers, list)
+        assert isinstance(triggers, tuple)
+
+    def test_matches_mapping(self):
+        """Test triggers come straight from the client mapping"""
+        for sector, data in CLIENT_SECTOR_MAPPING.items():
+            assert get_sector_triggers(sector) == data.get("geopolitical_triggers", ())
@@ -504,6 +504,19 @@ class TestRegionalAssessmentBuilder:
         region = builder._detect_region(item)
         assert region == "Global"
 
+    def test_detect_region_matches_longer_place_names(self, builder):
+        """Test place names covered by a shorter keyword are still detected"""
+        item = IntelligenceItem(
+            raw_content="South Africa",
+            processed_content="Mining update",
+            category="general",
+            relevance_score=0.8,
+            so_what_statement="Impact",
+            affected_sectors=[ClientSector.GENERAL],
+        )
+        region = builder._detect_region(item)
+        assert region == "Africa"
+
 
 class TestSectorSectionBuilder:
     """Test SectorSectionBuilder class"""
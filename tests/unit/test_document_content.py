@@ -78,6 +78,31 @@ class TestContentExtractor:
         assert len(insights["key_findings"]) <= 5
         assert len(insights["watch_factors"]) <= 3
 
+    def test_insights_categorize_items(self, extractor, sample_items):
+        """Test each statement lands in the expected category"""
+        insights = extractor.extract_analytical_insights(sample_items)
+
+        assert insights["bottom_line"] == ["Monitor for route changes and insurance costs"]
+        assert insights["key_findings"] == ["Budget for higher operating costs"]
+        assert insights["watch_factors"] == ["Watch for supply chain impact"]
+
+    def test_insights_use_top_ten_by_relevance(self, extractor):
+        """Test only the 10 most relevant items are used, ties kept in input order"""
+        items = [
+            IntelligenceItem(
+                raw_content="",
+                processed_content=f"Finding {i}",
+                category="economic",
+                relevance_score=0.1 if i < 5 else 0.5,
+                so_what_statement=f"Statement {i}",
+            )
+            for i in range(15)
+        ]
+
+        insights = extractor.extract_analytical_insights(items)
+
+        assert insights["key_findings"] == [f"Statement {i}" for i in range(5, 10)]
+
 
 class TestThemeExtraction:
     """Test theme extraction functionality"""
@@ -215,6 +240,11 @@ class TestUtilities:
         result = extractor.strip_markdown("## Heading\nContent")
         assert "##" not in result
 
+    def test_strip_markdown_bold_inside_italic(self, extractor):
+        """Test bold is stripped before italic so nested markers both go"""
+        result = extractor.strip_markdown("*a **b** c*\n- item")
+        assert result == "a b c item"
+
     def test_strip_markdown_empty(self, extractor):
         """Test empty string handling"""
         result = extractor.strip_markdown("")
@@ -256,6 +286,17 @@ class TestEconomicIndicators:
         value = extractor.extract_value(econ_item)
         assert "3.5" in value or "%" in value
 
+    def test_extract_value_prefers_percentage(self, extractor):
+        """Test a later percentage wins over earlier dollar and plain numbers"""
+        item = IntelligenceItem(
+            raw_content="Test",
+            processed_content="In 2024 spending hit $40 billion, up 3.5%",
+            category="test",
+            relevance_score=0.8,
+            so_what_statement="",
+        )
+        assert extractor.extract_value(item) == "3.5%"
+
     def test_determine_trend_up(self, extractor):
         """Test upward trend detection"""
         item = IntelligenceItem(
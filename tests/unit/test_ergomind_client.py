@@ -192,6 +192,11 @@ class TestErgoMindClientMethods:
         # Client should handle missing session gracefully or raise clear error
         assert client.session is None
 
+    def test_calculate_confidence_quality_markers_ignore_case(self, client):
+        """Test quality markers are matched case-insensitively"""
+        assert client._calculate_confidence("FORECAST", []) == pytest.approx(0.1)
+        assert client._calculate_confidence("nothing", []) == 0.0
+
 
 class TestErgoMindConfigValidation:
     """Test ErgoMind configuration validation"""
@@ -2,13 +2,38 @@
 Unit tests for FRED (Federal Reserve Economic Data) client
 """
 
+import asyncio
+import json
+import logging
+from dataclasses import replace
+from datetime import date
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import aiohttp
 import pytest
 
 from solairus_intelligence.clients.fred_client import (
+    SERIES_BY_CATEGORY,
     FREDClient,
     FREDConfig,
     FREDObservation,
+    _is_permanent_error,
+    _loads,
+    _observation_start,
+    _RateLimiter,
 )
+from solairus_intelligence.utils.cache import SeriesCache
+
+
+def _pinned_date(iso_date):
+    """date class whose today() returns iso_date, for patching the client's clock"""
+
+    class PinnedDate(date):
+        @classmethod
+        def today(cls):
+            return date.fromisoformat(iso_date)
+
+    return PinnedDate
 
 
 class TestFREDConfig:
@@ -348,3 +373,640 @@ class TestFREDObservationEdgeCases:
         )
 
         assert obs.value < 0.001
+
+
+class TestGetSeriesCategory:
+    """Test per-category series fan-out"""
+
+    @pytest.fixture
+    def client(self, monkeypatch):
+        monkeypatch.setenv("FRED_API_KEY", "test_key")
+        return FREDClient(config=FREDConfig())
+
+    @pytest.mark.asyncio
+    async def test_series_fetched_concurrently(self, client):
+        """All series in a category are in flight at the same time"""
+        in_flight = 0
+        peak = 0
+
+        async def fake_observations(series_id, days_back):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return {"date": "2024-10-01", "value": "4.5"}
+
+        with patch.object(client, "_get_latest_observation", side_effect=fake_observations):
+            observations = await client._get_series_category("interest_rates", 90)
+
+        assert peak == len(FREDClient.SERIES["interest_rates"])
+        assert [o.series_id for o in observations] == list(FREDClient.SERIES["interest_rates"])
+        assert all(o.category == "interest_rates" for o in observations)
+
+    @pytest.mark.asyncio
+    async def test_failed_series_is_skipped(self, client):
+        """One failing series does not drop the rest of the category"""
+
+        async def fake_observations(series_id, days_back):
+            if series_id == "DGS10":
+                raise aiohttp.ClientError("boom")
+            return {"date": "2024-10-01", "value": "4.5"}
+
+        with patch.object(client, "_get_latest_observation", side_effect=fake_observations):
+            observations = await client._get_series_category("interest_rates", 90)
+
+        assert [o.series_id for o in observations] == ["DFF", "MORTGAGE30US"]
+        assert observations[0].value == 4.5
+
+
+class TestFREDClientSession:
+    """Test FRED session and connection pool lifecycle"""
+
+    @pytest.fixture
+    def client(self, monkeypatch):
+        monkeypatch.setenv("FRED_API_KEY", "test_key")
+        return FREDClient(config=FREDConfig())
+
+    @pytest.mark.asyncio
+    async def test_initialize_reuses_open_session(self, client):
+        """Repeated initialize() calls keep the same session and pool"""
+        await client.initialize()
+        session, connector = client.session, client._connector
+        await client.initialize()
+
+        assert client.session is session
+        assert client._connector is connector
+        assert session.connector is connector
+        assert connector.limit_per_host == 32
+
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_session_requests_compressed_responses(self, client):
+        """The shared session asks FRED for gzip on every request"""
+        await client.initialize()
+
+        assert client.session.headers["Accept-Encoding"] == "gzip, deflate"
+
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_close_releases_session_and_connector(self, client):
+        """close() shuts down both the session and the connection pool"""
+        await client.initialize()
+        connector = client._connector
+        await client.close()
+
+        assert client.session is None
+        assert client._connector is None
+        assert connector.closed
+
+
+def _response(status, payload=None, headers=None):
+    """Build a fake aiohttp response usable as an async context manager"""
+    response = MagicMock()
+    response.status = status
+    response.headers = headers or {}
+    response.read = AsyncMock(return_value=json.dumps(payload or {}).encode())
+    response.text = AsyncMock(return_value="")
+    if status >= 400:
+        response.raise_for_status.side_effect = aiohttp.ClientResponseError(
+            MagicMock(), (), status=status
+        )
+    context = MagicMock()
+    context.__aenter__ = AsyncMock(return_value=response)
+    context.__aexit__ = AsyncMock(return_value=False)
+    return context
+
+
+class TestRetryAndRateLimit:
+    """Test transient-error retries and the shared request budget"""
+
+    @pytest.fixture
+    def client(self, monkeypatch):
+        monkeypatch.setenv("FRED_API_KEY", "test_key")
+        return FREDClient(config=FREDConfig())
+
+    @pytest.mark.asyncio
+    async def test_server_error_is_retried(self, client):
+        """5xx responses are retried rather than treated as empty series"""
+        payload = {"observations": [{"date": "2024-10-01", "value": "4.5"}]}
+        client.session = MagicMock()
+        client.session.get.side_effect = [_response(503), _response(200, payload)]
+
+        with patch("random.uniform", return_value=0):
+            observations = await client._fetch_series_observations("DFF", "2024-07-01")
+
+        assert observations == payload["observations"]
+        assert client.session.get.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_bad_request_is_not_retried(self, client):
+        """400 responses are permanent and return no observations"""
+        client.session = MagicMock()
+        client.session.get.return_value = _response(400)
+
+        assert await client._fetch_series_observations("BOGUS", "2024-07-01") == []
+        assert client.session.get.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_rate_limiter_waits_when_budget_exhausted(self):
+        """Requests beyond the bucket capacity wait for a refill"""
+        limiter = _RateLimiter(per_minute=2)
+        await limiter.acquire()
+        await limiter.acquire()
+
+        with patch("asyncio.sleep", new_callable=AsyncMock) as sleep:
+            sleep.side_effect = lambda delay: setattr(limiter, "_updated", limiter._updated - delay)
+            await limiter.acquire()
+
+        sleep.assert_awaited_once()
+        assert sleep.await_args.args[0] == pytest.approx(30, rel=0.01)
+
+
+class TestSeriesObservationCache:
+    """Test the local series cache in front of the FRED API"""
+
+    @pytest.fixture
+    def client(self, monkeypatch, tmp_path):
+        monkeypatch.setenv("FRED_API_KEY", "test_key")
+        return FREDClient(config=FREDConfig(), cache=SeriesCache(tmp_path / "fred.sqlite3"))
+
+    @pytest.mark.asyncio
+    async def test_repeat_request_served_from_cache(self, client):
+        """A second request for the same window does not hit the network"""
+        payload = {"observations": [{"date": "2024-10-01", "value": "4.5"}]}
+        client.session = MagicMock()
+        client.session.get.return_value = _response(200, payload)
+
+        first = await client._get_latest_observation("DFF", 90)
+        client._memo.clear()
+        second = await client._get_latest_observation("DFF", 90)
+
+        assert first == second == payload["observations"][0]
+        assert client.session.get.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_cache_survives_date_change(self, client):
+        """A run on a later day still hits entries within their TTL"""
+        payload = {"observations": [{"date": "2024-10-01", "value": "4.5"}]}
+        client.session = MagicMock()
+        client.session.get.return_value = _response(200, payload)
+
+        with patch("solairus_intelligence.clients.fred_client.date", _pinned_date("2024-10-07")):
+            first = await client._get_latest_observation("BSCICP02USM460S", 90)
+        client._memo.clear()
+        with patch("solairus_intelligence.clients.fred_client.date", _pinned_date("2024-10-08")):
+            second = await client._get_latest_observation("BSCICP02USM460S", 90)
+
+        assert first == second == payload["observations"][0]
+        assert client.session.get.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_empty_result_not_cached(self, client):
+        """Failed lookups are retried on the next request"""
+        client.session = MagicMock()
+        client.session.get.side_effect = lambda *args, **kwargs: _response(400)
+
+        await client._get_latest_observation("BOGUS", 90)
+        await client._get_latest_observation("BOGUS", 90)
+
+        assert client.session.get.call_count == 2
+
+    def test_slow_series_cached_longer(self):
+        """Weekly and monthly series outlive the default cache lifetime"""
+        for series_id in FREDClient.CACHE_TTL:
+            assert FREDClient.CACHE_TTL[series_id] > FREDClient.DEFAULT_CACHE_TTL
+
+
+class TestRequestCoalescing:
+    """Test single-flight and in-process memoization of series requests"""
+
+    @pytest.fixture
+    def client(self, monkeypatch):
+        monkeypatch.setenv("FRED_API_KEY", "test_key")
+        with patch.dict("os.environ", {"CACHE_ENABLED": "false"}):
+            return FREDClient(config=FREDConfig(), cache=SeriesCache())
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_share_one_fetch(self, client):
+        """Identical in-flight requests are served by a single API call"""
+        calls = 0
+
+        async def fake_fetch(series_id, observation_start, limit=None):
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return [{"date": "2024-10-01", "value": "4.5"}]
+
+        with patch.object(client, "_fetch_series_observations", side_effect=fake_fetch):
+            results = await asyncio.gather(
+                *(client._get_latest_observation("DFF", 90) for _ in range(5))
+            )
+
+        assert calls == 1
+        assert all(r == results[0] for r in results)
+        assert not client._inflight
+
+    @pytest.mark.asyncio
+    async def test_recent_result_is_memoized(self, client):
+        """A repeat request shortly after completion reuses the result"""
+        fetch = AsyncMock(return_value=[{"date": "2024-10-01", "value": "4.5"}])
+
+        with patch.object(client, "_fetch_series_observations", fetch):
+            await client._get_latest_observation("DFF", 90)
+            await client._get_latest_observation("DFF", 90)
+
+        assert fetch.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_memo_evicts_oldest(self, client):
+        """The memo keeps at most MEMO_MAXSIZE entries"""
+        client.MEMO_MAXSIZE = 2
+        fetch = AsyncMock(return_value=[{"date": "2024-10-01", "value": "4.5"}])
+
+        with patch.object(client, "_fetch_series_observations", fetch):
+            for series_id in ("DFF", "DGS10", "MORTGAGE30US"):
+                await client._get_latest_observation(series_id, 90)
+
+        assert [key[0] for key in client._memo] == ["DGS10", "MORTGAGE30US"]
+
+
+class TestSeriesTable:
+    """Test the flattened series table"""
+
+    def test_table_mirrors_series_definitions(self):
+        """Every configured series appears once, in order, under its category"""
+        assert list(SERIES_BY_CATEGORY) == list(FREDClient.SERIES)
+        for category, members in FREDClient.SERIES.items():
+            records = SERIES_BY_CATEGORY[category]
+            assert [(m.series_id, m.series_name) for m in records] == list(members.items())
+            assert all(m.category == category for m in records)
+
+    def test_series_tables_are_read_only(self):
+        """The shared series tables reject writes at every level"""
+        with pytest.raises(TypeError):
+            FREDClient.SERIES["fuel_costs"] = {}  # type: ignore[index]
+        with pytest.raises(TypeError):
+            FREDClient.SERIES["fuel_costs"]["NEW"] = "New series"  # type: ignore[index]
+        with pytest.raises(TypeError):
+            FREDClient.SERIES_UNITS["DFF"] = "Basis Points"  # type: ignore[index]
+
+    def test_records_are_immutable(self):
+        """Series records cannot be modified in place"""
+        meta = SERIES_BY_CATEGORY["fuel_costs"][0]
+
+        with pytest.raises(AttributeError):
+            meta.units = "Other"  # type: ignore[misc]
+
+
+class TestSeriesUnits:
+    """Test units attached to observations"""
+
+    def test_every_series_has_units(self):
+        """Each configured series has an entry in the units table"""
+        configured = {sid for series in FREDClient.SERIES.values() for sid in series}
+        assert configured <= set(FREDClient.SERIES_UNITS)
+
+    @pytest.mark.asyncio
+    async def test_observation_units_from_table(self, monkeypatch):
+        """Observations take units from SERIES_UNITS, not the API payload"""
+        monkeypatch.setenv("FRED_API_KEY", "test_key")
+        client = FREDClient(config=FREDConfig())
+        fetch = AsyncMock(return_value={"date": "2024-10-01", "value": "2.85"})
+
+        with patch.object(client, "_get_latest_observation", fetch):
+            observations = await client._get_series_category("fuel_costs", 90)
+
+        units = {o.series_id: o.units for o in observations}
+        assert units == {
+            "WJFUELUSGULF": "Dollars per Gallon",
+            "DCOILWTICO": "Dollars per Barrel",
+        }
+
+
+class TestParseJson:
+    """Test response body parsing"""
+
+    def test_parses_like_the_stdlib(self):
+        """The bound parser returns the same structure as json.loads for a bytes body"""
+        body = b'{"observations": [{"date": "2024-10-01", "value": "4.5"}]}'
+        expected = {"observations": [{"date": "2024-10-01", "value": "4.5"}]}
+
+        assert _loads(body) == json.loads(body) == expected
+
+
+class TestLatestObservation:
+    """Test fetching only the newest rows of a series"""
+
+    @pytest.fixture
+    def client(self, monkeypatch):
+        monkeypatch.setenv("FRED_API_KEY", "test_key")
+        with patch.dict("os.environ", {"CACHE_ENABLED": "false"}):
+            client = FREDClient(config=FREDConfig(), cache=SeriesCache())
+        client.session = MagicMock()
+        return client
+
+    @pytest.mark.asyncio
+    async def test_requests_newest_rows_only(self, client):
+        """Latest lookups ask FRED for a few rows in descending order"""
+        payload = {
+            "observations": [
+                {"date": "2024-10-02", "value": "."},
+                {"date": "2024-10-01", "value": "4.5"},
+            ]
+        }
+        client.session.get.return_value = _response(200, payload)
+
+        latest = await client._get_latest_observation("DFF", 90)
+
+        params = client.session.get.call_args.kwargs["params"]
+        assert params["api_key"] == "test_key"
+        assert params["file_type"] == "json"
+        assert params["sort_order"] == "desc"
+        assert params["limit"] == str(FREDClient.LATEST_LOOKUP_LIMIT)
+        assert latest == {"date": "2024-10-01", "value": "4.5"}
+
+    @pytest.mark.asyncio
+    async def test_history_remains_ascending_and_unlimited(self, client):
+        """The history helper still fetches the whole window, oldest first"""
+        client.session.get.return_value = _response(200, {"observations": []})
+
+        await client._get_series_observations("DFF", 90)
+
+        params = client.session.get.call_args.kwargs["params"]
+        assert params["sort_order"] == "asc"
+        assert "limit" not in params
+
+
+class TestDataclassLayout:
+    """Test the slotted dataclass layout"""
+
+    def test_observation_is_slotted_and_frozen(self):
+        """Observations carry no per-instance dict and cannot be mutated"""
+        obs = FREDObservation(
+            series_id="DFF",
+            series_name="Federal Funds Effective Rate",
+            value=4.5,
+            date="2024-10-01",
+            units="Percent",
+            category="interest_rates",
+        )
+
+        assert not hasattr(obs, "__dict__")
+        with pytest.raises(AttributeError):
+            obs.category = "inflation"  # type: ignore[misc]
+        assert replace(obs, category="inflation").category == "inflation"
+
+    def test_config_is_slotted(self):
+        """Config instances carry no per-instance dict"""
+        assert not hasattr(FREDConfig(api_key="test"), "__dict__")
+
+
+class TestObservationStart:
+    """Test observation window start computation"""
+
+    def test_window_start(self):
+        """The start date is days_back before the day bucket"""
+        assert _observation_start(90, "2024-10-01") == "2024-07-03"
+
+    def test_new_day_computes_new_start(self):
+        """A new day bucket yields a new start rather than a stale cached one"""
+        assert _observation_start(1, "2024-10-01") == "2024-09-30"
+        assert _observation_start(1, "2024-10-02") == "2024-10-01"
+
+
+class TestGetIndicators:
+    """Test the flat multi-category fan-out"""
+
+    @pytest.fixture
+    def client(self, monkeypatch):
+        monkeypatch.setenv("FRED_API_KEY", "test_key")
+        return FREDClient(config=FREDConfig())
+
+    @pytest.mark.asyncio
+    async def test_all_series_in_one_fan_out(self, client):
+        """Series from every category are in flight together, with per-category windows"""
+        in_flight = 0
+        peak = 0
+        windows = {}
+
+        async def fake_latest(series_id, days_back):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            windows[series_id] = days_back
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return {"date": "2024-10-01", "value": "1.0"}
+
+        with patch.object(client, "_get_latest_observation", side_effect=fake_latest):
+            results = await client.get_indicators({"fuel_costs": 90, "interest_rates": 30})
+
+        assert peak == 5
+        assert windows["DCOILWTICO"] == 90
+        assert windows["DGS10"] == 30
+        assert [o.series_id for o in results["fuel_costs"]] == ["WJFUELUSGULF", "DCOILWTICO"]
+        assert len(results["interest_rates"]) == 3
+
+    @pytest.mark.asyncio
+    async def test_unknown_category_is_empty(self, client):
+        """Categories without configured series map to an empty list"""
+        with patch.object(client, "_get_latest_observation", AsyncMock()) as latest:
+            results = await client.get_indicators({"inflation": 90})
+
+        assert results == {"inflation": []}
+        latest.assert_not_awaited()
+
+
+class TestConnectionProbe:
+    """Test the lightweight connectivity probe"""
+
+    @pytest.fixture
+    def client(self, monkeypatch):
+        monkeypatch.setenv("FRED_API_KEY", "test_key")
+        client = FREDClient(config=FREDConfig())
+        client.session = MagicMock()
+        return client
+
+    @pytest.mark.asyncio
+    async def test_probes_root_category(self, client):
+        """The probe hits /category rather than downloading a series"""
+        client.session.get.return_value = _response(200)
+
+        assert await client.test_connection() is True
+
+        url = client.session.get.call_args.args[0]
+        params = client.session.get.call_args.kwargs["params"]
+        assert url.endswith("/category")
+        assert params["category_id"] == "0"
+
+    @pytest.mark.asyncio
+    async def test_invalid_api_key_is_not_retried(self, client):
+        """A rejected key fails immediately instead of burning retries"""
+        response = _response(400)
+        response.__aenter__.return_value.text = AsyncMock(
+            return_value='{"error_message": "The value for variable api_key is not registered."}'
+        )
+        client.session.get.return_value = response
+
+        assert await client.test_connection() is False
+        assert client.session.get.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_server_error_is_retried(self, client):
+        """Transient failures are retried before giving up"""
+        client.session.get.side_effect = [_response(503), _response(200)]
+
+        with patch("random.uniform", return_value=0):
+            assert await client.test_connection() is True
+
+        assert client.session.get.call_count == 2
+
+    def test_permanent_error_classification(self):
+        """Only 4xx responses other than 429 are treated as permanent"""
+
+        def error(status):
+            return aiohttp.ClientResponseError(MagicMock(), (), status=status)
+
+        assert _is_permanent_error(error(400))
+        assert _is_permanent_error(error(404))
+        assert not _is_permanent_error(error(429))
+        assert not _is_permanent_error(error(503))
+        assert not _is_permanent_error(aiohttp.ClientConnectionError())
+
+
+class TestTableDrivenGet:
+    """Test the single category entry point and its legacy names"""
+
+    @pytest.fixture
+    def client(self, monkeypatch):
+        monkeypatch.setenv("FRED_API_KEY", "test_key")
+        return FREDClient(config=FREDConfig())
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "method,category,days_back",
+        [
+            ("get_aviation_fuel_costs", "fuel_costs", 90),
+            ("get_interest_rate_data", "interest_rates", 90),
+            ("get_gdp_growth_data", "gdp_growth", 180),
+            ("get_business_confidence_data", "business_confidence", 365),
+        ],
+    )
+    async def test_legacy_names_use_category_defaults(self, client, method, category, days_back):
+        """The per-category helpers dispatch through get() with table defaults"""
+        with patch.object(client, "_get_series_category", AsyncMock(return_value=[])) as fetch:
+            await getattr(client, method)()
+
+        fetch.assert_awaited_once_with(category, days_back)
+
+    @pytest.mark.asyncio
+    async def test_explicit_days_back_overrides_default(self, client):
+        """An explicit window wins over the table default"""
+        with patch.object(client, "_get_series_category", AsyncMock(return_value=[])) as fetch:
+            await client.get_business_confidence_data(days_back=30)
+
+        fetch.assert_awaited_once_with("business_confidence", 30)
+
+
+class TestFailureLogging:
+    """Test aggregated failure reporting"""
+
+    @pytest.mark.asyncio
+    async def test_failures_logged_once(self, monkeypatch, caplog):
+        """All failed series are reported in a single warning"""
+        monkeypatch.setenv("FRED_API_KEY", "test_key")
+        client = FREDClient(config=FREDConfig())
+
+        async def fake_latest(series_id, days_back):
+            if series_id == "DFF":
+                return {"date": "2024-10-01", "value": "4.5"}
+            if series_id == "DGS10":
+                return {"date": "2024-10-01", "value": "n/a"}
+            raise aiohttp.ClientError("down")
+
+        with patch.object(client, "_get_latest_observation", side_effect=fake_latest):
+            with caplog.at_level(logging.WARNING, logger="solairus_intelligence.clients"):
+                results = await client.get_indicators({"interest_rates": 90, "fuel_costs": 90})
+
+        assert [o.series_id for o in results["interest_rates"]] == ["DFF"]
+        assert results["fuel_costs"] == []
+        failure_records = [r for r in caplog.records if "partial failure" in r.getMessage()]
+        assert len(failure_records) == 1
+        message = failure_records[0].getMessage()
+        for series_id in ("DGS10", "MORTGAGE30US", "WJFUELUSGULF", "DCOILWTICO"):
+            assert series_id in message
+
+
+class TestConditionalRequests:
+    """Test If-Modified-Since revalidation of stale cache entries"""
+
+    LAST_MODIFIED = "Tue, 01 Oct 2024 12:00:00 GMT"
+    PAYLOAD = {"observations": [{"date": "2024-10-01", "value": "4.5"}]}
+
+    @pytest.fixture
+    def client(self, monkeypatch, tmp_path):
+        monkeypatch.setenv("FRED_API_KEY", "test_key")
+        client = FREDClient(config=FREDConfig(), cache=SeriesCache(tmp_path / "fred.sqlite3"))
+        client.session = MagicMock()
+        return client
+
+    async def _prime_stale_entry(self, client):
+        client.session.get.return_value = _response(
+            200, self.PAYLOAD, {"Last-Modified": self.LAST_MODIFIED}
+        )
+        await client._load_latest_observation("DFF", 90)
+        client.DEFAULT_CACHE_TTL = -1  # Everything cached is now stale
+
+    @pytest.mark.asyncio
+    async def test_stale_entry_sends_if_modified_since(self, client):
+        """Revalidation sends the stored Last-Modified value"""
+        await self._prime_stale_entry(client)
+        client.session.get.return_value = _response(304)
+
+        latest = await client._load_latest_observation("DFF", 90)
+
+        headers = client.session.get.call_args.kwargs["headers"]
+        assert headers == {"If-Modified-Since": self.LAST_MODIFIED}
+        assert latest == self.PAYLOAD["observations"][0]
+
+    @pytest.mark.asyncio
+    async def test_not_modified_refreshes_entry(self, client):
+        """A 304 resets the entry's age without replacing its payload"""
+        await self._prime_stale_entry(client)
+        before = client.cache.get_entry("DFF", 90)
+        client.session.get.return_value = _response(304)
+
+        with patch("solairus_intelligence.utils.cache.time.time", return_value=before[0] + 60):
+            await client._load_latest_observation("DFF", 90)
+
+        after = client.cache.get_entry("DFF", 90)
+        assert after.fetched_at == before.fetched_at + 60
+        assert after.observations == before.observations
+        assert after.last_modified == self.LAST_MODIFIED
+
+    @pytest.mark.asyncio
+    async def test_revalidates_across_date_change(self, client):
+        """A stale entry written on an earlier day is revalidated, not refetched"""
+        with patch("solairus_intelligence.clients.fred_client.date", _pinned_date("2024-10-07")):
+            await self._prime_stale_entry(client)
+        client.session.get.return_value = _response(304)
+
+        with patch("solairus_intelligence.clients.fred_client.date", _pinned_date("2024-10-08")):
+            latest = await client._load_latest_observation("DFF", 90)
+
+        headers = client.session.get.call_args.kwargs["headers"]
+        assert headers == {"If-Modified-Since": self.LAST_MODIFIED}
+        assert client.session.get.call_args.kwargs["params"]["observation_start"] == "2024-07-10"
+        assert latest == self.PAYLOAD["observations"][0]
+
+    @pytest.mark.asyncio
+    async def test_first_request_is_unconditional(self, client):
+        """Without a cached validator the request carries no conditional header"""
+        client.session.get.return_value = _response(200, self.PAYLOAD)
+
+        await client._load_latest_observation("DFF", 90)
+
+        assert client.session.get.call_args.kwargs["headers"] is None
@@ -6,6 +6,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from solairus_intelligence.clients.fred_client import FREDClient
 from solairus_intelligence.core.orchestrator import (
     QueryOrchestrator,
     QueryTemplate,
@@ -196,6 +197,34 @@ class TestMultiSourceGathering:
                     assert results["source_status"]["fred"] == "success"
 
 
+class TestFREDDataGathering:
+    """Test FRED gathering through the client's single fan-out"""
+
+    @pytest.fixture
+    def orchestrator(self):
+        return QueryOrchestrator()
+
+    @pytest.mark.asyncio
+    async def test_gathers_all_categories_in_one_call(self, orchestrator, monkeypatch):
+        """Every category is requested together with its own lookback window"""
+        monkeypatch.setenv("FRED_API_KEY", "test_key")
+        client = MagicMock()
+        client.__aenter__ = AsyncMock(return_value=client)
+        client.__aexit__ = AsyncMock(return_value=False)
+        client.test_connection = AsyncMock(return_value=True)
+        client.get_indicators = AsyncMock(return_value={"fuel_costs": ["obs"]})
+        client.DEFAULT_DAYS_BACK = FREDClient.DEFAULT_DAYS_BACK
+
+        with patch("solairus_intelligence.clients.fred_client.FREDClient", return_value=client):
+            results = await orchestrator.execute_fred_data_gathering(days_back=30)
+
+        assert results == {"fuel_costs": ["obs"]}
+        requested = client.get_indicators.await_args.args[0]
+        assert requested["fuel_costs"] == 30
+        assert requested["gdp_growth"] == 180
+        assert requested["business_confidence"] == 365
+
+
 class TestProcessAndFilterResults:
     """Test result processing and filtering"""
 
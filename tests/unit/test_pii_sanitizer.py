@@ -124,3 +124,34 @@ class TestPIISanitizerReplacement:
 
         # Should not crash
         assert sanitized is not None
+
+    def test_replaces_names_case_insensitively_in_one_pass(self):
+        """Test every client occurrence is replaced regardless of case"""
+        sanitizer = PIISanitizer()
+
+        sanitized = sanitizer.sanitize_text("CISCO met Palantir; cisco and vista equity followed.")
+
+        assert sanitized == (
+            "[TECHNOLOGY_CLIENT] met [TECHNOLOGY_CLIENT]; "
+            "[TECHNOLOGY_CLIENT] and [FINANCE_CLIENT] followed."
+        )
+
+    def test_longest_company_name_wins(self):
+        """Test a name extending another client name is replaced as a whole"""
+        sanitizer = PIISanitizer()
+
+        sanitized = sanitizer.sanitize_text("ArcLight Capital Partners closed a fund.")
+
+        assert sanitized == "[ENERGY_CLIENT] closed a fund."
+
+    def test_partial_words_are_not_replaced(self):
+        """Test word boundaries prevent matches inside other words"""
+        sanitizer = PIISanitizer()
+
+        assert sanitizer.sanitize_text("Ciscoville hosted talks.") == "Ciscoville hosted talks."
+
+    def test_empty_mapping_leaves_text_unchanged(self):
+        """Test a sanitizer without client names is a no-op"""
+        sanitizer = PIISanitizer(client_mapping={ClientSector.GENERAL: {"companies": []}})
+
+        assert sanitizer.sanitize_text("Cisco announced results.") == "Cisco announced results."
@@ -49,6 +49,19 @@ class TestIntelligenceItem:
         assert item.source_type == "gta"
         assert item.confidence == 0.9
 
+    def test_combined_lower_is_cached(self):
+        """Test combined lowercase content is built once per item"""
+        item = IntelligenceItem(
+            raw_content="Raw",
+            processed_content="Fuel Prices ROSE",
+            category="economic",
+            relevance_score=0.7,
+            so_what_statement="Budget Impact",
+        )
+
+        assert item.combined_lower == "fuel prices rose budget impact"
+        assert item.combined_lower is item.combined_lower
+
 
 class TestSectorIntelligence:
     """Test SectorIntelligence dataclass"""
@@ -179,6 +192,42 @@ class TestErgoMindProcessor:
         assert hasattr(processor, "RELEVANCE_KEYWORDS")
         assert len(processor.RELEVANCE_KEYWORDS) > 0
 
+    def test_identify_affected_sectors_weights_triggers(self, processor):
+        """Test a single trigger is enough while a single keyword is not"""
+        # "OPEC" is an energy trigger, matched case-insensitively
+        assert ClientSector.ENERGY in processor._identify_affected_sectors("OPEC output cut")
+        # "solar" is a lone energy keyword, worth only 1
+        assert ClientSector.ENERGY not in processor._identify_affected_sectors("solar panels")
+        # Two keywords reach the threshold
+        assert ClientSector.ENERGY in processor._identify_affected_sectors("solar and wind")
+
+    def test_clean_and_structure_drops_hedging_sentences(self, processor):
+        """Test sentences with hedging language are removed"""
+        text = "Rates rose sharply. We have NOT identified a cause. Markets fell"
+
+        cleaned = processor._clean_and_structure(text)
+
+        assert "identified" not in cleaned
+        assert "Rates rose sharply" in cleaned
+        assert "Markets fell" in cleaned
+
+    def test_calculate_base_relevance_caps_each_category(self, processor):
+        """Test each keyword category contributes at most its cap"""
+        # Five direct aviation keywords would be 0.75 uncapped; the cap is 0.4
+        text = "aviation aircraft flight pilot airline"
+
+        assert processor.calculate_base_relevance(text) == pytest.approx(0.4)
+        assert processor.calculate_base_relevance("nothing relevant here") == 0.0
+
+    def test_calculate_base_relevance_keeps_keyword_case(self, processor):
+        """Test keywords are compared as written against the lowercased text"""
+        assert processor.calculate_base_relevance("New FAA rules") == 0.0
+
+    def test_calculate_confidence_rewards_numbers(self, processor):
+        """Test content containing a number gets the figures bonus"""
+        assert processor._calculate_confidence("Rates held") == pytest.approx(0.7)
+        assert processor._calculate_confidence("Rates held at 5") == pytest.approx(0.8)
+
 
 class TestGTAProcessor:
     """Test GTA intervention processing"""
@@ -228,6 +277,22 @@ class TestGTAProcessor:
         assert item is not None
         assert item.relevance_score > 0
 
+    def test_map_to_sectors_matches_multiword_phrases(self, processor):
+        """Test sectors named by longer phrases still map after term pruning"""
+        from types import SimpleNamespace
+
+        intervention = SimpleNamespace(affected_sectors=["Crude oil", "Natural gas"])
+
+        assert processor._map_to_sectors(intervention) == [ClientSector.ENERGY]
+
+    def test_sector_match_terms_drop_redundant_phrases(self, processor):
+        """Test phrases containing a shorter keyword are not scanned separately"""
+        energy_terms = processor._SECTOR_MATCH_TERMS[ClientSector.ENERGY]
+
+        assert "oil" in energy_terms
+        assert "crude oil" not in energy_terms
+        assert "renewable energy" not in energy_terms
+
 
 class TestFREDProcessor:
     """Test FRED observation processing"""
@@ -285,6 +350,16 @@ class TestIntelligenceMerger:
         merged = merger.merge_sources([], [], [])
         assert merged == []
 
+    def test_calculate_similarity_ignores_case_and_stop_words(self, merger):
+        """Test similarity compares significant words case-insensitively"""
+        similarity = merger._calculate_similarity(
+            "Tariffs raise FUEL costs with this", "tariffs raise fuel costs"
+        )
+
+        # "with" and "this" are stop words and must not dilute the score
+        assert similarity == 1.0
+        assert merger._calculate_similarity("short", "") == 0.0
+
     def test_merge_single_item(self, merger):
         """Test merging single item"""
         items = [
@@ -436,6 +511,31 @@ class TestIntelligenceMerger:
         assert isinstance(sector_intel, dict)
         assert len(sector_intel) > 0
 
+    def test_organize_by_sector_general_items_join_every_sector(self, merger):
+        """Test GENERAL items appear in every sector alongside tagged items"""
+        general = IntelligenceItem(
+            raw_content="Global news",
+            processed_content="Global update",
+            category="general",
+            relevance_score=0.5,
+            so_what_statement="Global impact",
+            affected_sectors=[ClientSector.GENERAL],
+        )
+        tech = IntelligenceItem(
+            raw_content="Tech news",
+            processed_content="Technology update",
+            category="technology",
+            relevance_score=0.9,
+            so_what_statement="Tech impact",
+            affected_sectors=[ClientSector.TECHNOLOGY, ClientSector.TECHNOLOGY],
+        )
+
+        sector_intel = merger.organize_by_sector([general, tech])
+
+        assert list(sector_intel) == list(ClientSector)
+        assert sector_intel[ClientSector.TECHNOLOGY].items == [tech, general]
+        assert sector_intel[ClientSector.FINANCE].items == [general]
+
 
 class TestClientSectorEnum:
     """Test ClientSector enum"""